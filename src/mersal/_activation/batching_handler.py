@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar
+
+import anyio
+
+from mersal.exceptions import MersalExceptionError
+
+if TYPE_CHECKING:
+    from mersal.core.app import Mersal
+    from mersal.pipeline import MessageContext
+    from mersal.transport import TransactionContext
+
+MessageT = TypeVar("MessageT")
+
+#: A factory function that creates handlers receiving a list of messages
+BatchHandlerFactory: TypeAlias = Callable[
+    ["MessageContext", "Mersal"],
+    Callable[[list[MessageT]], Awaitable[Any]],
+]
+
+__all__ = (
+    "BatchHandlerFactory",
+    "BatchingHandler",
+)
+
+
+class _Batch(Generic[MessageT]):
+    def __init__(self) -> None:
+        self.messages: list[MessageT] = []
+        self.message_ids: list[str] = []
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+        self.error: BaseException | None = None
+
+
+class BatchingHandler(Generic[MessageT]):
+    """Collects concurrently handled messages and passes them to a handler as one list.
+
+    The first message to arrive starts a batch and waits until either
+    ``max_batch_size`` messages have joined or ``max_wait`` seconds have
+    passed, then invokes the handler once, within its own message context,
+    with all collected messages. Every message of the batch shares the
+    outcome: if the handler raises, each message fails with (a copy of) the
+    exception and goes through the retry step as usual. As the batch is
+    handled within the first message's transaction, the other messages only
+    complete once that transaction has committed and been acked, and fail if
+    it rolls back or is nacked. Messages of a failed
+    batch are handled individually (as a list of one) when redelivered, so a
+    single poison message can not keep failing its neighbours.
+
+    Batches can only grow as large as the number of messages the worker
+    handles concurrently, so ``max_parallelism`` (or the concurrency limit)
+    should be at least ``max_batch_size``.
+    """
+
+    def __init__(
+        self,
+        factory: BatchHandlerFactory[MessageT],
+        max_batch_size: int,
+        max_wait: float,
+        max_tracked_failures: int = 10_000,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.factory = factory
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._max_tracked_failures = max_tracked_failures
+        self._current: _Batch[MessageT] | None = None
+        self._retry_individually: OrderedDict[str, None] = OrderedDict()
+
+    def create_handler(self, message_context: MessageContext, app: Mersal) -> Callable[[MessageT], Awaitable[None]]:
+        async def handler(message: MessageT) -> None:
+            await self.handle(message, message_context, app)
+
+        return handler
+
+    async def handle(self, message: MessageT, message_context: MessageContext, app: Mersal) -> None:
+        message_id = str(message_context.headers.message_id)
+        if message_id in self._retry_individually:
+            del self._retry_individually[message_id]
+            await self._invoke([message], [message_id], message_context, app)
+            return
+
+        batch = self._current
+        is_leader = batch is None
+        if batch is None:
+            batch = self._current = _Batch()
+        batch.messages.append(message)
+        batch.message_ids.append(message_id)
+        if len(batch.messages) >= self.max_batch_size:
+            self._current = None
+            batch.full.set()
+
+        if not is_leader:
+            await batch.done.wait()
+            if batch.error is not None:
+                raise _copy_error(batch.error)
+            return
+
+        try:
+            with anyio.move_on_after(self.max_wait):
+                await batch.full.wait()
+            if self._current is batch:
+                self._current = None
+            await self._invoke(batch.messages, batch.message_ids, message_context, app)
+        except BaseException as e:
+            batch.error = e
+            batch.done.set()
+            raise
+        self._settle_with(batch, message_context.transaction_context)
+
+    def _settle_with(self, batch: _Batch[MessageT], transaction_context: TransactionContext) -> None:
+        async def succeed(_: TransactionContext) -> None:
+            batch.done.set()
+
+        async def fail(_: TransactionContext) -> None:
+            if not batch.done.is_set():
+                batch.error = MersalExceptionError("The batch was not committed")
+                batch.done.set()
+
+        transaction_context.on_rollback(fail)
+        transaction_context.on_nack(fail)
+        transaction_context.on_ack(succeed)
+        transaction_context.on_close(fail)
+
+    async def _invoke(
+        self,
+        messages: list[MessageT],
+        message_ids: list[str],
+        message_context: MessageContext,
+        app: Mersal,
+    ) -> None:
+        try:
+            await self.factory(message_context, app)(list(messages))
+        except Exception:
+            if len(messages) > 1:
+                for message_id in message_ids:
+                    self._retry_individually[message_id] = None
+                while len(self._retry_individually) > self._max_tracked_failures:
+                    self._retry_individually.popitem(last=False)
+            raise
+
+
+def _copy_error(error: BaseException) -> Exception:
+    """Give every message of a failed batch its own exception of the original type."""
+    copied: Exception | None = None
+    if isinstance(error, Exception):
+        try:
+            copied = copy.copy(error)
+        except Exception:  # noqa: BLE001
+            copied = None
+    if copied is None:
+        copied = MersalExceptionError("Batch handling did not complete")
+    copied.__cause__ = error
+    return copied
@@ -3,12 +3,16 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import TYPE_CHECKING, TypeVar, cast
 
+from mersal._activation.batching_handler import BatchingHandler
+from mersal._activation.handler_lifetime import HandlerLifetime, apply_handler_lifetime
 from mersal.exceptions import MersalExceptionError
+from mersal.messages import MessageTypeRegistry
 from mersal.pipeline import MessageContext
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from mersal._activation.batching_handler import BatchHandlerFactory
     from mersal._activation.handler_activator import HandlerFactory
     from mersal.core.app import Mersal
     from mersal.handlers import MessageHandler
@@ -26,11 +30,15 @@ class BuiltinHandlerActivator:
     This class manages the registration and activation of message handlers
     based on message types. It stores handler factories indexed by message type
     and instantiates the appropriate handlers when a message needs to be processed.
+
+    The factories applying to a concrete message type (its own and those of
+    its base classes) are resolved once and cached until the next registration.
     """
 
     def __init__(self) -> None:
         """Initialize a new instance of the BuiltinHandlerActivator."""
         self._handler_factories: dict[type, list[HandlerFactory]] = defaultdict(list)
+        self._resolved_factories: dict[type, list[HandlerFactory]] = {}
         self._app: Mersal | None = None
 
     async def get_handlers(
@@ -47,6 +55,25 @@ class BuiltinHandlerActivator:
         Returns:
             A sequence of message handlers that can process the message
 
+        Raises:
+            Exception: If called outside of a message context
+        """
+        return await self.get_handlers_for_type(type(message), transaction_context)
+
+    async def get_handlers_for_type(
+        self,
+        message_type: type[MessageT],
+        transaction_context: TransactionContext,
+    ) -> Sequence[MessageHandler[MessageT]]:
+        """Get handlers for messages of the specified type.
+
+        Args:
+            message_type: The type of the message to get handlers for
+            transaction_context: The current transaction context
+
+        Returns:
+            A sequence of message handlers that can process messages of the type
+
         Raises:
             Exception: If called outside of a message context
         """
@@ -56,30 +83,81 @@ class BuiltinHandlerActivator:
                 "BuiltinHandlerActivator get_handlers called outside of a transaction.",
             )
 
-        handlers: list[MessageHandler[MessageT]] = []
-        for cls in type(message).__mro__:
+        factories = self._resolved_factories.get(message_type)
+        if factories is None:
+            factories = self._resolved_factories[message_type] = self._resolve_factories(message_type)
+
+        app = self.app
+        return [factory(message_context, app) for factory in factories]
+
+    def _resolve_factories(self, message_type: type) -> list[HandlerFactory]:
+        factories: list[HandlerFactory] = []
+        for cls in message_type.__mro__:
             if cls is object:
                 continue
-            handlers.extend(x(message_context, self.app) for x in self._handler_factories.get(cls, []))
-        return handlers
+            factories.extend(self._handler_factories.get(cls, ()))
+        return factories
 
     def register(
         self,
         message_type: type[MessageT],
         factory: HandlerFactory[MessageT],
+        *,
+        process_pool: bool = False,
+        lifetime: HandlerLifetime = HandlerLifetime.PER_MESSAGE,
     ) -> BuiltinHandlerActivator:
         """Register a handler factory for a specific message type.
 
         Args:
             message_type: The type of message to register a handler for
             factory: A factory function that creates a message handler
+            process_pool: Run the created handlers in the app's process pool
+                (see :class:`mersal.process_pool.ProcessPoolConfig`). The
+                handler and the message must be picklable.
+            lifetime: How long the created handlers live, see
+                :class:`HandlerLifetime`. Defaults to a handler per message.
 
         Returns:
             The handler activator instance for method chaining
         """
-        self._handler_factories[message_type].append(factory)
+        if process_pool:
+            from mersal.process_pool.process_pool_handler import process_pool_handler_factory
+
+            factory = process_pool_handler_factory(factory)
+        self._handler_factories[message_type].append(apply_handler_lifetime(factory, lifetime))
+        self._resolved_factories.clear()
+        MessageTypeRegistry.register(message_type)
         return self
 
+    def register_batch(
+        self,
+        message_type: type[MessageT],
+        factory: BatchHandlerFactory[MessageT],
+        *,
+        max_batch_size: int,
+        max_wait: float,
+    ) -> BuiltinHandlerActivator:
+        """Register a factory for handlers that receive messages in batches.
+
+        Messages of the given type that are handled concurrently are collected
+        into lists of up to ``max_batch_size`` messages, waiting at most
+        ``max_wait`` seconds for a batch to fill, and the created handler is
+        invoked once per list. See :class:`BatchingHandler` for how failures
+        are handled.
+
+        Args:
+            message_type: The type of message to register a handler for
+            factory: A factory function that creates a handler accepting a
+                list of messages
+            max_batch_size: The maximum number of messages per batch
+            max_wait: The maximum number of seconds to wait for a batch to fill
+
+        Returns:
+            The handler activator instance for method chaining
+        """
+        batching_handler = BatchingHandler(factory, max_batch_size=max_batch_size, max_wait=max_wait)
+        return self.register(message_type, batching_handler.create_handler)
+
     @property
     def registered_message_types(self) -> set[type]:
         """Get the set of message types that have registered handlers.
@@ -28,6 +28,12 @@ class HandlerActivator(Protocol):
     The HandlerActivator is responsible for registering message handlers
     and returning the appropriate handlers for a given message type during
     message processing.
+
+    An activator may also provide ``get_handlers_for_type(message_type,
+    transaction_context)``, returning the handlers for messages of a type
+    (see :meth:`BuiltinHandlerActivator.get_handlers_for_type`). When it
+    does, messages are routed by the type named in their ``message_type``
+    header and their bodies are only deserialized once a handler is invoked.
     """
 
     async def get_handlers(
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import enum
+import typing
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from mersal.exceptions import MersalExceptionError
+
+if TYPE_CHECKING:
+    from mersal._activation.handler_activator import HandlerFactory
+    from mersal.core.app import Mersal
+    from mersal.handlers import MessageHandler
+    from mersal.pipeline import MessageContext
+    from mersal.transport import TransactionContext
+
+MessageT = TypeVar("MessageT")
+
+__all__ = ("HandlerLifetime",)
+
+
+class HandlerLifetime(enum.Enum):
+    """How long a handler created by a handler factory lives.
+
+    Handlers that outlive their message keep whatever the factory captured
+    when creating them, notably the message context of the message that
+    caused their creation. Sagas carry the data of the message they handle
+    and so must be created per message; registering a saga with another
+    lifetime is rejected.
+    """
+
+    PER_MESSAGE = "PER_MESSAGE"
+    """A new handler is created for every message (the default)."""
+    SINGLETON = "SINGLETON"
+    """One handler is created for the first message and shared by all messages.
+
+    The handler is used concurrently and must not keep per-message state.
+    The message context passed to the factory is that of the first message
+    and must not be used to handle later ones.
+    """
+    POOLED = "POOLED"
+    """Handlers are reused across messages but never used concurrently.
+
+    A handler is taken from the pool for a message and returned to it once
+    the message's transaction is closed; the pool grows to the number of
+    messages handled concurrently. The message context passed to the factory
+    is that of the message that caused the handler's creation and must not
+    be used to handle later ones.
+    """
+
+
+class _SingletonHandlerFactory(Generic[MessageT]):
+    def __init__(self, factory: HandlerFactory[MessageT]) -> None:
+        self._factory = factory
+        self._handler: MessageHandler[MessageT] | None = None
+
+    def __call__(self, message_context: MessageContext, app: Mersal) -> MessageHandler[MessageT]:
+        if self._handler is None:
+            self._handler = _create_shared_handler(self._factory, message_context, app, HandlerLifetime.SINGLETON)
+        return self._handler
+
+
+class _PooledHandlerFactory(Generic[MessageT]):
+    def __init__(self, factory: HandlerFactory[MessageT]) -> None:
+        self._factory = factory
+        self._idle: list[MessageHandler[MessageT]] = []
+
+    def __call__(self, message_context: MessageContext, app: Mersal) -> MessageHandler[MessageT]:
+        handler = (
+            self._idle.pop()
+            if self._idle
+            else _create_shared_handler(self._factory, message_context, app, HandlerLifetime.POOLED)
+        )
+
+        async def release(_: TransactionContext) -> None:
+            self._idle.append(handler)
+
+        message_context.transaction_context.on_close(release)
+        return handler
+
+
+def apply_handler_lifetime(factory: HandlerFactory[MessageT], lifetime: HandlerLifetime) -> HandlerFactory[MessageT]:
+    if lifetime is not HandlerLifetime.PER_MESSAGE and _creates_saga(factory):
+        raise _saga_lifetime_error(lifetime)
+    if lifetime is HandlerLifetime.SINGLETON:
+        return _SingletonHandlerFactory(factory)
+    if lifetime is HandlerLifetime.POOLED:
+        return _PooledHandlerFactory(factory)
+    return factory
+
+
+def _create_shared_handler(
+    factory: HandlerFactory[MessageT], message_context: MessageContext, app: Mersal, lifetime: HandlerLifetime
+) -> MessageHandler[MessageT]:
+    from mersal.sagas.saga import Saga
+
+    handler = factory(message_context, app)
+    # Catches the saga factories whose return type could not be checked at registration.
+    if isinstance(handler, Saga):
+        raise _saga_lifetime_error(lifetime)
+    return handler
+
+
+def _creates_saga(factory: HandlerFactory) -> bool:
+    from mersal.sagas import SagaBase
+
+    created: object = factory
+    if not isinstance(factory, type):
+        try:
+            created = typing.get_type_hints(factory).get("return")
+        except (NameError, TypeError):
+            return False
+    return isinstance(created, type) and issubclass(created, SagaBase)
+
+
+def _saga_lifetime_error(lifetime: HandlerLifetime) -> MersalExceptionError:
+    return MersalExceptionError(f"Sagas must be registered with the PER_MESSAGE lifetime, not {lifetime.value}.")
@@ -5,11 +5,16 @@ based on message types. The handler activator pattern is core to how Mersal
 dispatches messages to the appropriate handlers.
 """
 
+from mersal._activation.batching_handler import BatchHandlerFactory, BatchingHandler
 from mersal._activation.builtin_handler_activator import BuiltinHandlerActivator
 from mersal._activation.handler_activator import HandlerActivator, HandlerFactory
+from mersal._activation.handler_lifetime import HandlerLifetime
 
 __all__ = (
+    "BatchHandlerFactory",
+    "BatchingHandler",
     "BuiltinHandlerActivator",
     "HandlerActivator",
     "HandlerFactory",
+    "HandlerLifetime",
 )
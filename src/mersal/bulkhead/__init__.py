@@ -0,0 +1,11 @@
+from .bulkhead import Bulkhead
+from .bulkhead_step import BulkheadStep
+from .config import BulkheadConfig
+from .plugin import BulkheadPlugin
+
+__all__ = [
+    "Bulkhead",
+    "BulkheadConfig",
+    "BulkheadPlugin",
+    "BulkheadStep",
+]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+__all__ = ("Bulkhead",)
+
+
+class Bulkhead:
+    """Tracks in-flight messages per compartment and decides whether more may enter.
+
+    Each compartment (a message or handler type) may have a hard limit. With
+    weights and a total capacity configured, compartments additionally get a
+    weighted fair share of the capacity: a compartment at or over its share
+    is turned away only while another compartment has recently been turned
+    away, so spare capacity is never left unused.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[type, int] | None = None,
+        weights: Mapping[type, float] | None = None,
+        capacity: int | None = None,
+        contention_window: float = 1.0,
+    ) -> None:
+        self.limits = dict(limits or {})
+        self.weights = dict(weights or {})
+        if self.weights and capacity is None:
+            raise ValueError("capacity is required when weights are given")
+        if any(limit < 1 for limit in self.limits.values()):
+            raise ValueError("limits must be at least 1")
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("weights must be positive")
+        self.capacity = capacity
+        self.contention_window = contention_window
+        self.compartments: frozenset[type] = frozenset(self.limits) | frozenset(self.weights)
+        self._in_flight: dict[type, int] = defaultdict(int)
+        self._total_in_flight = 0
+        self._last_rejected: dict[type, float] = {}
+
+    def in_flight(self, compartment: type) -> int:
+        return self._in_flight.get(compartment, 0)
+
+    def try_enter(self, compartments: Collection[type]) -> bool:
+        """Enter all compartments, or none of them if any is full."""
+        now = time.monotonic()
+        rejected = [c for c in compartments if not self._can_enter(c, now)]
+        if rejected:
+            for compartment in compartments:
+                self._last_rejected[compartment] = now
+            return False
+
+        for compartment in compartments:
+            self._in_flight[compartment] += 1
+        self._total_in_flight += 1
+        return True
+
+    def exit(self, compartments: Collection[type]) -> None:
+        for compartment in compartments:
+            self._in_flight[compartment] -= 1
+        self._total_in_flight -= 1
+
+    def _can_enter(self, compartment: type, now: float) -> bool:
+        in_flight = self._in_flight.get(compartment, 0)
+        limit = self.limits.get(compartment)
+        if limit is not None and in_flight >= limit:
+            return False
+
+        if self.capacity is None or compartment not in self.weights:
+            return True
+        if self._total_in_flight >= self.capacity:
+            return False
+
+        contending = {
+            c
+            for c, rejected_at in self._last_rejected.items()
+            if c is not compartment and now - rejected_at <= self.contention_window
+        }
+        if not contending:
+            return True
+        active = contending | {c for c, n in self._in_flight.items() if n} | {compartment}
+        total_weight = sum(self.weights.get(c, 1.0) for c in active)
+        share = max(1.0, self.capacity * self.weights[compartment] / total_weight)
+        return in_flight < share
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Literal
+
+from mersal.exceptions import MessageDeferredError
+from mersal.messages import BatchMessage, LogicalMessage
+from mersal.pipeline.incoming_step import IncomingStep
+from mersal.pipeline.receive.handler_invokers import HandlerInvokers
+from mersal.pipeline.receive.saga_handler_invoker import SagaHandlerInvoker
+
+if TYPE_CHECKING:
+    from mersal.bulkhead.bulkhead import Bulkhead
+    from mersal.pipeline.incoming_step_context import IncomingStepContext
+    from mersal.types import AsyncAnyCallable
+
+__all__ = ("BulkheadStep",)
+
+
+class BulkheadStep(IncomingStep):
+    """Keeps messages out of full compartments of a :class:`Bulkhead`.
+
+    A message whose compartment is full is deferred (see
+    :class:`MessageDeferredError`): it gives up its processing slot (while
+    the worker's cap on waiting deferrals allows) and is nacked after
+    ``defer_delay`` so the transport redelivers it later, without it
+    counting as a failed attempt.
+    """
+
+    def __init__(
+        self,
+        bulkhead: Bulkhead,
+        key: Literal["message_type", "handler_type"],
+        defer_delay: float,
+    ) -> None:
+        self.bulkhead = bulkhead
+        self.key = key
+        self.defer_delay = defer_delay
+        self._compartment_cache: dict[type, type | None] = {}
+
+    async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
+        compartments = self._compartments(context)
+        if not compartments:
+            await next_step()
+            return
+
+        if not self.bulkhead.try_enter(compartments):
+            raise MessageDeferredError(
+                "Bulkhead is full", detail=", ".join(c.__name__ for c in compartments), delay=self.defer_delay
+            )
+
+        try:
+            await next_step()
+        finally:
+            self.bulkhead.exit(compartments)
+
+    def _compartments(self, context: IncomingStepContext) -> set[type]:
+        if self.key == "handler_type":
+            # Wrapping handlers (e.g. process pool handlers) are classified by the handler they wrap.
+            types = [
+                type(invoker.saga if isinstance(invoker, SagaHandlerInvoker) else inspect.unwrap(invoker.handler))
+                for invoker in context.load(HandlerInvokers)
+            ]
+        else:
+            logical_message = context.load(LogicalMessage)
+            message_type = logical_message.body_type
+            if message_type is BatchMessage:
+                types = [type(m) for m in logical_message.body.messages]
+            else:
+                types = [message_type]
+
+        compartments: set[type] = set()
+        for t in types:
+            compartment = self._compartment(t)
+            if compartment is not None:
+                compartments.add(compartment)
+        return compartments
+
+    def _compartment(self, t: type) -> type | None:
+        try:
+            return self._compartment_cache[t]
+        except KeyError:
+            compartment = next((c for c in t.__mro__ if c in self.bulkhead.compartments), None)
+            self._compartment_cache[t] = compartment
+            return compartment
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Literal
+
+from mersal.bulkhead.plugin import BulkheadPlugin
+
+__all__ = ("BulkheadConfig",)
+
+
+@dataclass
+class BulkheadConfig:
+    """Configuration for per message type (or handler type) concurrency limits."""
+
+    limits: Mapping[type, int] = field(default_factory=dict)
+    """Maximum number of concurrently handled messages per compartment type.
+
+    Subclasses share the compartment of their closest registered base class.
+    """
+    key: Literal["message_type", "handler_type"] = "message_type"
+    """Whether compartments are message types or handler types."""
+    weights: Mapping[type, float] = field(default_factory=dict)
+    """Relative weights for sharing `capacity` fairly between compartments."""
+    capacity: int | None = None
+    """Total number of concurrently handled messages shared by weighted compartments.
+
+    Usually the app's `max_parallelism`. Required when `weights` is given.
+    """
+    defer_delay: float = 0.1
+    """Seconds to wait before handing a message that does not fit back to the transport."""
+
+    @property
+    def plugin(self) -> BulkheadPlugin:
+        return BulkheadPlugin(self)
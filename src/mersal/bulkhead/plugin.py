@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mersal.bulkhead.bulkhead import Bulkhead
+from mersal.bulkhead.bulkhead_step import BulkheadStep
+from mersal.pipeline import PipelineInjectionPosition, PipelineInjector
+from mersal.pipeline.pipeline import IncomingPipeline, Pipeline
+from mersal.pipeline.receive.activate_handlers_step import ActivateHandlersStep
+from mersal.plugins import Plugin
+
+if TYPE_CHECKING:
+    from mersal.bulkhead.config import BulkheadConfig
+    from mersal.configuration import StandardConfigurator
+
+__all__ = ("BulkheadPlugin",)
+
+
+class BulkheadPlugin(Plugin):
+    def __init__(self, config: BulkheadConfig):
+        self._config = config
+        self.bulkhead = Bulkhead(
+            limits=config.limits,
+            weights=config.weights,
+            capacity=config.capacity,
+        )
+
+    def __call__(self, configurator: StandardConfigurator) -> None:
+        def decorate_pipeline(configurator: StandardConfigurator) -> Pipeline:
+            step = BulkheadStep(
+                bulkhead=self.bulkhead,
+                key=self._config.key,
+                defer_delay=self._config.defer_delay,
+            )
+
+            pipeline = PipelineInjector(configurator.get(IncomingPipeline))  # type: ignore[type-abstract]
+            pipeline.inject_step(step, PipelineInjectionPosition.AFTER, ActivateHandlersStep)
+            return pipeline
+
+        configurator.decorate(IncomingPipeline, decorate_pipeline)
+        configurator.register(Bulkhead, lambda _: self.bulkhead)
@@ -0,0 +1,15 @@
+from .blob_store import BlobStore
+from .claim_check_steps import ClaimCheckIncomingStep, ClaimCheckOutgoingStep
+from .config import ClaimCheckConfig
+from .const import CLAIM_CHECK_ENCODING_KEY, CLAIM_CHECK_KEY
+from .plugin import ClaimCheckPlugin
+
+__all__ = [
+    "CLAIM_CHECK_ENCODING_KEY",
+    "CLAIM_CHECK_KEY",
+    "BlobStore",
+    "ClaimCheckConfig",
+    "ClaimCheckIncomingStep",
+    "ClaimCheckOutgoingStep",
+    "ClaimCheckPlugin",
+]
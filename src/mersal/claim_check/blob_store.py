@@ -0,0 +1,29 @@
+from typing import Protocol
+
+__all__ = ("BlobStore",)
+
+
+class BlobStore(Protocol):
+    """Storage for message bodies that are too large to travel with the message."""
+
+    async def __call__(self) -> None:
+        """Initialise the store."""
+        ...
+
+    async def put(self, data: bytes, claims: int = 1) -> str:
+        """Store data and return a key that can be used to retrieve it.
+
+        Args:
+            data: The payload to store.
+            claims: The number of times :meth:`release` must be called for
+                the returned key before the payload can be discarded.
+        """
+        ...
+
+    async def get(self, key: str) -> bytes:
+        """Retrieve the payload stored under key."""
+        ...
+
+    async def release(self, key: str) -> None:
+        """Release one claim on key, discarding the payload once no claims remain."""
+        ...
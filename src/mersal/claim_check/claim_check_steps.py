@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from mersal.claim_check.const import CLAIM_CHECK_ENCODING_KEY, CLAIM_CHECK_KEY
+from mersal.messages import MessageHeaders, TransportMessage
+from mersal.pipeline import DestinationAddresses
+from mersal.pipeline.incoming_step import IncomingStep
+from mersal.pipeline.outgoing_step import OutgoingStep
+from mersal.transport import TransactionContext
+
+if TYPE_CHECKING:
+    from mersal.claim_check.blob_store import BlobStore
+    from mersal.pipeline import IncomingStepContext, OutgoingStepContext
+    from mersal.types import AsyncAnyCallable
+
+__all__ = (
+    "ClaimCheckIncomingStep",
+    "ClaimCheckOutgoingStep",
+)
+
+
+_BYTES_ENCODING = "bytes"
+_STR_ENCODING = "str"
+
+
+class ClaimCheckOutgoingStep(OutgoingStep):
+    """Moves large serialized bodies to a :class:`BlobStore`.
+
+    The transport message leaving this step carries an empty body and a
+    reference to the stored payload in its headers. The step runs after
+    serialization so anything further down the pipeline (the outbox, the
+    transport) only ever sees the reference.
+    """
+
+    def __init__(self, blob_store: BlobStore, threshold: int) -> None:
+        self.blob_store = blob_store
+        self.threshold = threshold
+
+    async def __call__(self, context: OutgoingStepContext, next_step: AsyncAnyCallable) -> None:
+        transport_message = context.load(TransportMessage)
+        payload, encoding = self._payload(transport_message.body)
+        if payload is None:
+            await next_step()
+            return
+
+        destination_addresses = context.load(DestinationAddresses)
+        claims = len(destination_addresses.address)
+        if not claims:
+            await next_step()
+            return
+
+        key = await self.blob_store.put(payload, claims)
+        transaction_context: TransactionContext = context.load(TransactionContext)  # type: ignore[type-abstract]
+
+        async def release_claims(_: TransactionContext) -> None:
+            for _claim in range(claims):
+                await self.blob_store.release(key)
+
+        transaction_context.on_rollback(release_claims)
+
+        headers = MessageHeaders(transport_message.headers)
+        headers[CLAIM_CHECK_KEY] = key
+        headers[CLAIM_CHECK_ENCODING_KEY] = encoding
+        context.save(TransportMessage(body=b"", headers=headers))
+
+        await next_step()
+
+    def _payload(self, body: Any) -> tuple[bytes | None, str]:
+        if isinstance(body, bytes | bytearray | memoryview):
+            if len(body) >= self.threshold:
+                return bytes(body), _BYTES_ENCODING
+            return None, _BYTES_ENCODING
+        if isinstance(body, str):
+            # A str takes at most four bytes per character when encoded, so
+            # short bodies can be ruled out without encoding them.
+            if len(body) * 4 < self.threshold:
+                return None, _STR_ENCODING
+            encoded = body.encode()
+            if len(encoded) >= self.threshold:
+                return encoded, _STR_ENCODING
+        return None, _BYTES_ENCODING
+
+
+class ClaimCheckIncomingStep(IncomingStep):
+    """Restores bodies that were moved to a :class:`BlobStore` by :class:`ClaimCheckOutgoingStep`.
+
+    The body is fetched right before deserialization, so messages rejected by
+    earlier steps never touch the store. The resolved message replaces the
+    received one in the step context, the received message itself is left
+    untouched so that it is redelivered with its reference if the handling
+    is not acknowledged.
+    """
+
+    def __init__(self, blob_store: BlobStore, release_after_ack: bool) -> None:
+        self.blob_store = blob_store
+        self.release_after_ack = release_after_ack
+
+    async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
+        transport_message = context.load(TransportMessage)
+        key = transport_message.headers.get(CLAIM_CHECK_KEY)
+        if key is None:
+            await next_step()
+            return
+
+        payload = await self.blob_store.get(key)
+        headers = MessageHeaders(transport_message.headers)
+        encoding = headers.pop(CLAIM_CHECK_ENCODING_KEY, _BYTES_ENCODING)
+        del headers[CLAIM_CHECK_KEY]
+        body: bytes | str = payload.decode() if encoding == _STR_ENCODING else payload
+        context.save(TransportMessage(body=body, headers=headers))
+
+        if self.release_after_ack:
+            transaction_context: TransactionContext = context.load(TransactionContext)  # type: ignore[type-abstract]
+
+            async def release_claim(_: TransactionContext) -> None:
+                await self.blob_store.release(key)
+
+            transaction_context.on_ack(release_claim)
+
+        await next_step()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mersal.claim_check.plugin import ClaimCheckPlugin
+
+if TYPE_CHECKING:
+    from mersal.claim_check.blob_store import BlobStore
+
+__all__ = ("ClaimCheckConfig",)
+
+
+@dataclass
+class ClaimCheckConfig:
+    """Configuration for the claim-check pattern."""
+
+    store: BlobStore
+    """Where message bodies exceeding the threshold are stored."""
+    threshold: int = 256 * 1024
+    """Serialized body size (in bytes) at or above which the body is stored externally."""
+    release_after_ack: bool = True
+    """Whether to release the stored body once the message has been acknowledged.
+
+    Disable when the store has its own retention policy.
+    """
+
+    @property
+    def plugin(self) -> ClaimCheckPlugin:
+        return ClaimCheckPlugin(self)
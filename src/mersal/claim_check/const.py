@@ -0,0 +1,7 @@
+from typing import Final
+
+CLAIM_CHECK_KEY: Final = "mersal-claim-check"
+"""Key added to MessageHeaders holding the reference to the externally stored body."""
+
+CLAIM_CHECK_ENCODING_KEY: Final = "mersal-claim-check-encoding"
+"""Key added to MessageHeaders indicating whether the stored body was `bytes` or `str`."""
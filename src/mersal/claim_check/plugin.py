@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mersal.claim_check.claim_check_steps import (
+    ClaimCheckIncomingStep,
+    ClaimCheckOutgoingStep,
+)
+from mersal.lifespan.lifespan_hooks_registration_plugin import (
+    LifespanHooksRegistrationPluginConfig,
+)
+from mersal.pipeline import PipelineInjectionPosition, PipelineInjector
+from mersal.pipeline.pipeline import IncomingPipeline, OutgoingPipeline, Pipeline
+from mersal.pipeline.receive.deserialize_incoming_message_step import (
+    DeserializeIncomingMessageStep,
+)
+from mersal.pipeline.send.serialize_outgoing_message_step import (
+    SerializeOutgoingMessageStep,
+)
+from mersal.plugins import Plugin
+from mersal.utils.sync import AsyncCallable
+
+if TYPE_CHECKING:
+    from mersal.claim_check.config import ClaimCheckConfig
+    from mersal.configuration import StandardConfigurator
+
+__all__ = ("ClaimCheckPlugin",)
+
+
+class ClaimCheckPlugin(Plugin):
+    def __init__(self, config: ClaimCheckConfig):
+        self._config = config
+
+    def __call__(self, configurator: StandardConfigurator) -> None:
+        def decorate_incoming_pipeline(configurator: StandardConfigurator) -> Pipeline:
+            step = ClaimCheckIncomingStep(
+                blob_store=self._config.store,
+                release_after_ack=self._config.release_after_ack,
+            )
+
+            pipeline = PipelineInjector(configurator.get(IncomingPipeline))  # type: ignore[type-abstract]
+            pipeline.inject_step(step, PipelineInjectionPosition.BEFORE, DeserializeIncomingMessageStep)
+            return pipeline
+
+        def decorate_outgoing_pipeline(configurator: StandardConfigurator) -> Pipeline:
+            step = ClaimCheckOutgoingStep(
+                blob_store=self._config.store,
+                threshold=self._config.threshold,
+            )
+
+            pipeline = PipelineInjector(configurator.get(OutgoingPipeline))  # type: ignore[type-abstract]
+            pipeline.inject_step(step, PipelineInjectionPosition.AFTER, SerializeOutgoingMessageStep)
+            return pipeline
+
+        configurator.decorate(IncomingPipeline, decorate_incoming_pipeline)
+        configurator.decorate(OutgoingPipeline, decorate_outgoing_pipeline)
+
+        hooks = [lambda _: AsyncCallable(self._config.store)]
+
+        plugin = LifespanHooksRegistrationPluginConfig(on_startup_hooks=hooks).plugin
+        plugin(configurator)
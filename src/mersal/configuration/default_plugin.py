@@ -50,7 +50,13 @@ from mersal.serialization import (
 from mersal.subscription import InternalHandlersActivator, SubscriptionStorage
 from mersal.topic import DefaultTopicNameConvention, TopicNameConvention
 from mersal.transport import Transport
-from mersal.workers import DefaultWorkerBackoffStrategy, WorkerBackoffStrategy, WorkerFactory
+from mersal.workers import (
+    ConcurrencyLimit,
+    DefaultWorkerBackoffStrategy,
+    FixedConcurrencyLimit,
+    WorkerBackoffStrategy,
+    WorkerFactory,
+)
 from mersal.workers.anyio import AnyioWorkerFactory
 
 __all__ = ("DefaultPlugin",)
@@ -74,7 +80,7 @@ class DefaultPlugin(Plugin):
         ) -> HandlerActivator:
             handler_activator = config.get(HandlerActivator)  # type: ignore[type-abstract]
             subscription_storage = config.get(SubscriptionStorage)  # type: ignore[type-abstract]
-            return InternalHandlersActivator(handler_activator, subscription_storage)
+            return InternalHandlersActivator.decorate(handler_activator, subscription_storage)
 
         configurator.decorate(HandlerActivator, decorate_handler_activator_with_internal_handlers)
         self._register_default_dependency_if_needed(
@@ -168,6 +174,10 @@ class DefaultPlugin(Plugin):
             WorkerBackoffStrategy,
             lambda _: DefaultWorkerBackoffStrategy(),
         )
+        self._register_default_dependency_if_needed(
+            ConcurrencyLimit,
+            lambda _: FixedConcurrencyLimit(self.max_parallelism),
+        )
 
         self._register_default_dependency_if_needed(
             WorkerFactory,
@@ -178,6 +188,7 @@ class DefaultPlugin(Plugin):
                 max_parallelism=self.max_parallelism,
                 backoff_strategy=config.get(WorkerBackoffStrategy),  # type: ignore[type-abstract]
                 stop_grace_period=self.stop_grace_period,
+                concurrency_limit=config.get(ConcurrencyLimit),  # type: ignore[type-abstract]
             ),
         )
 
@@ -1,9 +1,9 @@
 from importlib.metadata import version
 
-from mersal.core.run import run_apps
+from mersal.core.run import run_app_pool, run_apps
 from mersal.logging import Logger, LoggingConfig
 
-__all__ = ["Logger", "LoggingConfig", "run_apps"]
+__all__ = ["Logger", "LoggingConfig", "run_app_pool", "run_apps"]
 
 
 def __getattr__(name: str) -> str:
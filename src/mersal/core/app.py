@@ -16,6 +16,7 @@ from mersal.lifespan.autosubscribe import AutosubscribeConfig
 from mersal.logging import Logger, LoggingConfig
 from mersal.messages import LogicalMessage, MessageHeaders
 from mersal.messages.control import SubscribeRequest, UnsubscribeRequest
+from mersal.metrics import MetricsConfig, PipelineMetrics
 from mersal.outbox.config import OutboxConfig
 from mersal.outbox.plugin import OutboxPlugin
 from mersal.persistence.in_memory import InMemorySagaStorage
@@ -57,7 +58,7 @@ from mersal.types import Empty, EmptyType, LifespanHook
 from mersal.unit_of_work import UnitOfWorkConfig
 from mersal.unit_of_work.plugin import UnitOfWorkPlugin
 from mersal.utils.sync import AsyncCallable
-from mersal.workers import WorkerFactory
+from mersal.workers import ConcurrencyLimit, WorkerFactory
 
 if TYPE_CHECKING:
     from mersal.workers.worker import Worker
@@ -96,7 +97,9 @@ class Mersal:
         pdb_on_exception: bool | None = None,
         message_id_generator: MessageIdGenerator | None = None,
         max_parallelism: int = 1,
+        concurrency_limit: ConcurrencyLimit | None = None,
         stop_grace_period: float | None = None,
+        metrics: MetricsConfig | None = None,
         logging_config: LoggingConfig | None = None,
         debug: bool = False,
         send_only: bool = False,
@@ -132,10 +135,15 @@ class Mersal:
             pdb_on_exception: bool | None = None,
             message_id_generator: MessageIdGenerator | None = None,
             max_parallelism: number of messages to be handled in parallel.
+            concurrency_limit: controls the number of messages handled in
+                parallel, e.g. an AIMDConcurrencyLimit adapting it to observed
+                latency and failures. Takes precedence over max_parallelism.
             stop_grace_period: seconds in-flight message handlers are given to
                 finish during shutdown before being cancelled (their
                 transaction contexts are still closed). None (the default)
                 waits for them indefinitely.
+            metrics: configuration for pipeline latency histograms, read with
+                `app.metrics.snapshot()` or served in the Prometheus format.
             logging_config: configuration for the logging system.
             debug: controls debug mode.
             send_only: marks this app as send-only - it will never receive messages,
@@ -213,6 +221,9 @@ class Mersal:
         if outbox is not None:
             plugins.append(OutboxPlugin(outbox))
 
+        if metrics is not None:
+            plugins.append(metrics.plugin)
+
         self.logging_config = None
         if logging_config is not None:
             self.logging_config = logging_config
@@ -221,6 +232,9 @@ class Mersal:
         if message_id_generator is not None:
             plugins.append(generic_registration_plugin(message_id_generator, MessageIdGenerator))
 
+        if concurrency_limit is not None:
+            plugins.append(generic_registration_plugin(concurrency_limit, ConcurrencyLimit))
+
         self.on_startup_hooks = list(on_startup_hooks or [])
         self.on_shutdown_hooks = list(on_shutdown_hooks or [])
 
@@ -249,6 +263,7 @@ class Mersal:
         self.subscription_storage = self.configurator.get(SubscriptionStorage)  # type: ignore[type-abstract]
         self.topic_name_convention = self.configurator.get(TopicNameConvention)  # type: ignore[type-abstract]
         self.pipeline_invoker = self.configurator.get(PipelineInvoker)  # type: ignore[type-abstract]
+        self.metrics: PipelineMetrics | None = self.configurator.get_optional(PipelineMetrics)
         self.debug = debug
         self.send_only = send_only
         self.worker: Worker | None = None
@@ -414,6 +429,10 @@ class Mersal:
         if self.send_only:
             return
         self.worker = self.worker_factory.create_worker(self.name)
+        # Optional: workers that don't adapt their concurrency need not expose it.
+        if self.metrics is not None and getattr(self.worker, "concurrency_limit", None) is not None:
+            worker = self.worker
+            self.metrics.track_concurrency_limit(worker.name, lambda: getattr(worker, "concurrency_limit", 0))
 
     @property
     def debug(self) -> bool:
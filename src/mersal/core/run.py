@@ -1,13 +1,27 @@
+import multiprocessing
 import signal
+import time
 from collections.abc import Callable, Sequence
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
 from typing import Any
 
 import anyio
 
 from mersal.core.app import Mersal
+from mersal.exceptions import MersalExceptionError
+from mersal.logging import Logger, NullLogger
 from mersal.utils.sync import AsyncCallable
 
-__all__ = ("run_apps",)
+__all__ = (
+    "run_app_pool",
+    "run_apps",
+)
+
+AppFactory = Callable[[], Mersal | Sequence[Mersal]]
+
+_PROCESS_POLL_INTERVAL = 0.1
+_DEFAULT_HEARTBEAT_INTERVAL = 0.5
 
 
 async def run_apps(
@@ -141,3 +155,259 @@ async def run_apps(
                     _ = apps_task_group.start_soon(run_one, app)
         finally:
             task_group.cancel_scope.cancel()
+
+
+async def run_app_pool(
+    app_factory: AppFactory,
+    *,
+    processes: int,
+    stop: anyio.Event | None = None,
+    ready: anyio.Event | None = None,
+    handle_signals: bool = True,
+    restart_on_crash: bool = True,
+    restart_backoff: float = 1.0,
+    stop_grace_period: float = 30.0,
+    liveness_timeout: float | None = None,
+    liveness_check_interval: float | None = None,
+    on_unresponsive: Callable[[int, float], Any] | None = None,
+    start_method: str = "spawn",
+    logger: Logger | None = None,
+) -> None:
+    """Run replicas of an app in separate processes until stopped.
+
+    Every replica process calls ``app_factory`` and runs the returned app(s)
+    with :func:`run_apps`, so replicas share nothing but the transport; use
+    it to spread CPU-bound consumers over several cores.
+
+    The calling process only supervises. A replica that exits while the pool
+    is running is restarted after a backoff; one that exits cleanly (code 0)
+    is not counted as a crash. On stop each replica receives
+    SIGTERM and drains gracefully; one still running after the grace period
+    is killed. Replicas ignore SIGINT so that a Ctrl-C in a terminal (which
+    reaches the whole process group) is handled by the supervisor alone.
+
+    Replicas publish a heartbeat to a shared-memory table on a timer, held
+    back to the oldest heartbeat of their running workers, which drives the
+    ``ready`` event and, with a liveness timeout set, the same
+    unresponsive/responsive reporting as :func:`run_apps`.
+
+    Args:
+        app_factory: picklable callable (e.g. a module level function)
+            returning the app or apps a replica runs. Called once in every
+            replica process, including restarted ones.
+        processes: number of replica processes.
+        stop: event that triggers a graceful shutdown when set.
+        ready: event set once every replica has started its apps.
+        handle_signals: trap SIGTERM/SIGINT and stop the pool on the first
+            signal; a second signal kills replicas that are still draining.
+        restart_on_crash: restart a replica process that exits while the
+            pool is running, and restart crashed apps within a replica. When
+            False the first crash stops the pool and raises, and a replica
+            that exits cleanly is not restarted.
+        restart_backoff: seconds to wait before restarting a replica.
+        stop_grace_period: seconds a replica gets to drain after SIGTERM
+            before it is killed.
+        liveness_timeout: heartbeat age in seconds beyond which a replica is
+            reported unresponsive; None disables the watcher.
+        liveness_check_interval: seconds between liveness checks; defaults
+            to a quarter of the timeout.
+        on_unresponsive: sync or async callable invoked with (replica index,
+            heartbeat_age) when a replica becomes unresponsive. Exceptions it
+            raises are logged, not propagated.
+        start_method: multiprocessing start method used for replicas.
+        logger: logger for supervisor events.
+    """
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+
+    log = logger if logger is not None else NullLogger()
+    context: BaseContext = multiprocessing.get_context(start_method)
+    # Wall clock time of each replica's last worker heartbeat, 0 until the
+    # replica is up. Each slot has a single writer so no lock is needed.
+    heartbeats = context.RawArray("d", processes)
+    check_interval = liveness_check_interval
+    if check_interval is None and liveness_timeout is not None:
+        check_interval = liveness_timeout / 4
+    heartbeat_interval = min(check_interval or _DEFAULT_HEARTBEAT_INTERVAL, _DEFAULT_HEARTBEAT_INTERVAL)
+    stop_event = stop if stop is not None else anyio.Event()
+    force_stop = anyio.Event()
+
+    async def wait_for_exit(process: BaseProcess, interrupt: anyio.Event | None) -> bool:
+        while process.exitcode is None:
+            if interrupt is not None and interrupt.is_set():
+                return False
+            await anyio.sleep(_PROCESS_POLL_INTERVAL)
+        return True
+
+    async def shut_down(index: int, process: BaseProcess) -> None:
+        if process.exitcode is None:
+            process.terminate()
+            with anyio.move_on_after(stop_grace_period):
+                await wait_for_exit(process, force_stop)
+            if process.exitcode is None:
+                log.warning("app_pool.replica.killed", replica=index, pid=process.pid)
+                process.kill()
+                await wait_for_exit(process, None)
+        process.join()
+        log.info("app_pool.replica.stopped", replica=index, pid=process.pid)
+
+    async def supervise(index: int) -> None:
+        while True:
+            heartbeats[index] = 0.0
+            # Every concrete context, fork included, provides Process; BaseContext does not declare it.
+            process: BaseProcess = context.Process(  # type: ignore[attr-defined]
+                target=_run_replica,
+                args=(app_factory, index, heartbeats, heartbeat_interval, restart_on_crash, restart_backoff),
+                name=f"mersal-replica-{index}",
+            )
+            process.start()
+            log.info("app_pool.replica.started", replica=index, pid=process.pid)
+            try:
+                exited = await wait_for_exit(process, stop_event)
+            except BaseException:
+                with anyio.CancelScope(shield=True):
+                    await shut_down(index, process)
+                raise
+            if not exited:
+                with anyio.CancelScope(shield=True):
+                    await shut_down(index, process)
+                return
+
+            process.join()
+            heartbeats[index] = 0.0
+            if process.exitcode == 0:
+                log.info("app_pool.replica.exited", replica=index, pid=process.pid, exitcode=process.exitcode)
+                if not restart_on_crash:
+                    return
+            else:
+                log.error("app_pool.replica.exited", replica=index, pid=process.pid, exitcode=process.exitcode)
+                if not restart_on_crash:
+                    raise MersalExceptionError(f"App pool replica {index} exited with code {process.exitcode}")
+            with anyio.move_on_after(restart_backoff):
+                await stop_event.wait()
+            if stop_event.is_set():
+                return
+
+    async def watch_signals() -> None:
+        with anyio.open_signal_receiver(signal.SIGTERM, signal.SIGINT) as signals:
+            async for _ in signals:
+                if stop_event.is_set():
+                    force_stop.set()
+                else:
+                    stop_event.set()
+
+    async def watch_ready(event: anyio.Event) -> None:
+        while not all(heartbeats[index] > 0 for index in range(processes)):
+            await anyio.sleep(_PROCESS_POLL_INTERVAL)
+        event.set()
+
+    async def watch_liveness(timeout: float, interval: float) -> None:
+        callback = AsyncCallable(on_unresponsive) if on_unresponsive is not None else None
+        unresponsive: set[int] = set()
+        while True:
+            await anyio.sleep(interval)
+            now = time.time()
+            for index in range(processes):
+                heartbeat = heartbeats[index]
+                if not heartbeat:
+                    unresponsive.discard(index)
+                    continue
+                age = now - heartbeat
+                if age > timeout:
+                    if index not in unresponsive:
+                        unresponsive.add(index)
+                        log.warning("app_pool.replica.unresponsive", replica=index, heartbeat_age=age)
+                        if callback is not None:
+                            try:
+                                await callback(index, age)
+                            except Exception:
+                                log.exception("app_pool.replica.unresponsive.callback.error", replica=index)
+                elif index in unresponsive:
+                    unresponsive.discard(index)
+                    log.info("app_pool.replica.responsive", replica=index, heartbeat_age=age)
+
+    async with anyio.create_task_group() as task_group:
+        if handle_signals:
+            _ = task_group.start_soon(watch_signals)
+        if ready is not None:
+            _ = task_group.start_soon(watch_ready, ready)
+        if liveness_timeout is not None and check_interval is not None:
+            _ = task_group.start_soon(watch_liveness, liveness_timeout, check_interval)
+        try:
+            async with anyio.create_task_group() as replicas_task_group:
+                for index in range(processes):
+                    _ = replicas_task_group.start_soon(supervise, index)
+        finally:
+            task_group.cancel_scope.cancel()
+
+
+def _run_replica(
+    app_factory: AppFactory,
+    index: int,
+    heartbeats: Any,
+    heartbeat_interval: float,
+    restart_on_crash: bool,
+    restart_backoff: float,
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    anyio.run(
+        _run_replica_apps,
+        app_factory,
+        index,
+        heartbeats,
+        heartbeat_interval,
+        restart_on_crash,
+        restart_backoff,
+    )
+
+
+async def _run_replica_apps(
+    app_factory: AppFactory,
+    index: int,
+    heartbeats: Any,
+    heartbeat_interval: float,
+    restart_on_crash: bool,
+    restart_backoff: float,
+) -> None:
+    created = app_factory()
+    apps = [created] if isinstance(created, Mersal) else list(created)
+    stop = anyio.Event()
+    ready = anyio.Event()
+
+    async def watch_terminate(scope: anyio.CancelScope) -> None:
+        with anyio.open_signal_receiver(signal.SIGTERM) as signals:
+            async for _ in signals:
+                if stop.is_set():
+                    scope.cancel()
+                else:
+                    stop.set()
+
+    async def publish_heartbeat() -> None:
+        await ready.wait()
+        # Beats on a timer, so a replica without running workers (send-only
+        # apps) stays live; a running worker whose receive loop stalls holds
+        # the beat back to its own last heartbeat.
+        while True:
+            now = time.time()
+            ages = [
+                age
+                for app in apps
+                if (worker := app.worker) is not None and worker.running and (age := worker.heartbeat_age) is not None
+            ]
+            heartbeats[index] = now - max(ages) if ages else now
+            await anyio.sleep(heartbeat_interval)
+
+    async with anyio.create_task_group() as task_group:
+        _ = task_group.start_soon(watch_terminate, task_group.cancel_scope)
+        _ = task_group.start_soon(publish_heartbeat)
+        try:
+            await run_apps(
+                apps,
+                stop=stop,
+                ready=ready,
+                handle_signals=False,
+                restart_on_crash=restart_on_crash,
+                restart_backoff=restart_backoff,
+            )
+        finally:
+            task_group.cancel_scope.cancel()
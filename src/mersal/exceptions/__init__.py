@@ -1,11 +1,13 @@
 from .base_exceptions import (
     ConcurrencyExceptionError,
     MersalExceptionError,
+    MessageDeferredError,
     MissingDependencyExceptionError,
 )
 
 __all__ = [
     "ConcurrencyExceptionError",
     "MersalExceptionError",
+    "MessageDeferredError",
     "MissingDependencyExceptionError",
 ]
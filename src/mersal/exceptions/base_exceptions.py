@@ -3,6 +3,7 @@ from typing import Any
 __all__ = (
     "ConcurrencyExceptionError",
     "MersalExceptionError",
+    "MessageDeferredError",
     "MissingDependencyExceptionError",
 )
 
@@ -47,3 +48,19 @@ class MissingDependencyExceptionError(MersalExceptionError, ImportError):
 
 class ConcurrencyExceptionError(MersalExceptionError):
     pass
+
+
+class MessageDeferredError(MersalExceptionError):
+    """Raised by an incoming step to hand the message back to the transport for later redelivery.
+
+    Unlike other exceptions it is not counted as a failed delivery attempt.
+    The worker frees the message's processing slot and waits ``delay``
+    seconds before nacking it.
+    """
+
+    transaction_context_key = "message-deferred"
+    """Transaction context item holding the delay, set by the retry step when a message is deferred."""
+
+    def __init__(self, *args: Any, detail: str = "", delay: float = 0) -> None:
+        super().__init__(*args, detail=detail)
+        self.delay = delay
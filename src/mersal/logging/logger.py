@@ -16,6 +16,7 @@ class Logger(Protocol):
     def exception(self, event: str, **kwargs: Any) -> Any: ...
     def critical(self, event: str, **kwargs: Any) -> Any: ...
     def set_level(self, level: int) -> None: ...
+    def is_enabled_for(self, level: int) -> bool: ...
 
     def bind(self, **kwargs: Any) -> Logger: ...
     def unbind(self, *keys: str) -> Logger: ...
@@ -35,6 +35,9 @@ class NullLogger:
     def set_level(self, level: int) -> None:
         return None
 
+    def is_enabled_for(self, level: int) -> bool:
+        return False
+
     def bind(self, **kwargs: Any) -> NullLogger:
         return self
 
@@ -1,26 +1,27 @@
 from __future__ import annotations
 
+import logging
 import time
 import types
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Self
 
 from mersal.logging.logger import Logger
-from mersal.messages import LogicalMessage, TransportMessage
+from mersal.messages import TransportMessage
 from mersal.pipeline import (
+    ConditionalStep,
     IncomingPipeline,
     IncomingStepContext,
     OutgoingPipeline,
     OutgoingStepContext,
     PipelineInvoker,
 )
-from mersal.pipeline.send.destination_addresses import DestinationAddresses
 from mersal.plugins import Plugin
 from mersal.retry import ErrorHandler
 from mersal.workers import WorkerFactory
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     from mersal.configuration import StandardConfigurator
     from mersal.core.app import Mersal
@@ -47,7 +48,7 @@ def _step_name(step: Any) -> str:
 
 
 def _extract_incoming_context(context: IncomingStepContext) -> dict[str, Any]:
-    transport_message = context.load(TransportMessage)
+    transport_message = context.transport_message
     if not transport_message:  # type: ignore[truthy-bool]
         return {"message": "unknown", "pipeline": "incoming"}
     return {
@@ -59,8 +60,8 @@ def _extract_incoming_context(context: IncomingStepContext) -> dict[str, Any]:
 
 
 def _extract_outgoing_context(context: OutgoingStepContext) -> dict[str, Any]:
-    logical_message = context.load(LogicalMessage)
-    destinations = context.load(DestinationAddresses)
+    logical_message = context.logical_message
+    destinations = context.destination_addresses
     result: dict[str, Any] = {"pipeline": "outgoing"}
     if logical_message:  # type: ignore[truthy-bool]
         result["message"] = logical_message.message_label
@@ -80,9 +81,13 @@ class _LoggingIncomingStep:
         self._step = step
         self._logger = logger
 
+    def applies_to(self, message_type: type) -> bool | None:
+        step = self._step
+        return step.applies_to(message_type) if isinstance(step, ConditionalStep) else True
+
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
         step_name = _step_name(self._step)
-        transport_message = context.load(TransportMessage)
+        transport_message = context.transport_message
         message_label = transport_message.message_label if transport_message else "unknown"  # type: ignore[truthy-bool]
 
         logger = self._logger.bind(step=step_name, message=message_label, pipeline="incoming")
@@ -110,10 +115,10 @@ class _LoggingOutgoingStep:
 
     async def __call__(self, context: OutgoingStepContext, next_step: AsyncAnyCallable) -> None:
         step_name = _step_name(self._step)
-        logical_message = context.load(LogicalMessage)
+        logical_message = context.logical_message
         message_label = logical_message.message_label if logical_message else "unknown"  # type: ignore[truthy-bool]
 
-        destinations = context.load(DestinationAddresses)
+        destinations = context.destination_addresses
         dest_str = ",".join(destinations) if destinations else "unknown"  # type: ignore[truthy-bool]
 
         logger = self._logger.bind(step=step_name, message=message_label, destinations=dest_str, pipeline="outgoing")
@@ -137,10 +142,40 @@ class _LoggingOutgoingStep:
 # --- Pipeline decorators ---
 
 
+class _StepLogging:
+    """Wraps the pipelines' steps in logging steps only while debug logging is enabled.
+
+    The pipelines hand out lists that are kept by the pipeline invoker; their
+    contents are swapped between the plain and the logging steps whenever
+    `sync` sees the debug level toggled, so with debug logging off the steps
+    run without any logging overhead.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self._logger = logger
+        self._enabled = logger.is_enabled_for(logging.DEBUG)
+        self._pipelines: list[tuple[list[Any], tuple[Any, ...], Callable[[Any], Any]]] = []
+
+    def add(self, steps: Sequence[Any], wrap: Callable[[Any], Any]) -> list[Any]:
+        plain_steps = tuple(steps)
+        current_steps = [wrap(step) for step in plain_steps] if self._enabled else list(plain_steps)
+        self._pipelines.append((current_steps, plain_steps, wrap))
+        return current_steps
+
+    def sync(self) -> None:
+        enabled = self._logger.is_enabled_for(logging.DEBUG)
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        for current_steps, plain_steps, wrap in self._pipelines:
+            current_steps[:] = [wrap(step) for step in plain_steps] if enabled else plain_steps
+
+
 class _LoggingIncomingPipeline:
-    def __init__(self, pipeline: IncomingPipeline, logger: Logger) -> None:
+    def __init__(self, pipeline: IncomingPipeline, logger: Logger, step_logging: _StepLogging) -> None:
         self._pipeline = pipeline
         self._logger = logger
+        self._step_logging = step_logging
 
     def __call__(self) -> Sequence[IncomingStep]:
         steps = self._pipeline()
@@ -150,13 +185,14 @@ class _LoggingIncomingPipeline:
             steps=[_step_name(s) for s in steps],
             step_count=len(steps),
         )
-        return [_LoggingIncomingStep(step, self._logger) for step in steps]
+        return self._step_logging.add(steps, lambda step: _LoggingIncomingStep(step, self._logger))
 
 
 class _LoggingOutgoingPipeline:
-    def __init__(self, pipeline: OutgoingPipeline, logger: Logger) -> None:
+    def __init__(self, pipeline: OutgoingPipeline, logger: Logger, step_logging: _StepLogging) -> None:
         self._pipeline = pipeline
         self._logger = logger
+        self._step_logging = step_logging
 
     def __call__(self) -> Sequence[OutgoingStep]:
         steps = self._pipeline()
@@ -166,19 +202,27 @@ class _LoggingOutgoingPipeline:
             steps=[_step_name(s) for s in steps],
             step_count=len(steps),
         )
-        return [_LoggingOutgoingStep(step, self._logger) for step in steps]
+        return self._step_logging.add(steps, lambda step: _LoggingOutgoingStep(step, self._logger))
 
 
 # --- Pipeline invoker decorator ---
 
 
 class _LoggingPipelineInvoker:
-    def __init__(self, invoker: PipelineInvoker, logger: Logger, pipeline_context: PipelineContext) -> None:
+    def __init__(
+        self,
+        invoker: PipelineInvoker,
+        logger: Logger,
+        pipeline_context: PipelineContext,
+        step_logging: _StepLogging,
+    ) -> None:
         self._invoker = invoker
         self._logger = logger
         self._pipeline_context = pipeline_context
+        self._step_logging = step_logging
 
     async def __call__(self, context: IncomingStepContext | OutgoingStepContext) -> None:
+        self._step_logging.sync()
         if isinstance(context, IncomingStepContext):
             ctx = _extract_incoming_context(context)
         else:
@@ -244,6 +288,14 @@ class _LoggingWorker:
     def running(self) -> bool:
         return self._worker.running
 
+    @property
+    def heartbeat_age(self) -> float | None:
+        return self._worker.heartbeat_age
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        return getattr(self._worker, "concurrency_limit", None)
+
     async def __call__(self) -> None:
         await self._worker()
 
@@ -288,6 +340,13 @@ class _LoggingWorkerFactory:
 
 
 class StandardLoggingPlugin(Plugin):
+    """Logs pipeline invocations, dead-lettering and workers.
+
+    Every pipeline step is also logged, with timings, while the logger's
+    debug level is enabled (e.g. with `app.debug = True`); otherwise the
+    steps aren't wrapped at all.
+    """
+
     def __init__(self, config: LoggingConfig, pipeline_context: PipelineContext | None = None) -> None:
         self._config = config
         self._pipeline_context = pipeline_context or _noop_context
@@ -297,18 +356,20 @@ class StandardLoggingPlugin(Plugin):
         configurator.register(Logger, lambda _: logger)
 
         pipeline_context = self._pipeline_context
+        step_logging = _StepLogging(logger)
 
         def decorate_incoming_pipeline(configurator: StandardConfigurator) -> _LoggingIncomingPipeline:
             pipeline = configurator.get(IncomingPipeline)  # type: ignore[type-abstract]
-            return _LoggingIncomingPipeline(pipeline, configurator.get(Logger))  # type: ignore[type-abstract]
+            return _LoggingIncomingPipeline(pipeline, configurator.get(Logger), step_logging)  # type: ignore[type-abstract]
 
         def decorate_outgoing_pipeline(configurator: StandardConfigurator) -> _LoggingOutgoingPipeline:
             pipeline = configurator.get(OutgoingPipeline)  # type: ignore[type-abstract]
-            return _LoggingOutgoingPipeline(pipeline, configurator.get(Logger))  # type: ignore[type-abstract]
+            return _LoggingOutgoingPipeline(pipeline, configurator.get(Logger), step_logging)  # type: ignore[type-abstract]
 
         def decorate_pipeline_invoker(configurator: StandardConfigurator) -> _LoggingPipelineInvoker:
             invoker = configurator.get(PipelineInvoker)  # type: ignore[type-abstract]
-            return _LoggingPipelineInvoker(invoker, configurator.get(Logger), pipeline_context)  # type: ignore[type-abstract]
+            logger = configurator.get(Logger)  # type: ignore[type-abstract]
+            return _LoggingPipelineInvoker(invoker, logger, pipeline_context, step_logging)
 
         def decorate_error_handler(configurator: StandardConfigurator) -> _LoggingErrorHandler:
             handler = configurator.get(ErrorHandler)  # type: ignore[type-abstract]
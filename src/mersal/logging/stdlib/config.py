@@ -7,6 +7,7 @@ from mersal.logging.config import GetLogger, LoggingConfig
 from mersal.logging.logger import Logger
 from mersal.logging.standard_plugin import StandardLoggingPlugin
 from mersal.logging.stdlib.logger import StdlibLogger
+from mersal.logging.stdlib.queue import DropPolicy
 from mersal.plugins import Plugin
 
 __all__ = ("StdlibLoggingConfig",)
@@ -14,11 +15,23 @@ __all__ = ("StdlibLoggingConfig",)
 
 @dataclass(kw_only=True)
 class StdlibLoggingConfig(LoggingConfig):
+    """Configures the stdlib `logging` module through `dictConfig`.
+
+    By default records go through a bounded queue to a listener thread that
+    formats and writes them, so slow handlers don't block message handling;
+    records that don't fit in the queue are dropped and counted in the
+    `queue_listener` handler's `dropped_records`.
+    """
+
     formatters: dict[str, dict[str, Any]] = field(default_factory=dict)
     handlers: dict[str, dict[str, Any]] = field(default_factory=dict)
     loggers: dict[str, dict[str, Any]] = field(default_factory=dict)
     root: dict[str, Any] = field(default_factory=dict)
     configure_root_logger: bool = field(default=True)
+    queue_size: int = 10_000
+    """Maximum number of records waiting for the listener thread, unbounded if not positive."""
+    drop_policy: DropPolicy = "drop_newest"
+    """Whether the new or the oldest queued record is dropped when the queue is full."""
 
     def __post_init__(self) -> None:
         if "standard" not in self.formatters:
@@ -44,7 +57,7 @@ class StdlibLoggingConfig(LoggingConfig):
         return StandardLoggingPlugin(config=self)
 
     def configure(self) -> GetLogger:
-        logger_config: dict[str, Any] = {}
+        logger_config: dict[str, Any] = {"version": 1, "disable_existing_loggers": False}
 
         logger_config["formatters"] = self.formatters
         logger_config["handlers"] = self.handlers
@@ -73,19 +86,22 @@ class StdlibLoggingConfig(LoggingConfig):
     def _default_queue_listener_handler(self) -> dict[str, Any]:
         if sys.version_info >= (3, 12):
             return {
-                "class": "logging.handlers.QueueHandler",
+                "class": "mersal.logging.stdlib.queue.DroppingQueueHandler",
                 "level": "DEBUG",
                 "queue": {
                     "()": "queue.Queue",
-                    "maxsize": -1,
+                    "maxsize": self.queue_size,
                 },
-                "listener": "mersal.logging.queue.LoggingQueueListener",
+                "drop_policy": self.drop_policy,
+                "listener": "mersal.logging.stdlib.queue.LoggingQueueListener",
                 "handlers": ["console"],
             }
         return {
-            "class": "mersal.logging.queue.QueueListenerHandler",
+            "class": "mersal.logging.stdlib.queue.QueueListenerHandler",
             "level": "DEBUG",
             "formatter": "standard",
+            "maxsize": self.queue_size,
+            "drop_policy": self.drop_policy,
         }
 
     def _get_mersal_logger(self) -> dict[str, Any]:
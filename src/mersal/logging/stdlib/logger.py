@@ -30,42 +30,45 @@ class StdlibLogger:
             return f"{event}: {', '.join(value_strings)}"
         return event
 
-    def _split_kwargs(self, kwargs: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
-        logging_kwargs = {k: v for k, v in kwargs.items() if k in self._LOGGING_KWARGS}
-        extra = {k: v for k, v in kwargs.items() if k not in self._LOGGING_KWARGS}
-        return logging_kwargs, extra
+    def _log(self, level: int, event: str, kwargs: dict[str, Any], **defaults: Any) -> Any:
+        # The context is only formatted for enabled levels.
+        if not self._logger.isEnabledFor(level):
+            return None
+        logging_kwargs = defaults
+        extra: dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key in self._LOGGING_KWARGS:
+                logging_kwargs[key] = value
+            else:
+                extra[key] = value
+        return self._logger.log(level, self._format(event, extra), **logging_kwargs)
 
     def debug(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.debug(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.DEBUG, event, kwargs)
 
     def info(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.info(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.INFO, event, kwargs)
 
     def warning(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.warning(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.WARNING, event, kwargs)
 
     def warn(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.warning(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.WARNING, event, kwargs)
 
     def error(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.error(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.ERROR, event, kwargs)
 
     def fatal(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.fatal(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.CRITICAL, event, kwargs)
 
     def exception(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.exception(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.ERROR, event, kwargs, exc_info=True)
 
     def critical(self, event: str, **kwargs: Any) -> Any:
-        logging_kwargs, extra = self._split_kwargs(kwargs)
-        return self._logger.critical(self._format(event, extra), **logging_kwargs)
+        return self._log(logging.CRITICAL, event, kwargs)
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
 
     def set_level(self, level: int) -> None:
         self._logger.setLevel(level)
@@ -1,32 +1,115 @@
 import atexit
-from logging import Handler, LogRecord, StreamHandler
+import copy
+from logging import Formatter, Handler, LogRecord, StreamHandler
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
-from typing import Any
+from queue import Empty, Full, Queue
+from typing import Any, Literal, TypeAlias
 
 __all__ = (
+    "DropPolicy",
+    "DroppingQueueHandler",
     "LoggingQueueListener",
     "QueueListenerHandler",
 )
 
 
+DropPolicy: TypeAlias = Literal["drop_newest", "drop_oldest"]
+
+_default_formatter = Formatter()
+
+
 class LoggingQueueListener(QueueListener):
     def __init__(self, queue: Queue[LogRecord], *handlers: Handler, respect_handler_level: bool = False) -> None:
         super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
         self.start()
         atexit.register(self.stop)
 
+    def enqueue_sentinel(self) -> None:
+        # A bounded queue may be full; the listener thread is still draining it.
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+    def stop(self) -> None:
+        # Also registered with atexit, so it may run after the listener was stopped;
+        # without a thread draining the queue, the sentinel could block on a full one.
+        if self._thread is None:
+            return
+        super().stop()
 
-class QueueListenerHandler(QueueHandler):
+
+class DroppingQueueHandler(QueueHandler):
+    """A `QueueHandler` that never blocks the logging thread.
+
+    Records are queued with their message merged with its arguments and
+    their traceback rendered into `exc_text`, so later changes to the
+    arguments don't show and the traceback's frames aren't kept alive while
+    the record waits; formatting with the handlers' formatters and the
+    handlers' I/O happen on the listener's thread. When a bounded queue is
+    full the record (`drop_newest`) or the oldest queued record
+    (`drop_oldest`) is dropped and counted in `dropped_records`.
+    """
+
+    def __init__(self, queue: Queue[LogRecord], drop_policy: DropPolicy = "drop_newest") -> None:
+        if drop_policy not in ("drop_newest", "drop_oldest"):
+            raise ValueError(f"Unknown drop policy {drop_policy!r}")
+        super().__init__(queue)
+        self.drop_policy = drop_policy
+        self.dropped_records = 0
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = (self.formatter or _default_formatter).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        queue = self.queue
+        try:
+            queue.put_nowait(record)
+            return
+        except Full:
+            pass
+
+        if self.drop_policy == "drop_oldest":
+            try:
+                queue.get_nowait()  # type: ignore[attr-defined]
+            except Empty:
+                pass
+            try:
+                queue.put_nowait(record)
+            except Full:
+                pass
+        with self.lock:  # type: ignore[union-attr]
+            self.dropped_records += 1
+
+
+class QueueListenerHandler(DroppingQueueHandler):
     """Listener/Handler for python < 3.12"""
 
-    def __init__(self, handlers: list[Any] | None = None) -> None:
+    def __init__(
+        self,
+        handlers: list[Any] | None = None,
+        maxsize: int = -1,
+        drop_policy: DropPolicy = "drop_newest",
+    ) -> None:
         """Initialize ``QueueListenerHandler``.
 
         Args:
             handlers: Optional 'ConvertingList'
+            maxsize: Maximum number of queued records, unbounded if not positive.
+            drop_policy: Which record to drop when the queue is full.
         """
-        queue: Queue[LogRecord] = Queue(-1)
-        super().__init__(queue)
+        queue: Queue[LogRecord] = Queue(maxsize)
+        super().__init__(queue, drop_policy)
         handlers = [handlers[i] for i in range(len(handlers))] if handlers else [StreamHandler()]
         self.listener = LoggingQueueListener(queue, *handlers)
+
+    def setFormatter(self, fmt: Formatter | None) -> None:
+        # Records are formatted by the listener's handlers, not by this one.
+        super().setFormatter(fmt)
+        for handler in self.listener.handlers:
+            if handler.formatter is None:
+                handler.setFormatter(fmt)
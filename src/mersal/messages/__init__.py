@@ -2,6 +2,14 @@ from .batch_message import BatchMessage
 from .logical_message import LogicalMessage
 from .message_completed_event import MessageCompletedEvent
 from .message_headers import MessageHeaders
+from .message_type_registry import MessageTypeRegistry
 from .transport_message import TransportMessage
 
-__all__ = ("BatchMessage", "LogicalMessage", "MessageCompletedEvent", "MessageHeaders", "TransportMessage")
+__all__ = (
+    "BatchMessage",
+    "LogicalMessage",
+    "MessageCompletedEvent",
+    "MessageHeaders",
+    "MessageTypeRegistry",
+    "TransportMessage",
+)
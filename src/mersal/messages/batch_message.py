@@ -1,8 +1,18 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from .message_headers import MessageHeaders
 
 __all__ = ("BatchMessage",)
 
 
 class BatchMessage:
-    def __init__(self, messages: list[Any]) -> None:
+    header_key: ClassVar[str] = "mersal-batch"
+    """Header marking a transport message whose body is a batch of serialized messages."""
+
+    def __init__(self, messages: list[Any], headers: list[MessageHeaders] | None = None) -> None:
         self.messages = messages
+        self.headers = headers
+        """The headers of each message, if it was sent on its own before being batched."""
@@ -1,21 +1,62 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from .message_headers import MessageHeaders
+from .message_label import CachedMessageLabel
+from .message_type_registry import MessageTypeRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 __all__ = ("LogicalMessage",)
 
 
-class LogicalMessage:
+class LogicalMessage(CachedMessageLabel):
+    __slots__ = ("_body", "_body_loader", "headers")
+
+    _body: Any
+    _body_loader: Callable[[], Any] | None
+
     def __init__(self, body: Any, headers: MessageHeaders) -> None:
+        super().__init__()
         self.headers = headers
         self.body = body
 
+    @classmethod
+    def deferred(cls, body_loader: Callable[[], Any], headers: MessageHeaders) -> LogicalMessage:
+        """Create a message whose body is loaded on first access of `body`.
+
+        `body_type` is answered from the `message_type` header while the body
+        is not loaded, so routing to handlers doesn't require deserializing it.
+        """
+        message = cls.__new__(cls)
+        CachedMessageLabel.__init__(message)
+        message.headers = headers
+        message._body = None
+        message._body_loader = body_loader
+        return message
+
+    @property
+    def body(self) -> Any:
+        if self._body_loader is not None:
+            self._body = self._body_loader()
+            self._body_loader = None
+        return self._body
+
+    @body.setter
+    def body(self, value: Any) -> None:
+        self._body = value
+        self._body_loader = None
+
+    @property
+    def is_body_loaded(self) -> bool:
+        return self._body_loader is None
+
     @property
-    def message_label(self) -> str:
-        t = self.headers.message_type
-        if not t:
-            try:
-                t = str(type(self.body))
-            except Exception:  # noqa: BLE001
-                t = "unknown"
-        return f"{t}/{self.headers.message_id}"
+    def body_type(self) -> type:
+        if self._body_loader is not None:
+            message_type = MessageTypeRegistry.resolve(self.headers.message_type)
+            if message_type is not None:
+                return message_type
+        return type(self.body)
@@ -1,10 +1,14 @@
-from collections import UserDict
-from collections.abc import Mapping
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
 __all__ = ("MessageHeaders",)
 
 
-class MessageHeaders(UserDict, Mapping[str, str]):
+class MessageHeaders(dict[str, str]):
     """Message headers, always string-keyed and string-valued.
 
     Every real transport (RabbitMQ's AMQP field tables for non-native types, GCP
@@ -13,15 +17,63 @@ class MessageHeaders(UserDict, Mapping[str, str]):
     boundary - keeping the in-memory transport's behavior consistent with every
     other transport instead of silently preserving richer types that then break
     on a real broker.
+
+    A plain `dict` underneath: keys and values that are already strings are
+    stored as they are, and the well-known keys are stored as one shared
+    string object, so lookups of them compare by identity.
     """
 
+    __slots__ = ()
+
     message_id_key = "message_id"
+    message_type_key = "message_type"
     correlation_id_key = "correlation_id"
     correlation_sequence_key = "correlation_sequence"
     causation_id_key = "causation_id"
 
+    def __init__(self, headers: Mapping[Any, Any] | Iterable[tuple[Any, Any]] = (), /, **kwargs: Any) -> None:
+        super().__init__()
+        self.update(headers, **kwargs)
+
     def __setitem__(self, key: str, item: object) -> None:
-        super().__setitem__(str(key), str(item))
+        super().__setitem__(_key(key), item if type(item) is str else str(item))
+
+    def update(  # type: ignore[override]
+        self, headers: Mapping[Any, Any] | Iterable[tuple[Any, Any]] = (), /, **kwargs: Any
+    ) -> None:
+        if type(headers) is MessageHeaders:
+            # Already coerced, copy without converting again.
+            dict.update(self, headers)
+            items: Iterable[tuple[Any, Any]] = ()
+        else:
+            items = headers.items() if hasattr(headers, "items") else headers
+        set_item = super().__setitem__
+        for key, value in items:
+            set_item(_key(key), value if type(value) is str else str(value))
+        for key, value in kwargs.items():
+            set_item(_key(key), value if type(value) is str else str(value))
+
+    def setdefault(self, key: str, default: object = None) -> str:
+        key = _key(key)
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(self, headers: Mapping[Any, Any] | Iterable[tuple[Any, Any]]) -> Self:  # type: ignore[override]
+        self.update(headers)
+        return self
+
+    def __or__(self, headers: Mapping[Any, Any]) -> MessageHeaders:  # type: ignore[override]
+        if not isinstance(headers, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(headers)
+        return merged
+
+    def copy(self) -> MessageHeaders:
+        headers = MessageHeaders()
+        dict.update(headers, self)
+        return headers
 
     @property
     def message_id(self) -> str | None:
@@ -29,7 +81,7 @@ class MessageHeaders(UserDict, Mapping[str, str]):
 
     @property
     def message_type(self) -> str | None:
-        return self.get("message_type")
+        return self.get(self.message_type_key)
 
     @property
     def correlation_id(self) -> str | None:
@@ -43,3 +95,22 @@ class MessageHeaders(UserDict, Mapping[str, str]):
     @property
     def causation_id(self) -> str | None:
         return self.get(self.causation_id_key)
+
+
+_WELL_KNOWN_KEYS: dict[str, str] = {
+    key: key
+    for key in (
+        MessageHeaders.message_id_key,
+        MessageHeaders.message_type_key,
+        MessageHeaders.correlation_id_key,
+        MessageHeaders.correlation_sequence_key,
+        MessageHeaders.causation_id_key,
+        "sent_time",
+        "error_details",
+    )
+}
+
+
+def _key(key: object) -> str:
+    name = key if type(key) is str else str(key)
+    return _WELL_KNOWN_KEYS.get(name, name)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .message_headers import MessageHeaders
+
+__all__ = ("CachedMessageLabel",)
+
+
+class CachedMessageLabel:
+    """Provides `message_label`, built once per message type/id header pair.
+
+    The label is rebuilt only when the `message_type` or `message_id` header
+    changes (e.g. the id is assigned while sending), which is detected by
+    identity so reading a cached label allocates nothing.
+    """
+
+    __slots__ = ("_label", "_label_message_id", "_label_message_type")
+
+    headers: MessageHeaders
+    body: Any
+
+    def __init__(self) -> None:
+        self._label: str | None = None
+        self._label_message_type: str | None = None
+        self._label_message_id: str | None = None
+
+    @property
+    def message_label(self) -> str:
+        headers = self.headers
+        message_type = headers.get("message_type")
+        message_id = headers.get("message_id")
+        label = self._label
+        if label is not None and message_type is self._label_message_type and message_id is self._label_message_id:
+            return label
+
+        t = message_type
+        if not t:
+            try:
+                t = str(type(self.body))
+            except Exception:  # noqa: BLE001
+                t = "unknown"
+        label = self._label = f"{t}/{message_id}"
+        self._label_message_type = message_type
+        self._label_message_id = message_id
+        return label
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sys
+from typing import ClassVar
+
+__all__ = ("MessageTypeRegistry",)
+
+
+class MessageTypeRegistry:
+    """Maps message types to the names sent in the `message_type` header and back.
+
+    A type's name is `<module>:<qualified name>`. Types are registered when
+    handlers are registered for them and when they are sent; a name of an
+    unregistered type resolves only if its module is already imported, so a
+    header never causes a module to be imported.
+    """
+
+    _names: ClassVar[dict[type, str]] = {}
+    _types: ClassVar[dict[str, type]] = {}
+
+    @classmethod
+    def register(cls, message_type: type) -> str:
+        name = cls._names.get(message_type)
+        if name is None:
+            name = cls._names[message_type] = f"{message_type.__module__}:{message_type.__qualname__}"
+            cls._types[name] = message_type
+        return name
+
+    @classmethod
+    def is_registered(cls, name: str) -> bool:
+        return name in cls._types
+
+    @classmethod
+    def resolve(cls, name: str | None) -> type | None:
+        if name is None:
+            return None
+        message_type = cls._types.get(name)
+        if message_type is None:
+            message_type = cls._find_imported(name)
+            if message_type is not None:
+                cls.register(message_type)
+        return message_type
+
+    @staticmethod
+    def _find_imported(name: str) -> type | None:
+        module_name, _, qualname = name.partition(":")
+        obj: object = sys.modules.get(module_name)
+        if obj is None or not qualname:
+            return None
+        for part in qualname.split("."):
+            obj = getattr(obj, part, None)
+            if obj is None:
+                return None
+        return obj if isinstance(obj, type) else None
@@ -1,21 +1,15 @@
 from typing import Any
 
 from .message_headers import MessageHeaders
+from .message_label import CachedMessageLabel
 
 __all__ = ("TransportMessage",)
 
 
-class TransportMessage:
+class TransportMessage(CachedMessageLabel):
+    __slots__ = ("body", "headers")
+
     def __init__(self, body: Any, headers: MessageHeaders) -> None:
+        super().__init__()
         self.headers = headers
         self.body = body
-
-    @property
-    def message_label(self) -> str:
-        t = self.headers.message_type
-        if not t:
-            try:
-                t = str(type(self.body))
-            except Exception:  # noqa: BLE001
-                t = "unknown"
-        return f"{t}/{self.headers.message_id}"
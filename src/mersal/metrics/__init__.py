@@ -0,0 +1,18 @@
+from .config import MetricsConfig
+from .histogram import DEFAULT_LATENCY_BUCKETS, Histogram, HistogramSnapshot
+from .pipeline_metrics import MetricsSnapshot, PipelineMetrics, StepLatencyKey
+from .plugin import MetricsPlugin
+from .prometheus import PrometheusMetricsServer, render_prometheus_text
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "HistogramSnapshot",
+    "MetricsConfig",
+    "MetricsPlugin",
+    "MetricsSnapshot",
+    "PipelineMetrics",
+    "PrometheusMetricsServer",
+    "StepLatencyKey",
+    "render_prometheus_text",
+]
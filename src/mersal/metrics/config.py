@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .histogram import DEFAULT_LATENCY_BUCKETS
+from .plugin import MetricsPlugin
+
+__all__ = ("MetricsConfig",)
+
+
+@dataclass
+class MetricsConfig:
+    """Configuration for pipeline latency histograms and in-flight gauges."""
+
+    buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    """Upper bounds, in seconds, of the latency histogram buckets."""
+    prometheus_port: int | None = None
+    """Port of a `/metrics` endpoint in the Prometheus text format.
+
+    None (the default) doesn't serve one; 0 picks a free port.
+    """
+    prometheus_host: str = "127.0.0.1"
+    """Interface the Prometheus endpoint binds to."""
+
+    @property
+    def plugin(self) -> MetricsPlugin:
+        return MetricsPlugin(self)
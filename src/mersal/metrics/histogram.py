@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = (
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "HistogramSnapshot",
+)
+
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds, in seconds, of the default latency buckets."""
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    buckets: tuple[float, ...]
+    """Upper bounds of the buckets, excluding the implicit +Inf bucket."""
+    counts: tuple[int, ...]
+    """Observations per bucket, not cumulative; the last entry is the +Inf bucket."""
+    count: int
+    sum: float
+
+
+class Histogram:
+    """A fixed-bucket histogram.
+
+    Observing a value is a binary search over the bucket bounds and three
+    increments; nothing is allocated.
+    """
+
+    __slots__ = ("_counts", "buckets", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be strictly increasing")
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.buckets, tuple(self._counts), self.count, self.sum)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from functools import partial
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from mersal.messages import MessageTypeRegistry
+from mersal.pipeline import ConditionalStep, IncomingStepContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from mersal.pipeline import IncomingPipeline, OutgoingPipeline, OutgoingStepContext, PipelineInvoker
+    from mersal.pipeline.incoming_step import IncomingStep
+    from mersal.pipeline.outgoing_step import OutgoingStep
+    from mersal.types import AsyncAnyCallable
+
+    from .pipeline_metrics import PipelineMetrics
+
+__all__ = (
+    "MetricsPipeline",
+    "MetricsPipelineInvoker",
+    "MetricsStep",
+)
+
+
+_unknown = "unknown"
+
+
+def _incoming_message_type(context: IncomingStepContext) -> str:
+    return _message_type_label(context.transport_message.headers.message_type)
+
+
+def _outgoing_message_type(context: OutgoingStepContext) -> str:
+    return _message_type_label(context.logical_message.headers.message_type)
+
+
+def _message_type_label(name: str | None) -> str:
+    # The header is set by the sender; labelling with names of unregistered
+    # types would let any sender add label values without bound.
+    if name is None or not MessageTypeRegistry.is_registered(name):
+        return _unknown
+    return name
+
+
+class MetricsStep:
+    """Records the latency of a step, excluding the time spent in the steps after it."""
+
+    __slots__ = ("_message_type", "_metrics", "_name", "_pipeline", "_step")
+
+    def __init__(
+        self,
+        step: IncomingStep | OutgoingStep,
+        metrics: PipelineMetrics,
+        pipeline: str,
+        message_type: Callable[[Any], str],
+    ) -> None:
+        self._step = step
+        self._metrics = metrics
+        self._pipeline = pipeline
+        self._name = type(step).__name__
+        self._message_type = message_type
+
+    def applies_to(self, message_type: type) -> bool | None:
+        step = self._step
+        return step.applies_to(message_type) if isinstance(step, ConditionalStep) else True
+
+    async def __call__(self, context: IncomingStepContext | OutgoingStepContext, next_step: AsyncAnyCallable) -> None:
+        downstream = 0.0
+
+        async def timed_next_step() -> None:
+            nonlocal downstream
+            next_start = perf_counter()
+            try:
+                await next_step()
+            finally:
+                downstream += perf_counter() - next_start
+
+        outcome = "error"
+        start = perf_counter()
+        try:
+            await self._step(context, timed_next_step)  # type: ignore[arg-type]
+            outcome = "success"
+        finally:
+            elapsed = perf_counter() - start - downstream
+            self._metrics.observe(self._pipeline, self._name, self._message_type(context), outcome, elapsed)
+
+
+class MetricsPipeline:
+    def __init__(self, pipeline: IncomingPipeline | OutgoingPipeline, metrics: PipelineMetrics, name: str) -> None:
+        self._pipeline = pipeline
+        self._metrics = metrics
+        self._name = name
+        self._message_type: Callable[[Any], str] = (
+            _incoming_message_type if name == "incoming" else _outgoing_message_type
+        )
+
+    def __call__(self) -> Sequence[MetricsStep]:
+        return [MetricsStep(step, self._metrics, self._name, self._message_type) for step in self._pipeline()]
+
+
+class MetricsPipelineInvoker:
+    """Records whole pipeline invocations and tracks how many are in flight."""
+
+    def __init__(self, invoker: PipelineInvoker, metrics: PipelineMetrics) -> None:
+        self._invoker = invoker
+        self._metrics = metrics
+
+    async def __call__(self, context: IncomingStepContext | OutgoingStepContext) -> None:
+        message_type: Callable[[], str]
+        if isinstance(context, IncomingStepContext):
+            pipeline, message_type = "incoming", partial(_incoming_message_type, context)
+        else:
+            pipeline, message_type = "outgoing", partial(_outgoing_message_type, context)
+
+        metrics = self._metrics
+        metrics.enter(pipeline)
+        outcome = "error"
+        start = perf_counter()
+        try:
+            await self._invoker(context)
+            outcome = "success"
+        finally:
+            elapsed = perf_counter() - start
+            metrics.exit(pipeline)
+            metrics.observe(pipeline, metrics.pipeline_step, message_type(), outcome, elapsed)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .histogram import DEFAULT_LATENCY_BUCKETS, Histogram, HistogramSnapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+__all__ = (
+    "MetricsSnapshot",
+    "PipelineMetrics",
+    "StepLatencyKey",
+)
+
+
+@dataclass(frozen=True)
+class StepLatencyKey:
+    pipeline: str
+    """`incoming` or `outgoing`."""
+    step: str
+    """The step's class name, or `pipeline` for a whole pipeline invocation."""
+    message_type: str
+    """The `message_type` header if it names a type known to `MessageTypeRegistry`, else `unknown`."""
+    outcome: str
+    """`success` or `error`."""
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    latencies: Mapping[StepLatencyKey, HistogramSnapshot]
+    """Latency histograms in seconds; a step's latency excludes the steps after it."""
+    in_flight: Mapping[str, int]
+    """Pipeline invocations currently running, per pipeline."""
+    concurrency_limits: Mapping[str, int]
+    """Messages each worker is currently allowed to handle concurrently, per worker."""
+
+
+class PipelineMetrics:
+    """Latency histograms and in-flight gauges of the message pipelines.
+
+    Workers register their (possibly adaptive) concurrency limit with
+    `track_concurrency_limit`, it is read when a snapshot is taken.
+
+    Recording is a dict lookup and a histogram observation, so it is cheap
+    enough to be left on in production; read it with `snapshot()`.
+    """
+
+    pipeline_step = "pipeline"
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._latencies: dict[tuple[str, str, str, str], Histogram] = {}
+        self._in_flight: dict[str, int] = {"incoming": 0, "outgoing": 0}
+        self._concurrency_limits: dict[str, Callable[[], int]] = {}
+
+    def observe(self, pipeline: str, step: str, message_type: str, outcome: str, seconds: float) -> None:
+        key = (pipeline, step, message_type, outcome)
+        histogram = self._latencies.get(key)
+        if histogram is None:
+            histogram = self._latencies[key] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def enter(self, pipeline: str) -> None:
+        self._in_flight[pipeline] = self._in_flight.get(pipeline, 0) + 1
+
+    def exit(self, pipeline: str) -> None:
+        self._in_flight[pipeline] -= 1
+
+    def track_concurrency_limit(self, worker: str, limit: Callable[[], int]) -> None:
+        self._concurrency_limits[worker] = limit
+
+    def snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            latencies={StepLatencyKey(*key): histogram.snapshot() for key, histogram in list(self._latencies.items())},
+            in_flight=dict(self._in_flight),
+            concurrency_limits={worker: limit() for worker, limit in list(self._concurrency_limits.items())},
+        )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mersal.lifespan.lifespan_hooks_registration_plugin import LifespanHooksRegistrationPluginConfig
+from mersal.pipeline import IncomingPipeline, OutgoingPipeline, PipelineInvoker
+from mersal.plugins import Plugin
+from mersal.utils.sync import AsyncCallable
+
+from .metrics_steps import MetricsPipeline, MetricsPipelineInvoker
+from .pipeline_metrics import PipelineMetrics
+from .prometheus import PrometheusMetricsServer
+
+if TYPE_CHECKING:
+    from mersal.configuration import StandardConfigurator
+
+    from .config import MetricsConfig
+
+__all__ = ("MetricsPlugin",)
+
+
+class MetricsPlugin(Plugin):
+    """Wraps the pipeline invoker and every pipeline step to record latencies.
+
+    The steps are wrapped when the pipelines are built, so the plugin has to
+    run after plugins injecting steps relative to others (which look steps up
+    by type); pass the config as `Mersal(metrics=...)` to get that ordering.
+    """
+
+    def __init__(self, config: MetricsConfig) -> None:
+        self._config = config
+        self.metrics = PipelineMetrics(config.buckets)
+
+    def __call__(self, configurator: StandardConfigurator) -> None:
+        def decorate_incoming_pipeline(configurator: StandardConfigurator) -> MetricsPipeline:
+            pipeline = configurator.get(IncomingPipeline)  # type: ignore[type-abstract]
+            return MetricsPipeline(pipeline, self.metrics, "incoming")
+
+        def decorate_outgoing_pipeline(configurator: StandardConfigurator) -> MetricsPipeline:
+            pipeline = configurator.get(OutgoingPipeline)  # type: ignore[type-abstract]
+            return MetricsPipeline(pipeline, self.metrics, "outgoing")
+
+        def decorate_pipeline_invoker(configurator: StandardConfigurator) -> MetricsPipelineInvoker:
+            invoker = configurator.get(PipelineInvoker)  # type: ignore[type-abstract]
+            return MetricsPipelineInvoker(invoker, self.metrics)
+
+        configurator.register(PipelineMetrics, lambda _: self.metrics)
+        configurator.decorate(IncomingPipeline, decorate_incoming_pipeline)
+        configurator.decorate(OutgoingPipeline, decorate_outgoing_pipeline)
+        configurator.decorate(PipelineInvoker, decorate_pipeline_invoker)
+
+        if self._config.prometheus_port is None:
+            return
+
+        server = PrometheusMetricsServer(self.metrics, self._config.prometheus_host, self._config.prometheus_port)
+        configurator.register(PrometheusMetricsServer, lambda _: server)
+        LifespanHooksRegistrationPluginConfig(
+            on_startup_hooks=[lambda _: AsyncCallable(server.start)],
+            on_shutdown_hooks=[lambda _: AsyncCallable(server.stop)],
+        ).plugin(configurator)
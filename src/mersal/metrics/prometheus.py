@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING
+
+import anyio
+from anyio.abc import SocketAttribute
+
+if TYPE_CHECKING:
+    from anyio.abc import SocketStream
+
+    from .pipeline_metrics import MetricsSnapshot, PipelineMetrics
+
+__all__ = (
+    "PrometheusMetricsServer",
+    "render_prometheus_text",
+)
+
+
+_STEP_METRIC = "mersal_step_duration_seconds"
+_PIPELINE_METRIC = "mersal_pipeline_duration_seconds"
+_IN_FLIGHT_METRIC = "mersal_pipeline_in_flight"
+_CONCURRENCY_LIMIT_METRIC = "mersal_worker_concurrency_limit"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def render_prometheus_text(snapshot: MetricsSnapshot, pipeline_step: str = "pipeline") -> str:
+    """Render a metrics snapshot in the Prometheus text exposition format (version 0.0.4)."""
+    lines: dict[str, list[str]] = {_PIPELINE_METRIC: [], _STEP_METRIC: []}
+    for key, histogram in sorted(snapshot.latencies.items(), key=lambda item: repr(item[0])):
+        metric = _PIPELINE_METRIC if key.step == pipeline_step else _STEP_METRIC
+        labels = f'pipeline="{_escape(key.pipeline)}",message_type="{_escape(key.message_type)}"'
+        if metric == _STEP_METRIC:
+            labels += f',step="{_escape(key.step)}"'
+        labels += f',outcome="{_escape(key.outcome)}"'
+
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+            cumulative += count
+            lines[metric].append(f'{metric}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+        lines[metric].append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines[metric].append(f"{metric}_sum{{{labels}}} {histogram.sum!r}")
+        lines[metric].append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+    output = [
+        f"# HELP {_PIPELINE_METRIC} Duration of message pipeline invocations.",
+        f"# TYPE {_PIPELINE_METRIC} histogram",
+        *lines[_PIPELINE_METRIC],
+        f"# HELP {_STEP_METRIC} Duration of pipeline steps, excluding the steps after them.",
+        f"# TYPE {_STEP_METRIC} histogram",
+        *lines[_STEP_METRIC],
+        f"# HELP {_IN_FLIGHT_METRIC} Message pipeline invocations in progress.",
+        f"# TYPE {_IN_FLIGHT_METRIC} gauge",
+        *(f'{_IN_FLIGHT_METRIC}{{pipeline="{_escape(p)}"}} {n}' for p, n in sorted(snapshot.in_flight.items())),
+        f"# HELP {_CONCURRENCY_LIMIT_METRIC} Messages a worker is currently allowed to handle concurrently.",
+        f"# TYPE {_CONCURRENCY_LIMIT_METRIC} gauge",
+        *(
+            f'{_CONCURRENCY_LIMIT_METRIC}{{worker="{_escape(w)}"}} {n}'
+            for w, n in sorted(snapshot.concurrency_limits.items())
+        ),
+    ]
+    return "\n".join(output) + "\n"
+
+
+class PrometheusMetricsServer:
+    """Serves `GET /metrics` in the Prometheus text format over plain HTTP.
+
+    Meant for a local scrape endpoint; it binds to localhost by default.
+    """
+
+    _max_request_size = 8192
+    _request_timeout = 5.0
+
+    def __init__(self, metrics: PipelineMetrics, host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._exit_stack: AsyncExitStack | None = None
+
+    async def start(self) -> None:
+        listener = await anyio.create_tcp_listener(local_host=self.host, local_port=self.port)
+        self.port = listener.extra(SocketAttribute.local_port)
+        self._exit_stack = AsyncExitStack()
+        await self._exit_stack.enter_async_context(listener)
+        task_group = await self._exit_stack.enter_async_context(anyio.create_task_group())
+        self._exit_stack.callback(task_group.cancel_scope.cancel)
+        task_group.start_soon(listener.serve, self._handle)
+
+    async def stop(self) -> None:
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+
+    async def _handle(self, stream: SocketStream) -> None:
+        async with stream:
+            request = b""
+            with anyio.move_on_after(self._request_timeout):
+                try:
+                    while b"\r\n\r\n" not in request and len(request) < self._max_request_size:
+                        request += await stream.receive()
+                except (anyio.EndOfStream, anyio.BrokenResourceError):
+                    return
+
+            method, _, rest = request.partition(b" ")
+            path = rest.split(b" ", 1)[0].split(b"?", 1)[0]
+            if method == b"GET" and path == b"/metrics":
+                status = b"200 OK"
+                content_type = b"text/plain; version=0.0.4; charset=utf-8"
+                body = render_prometheus_text(self.metrics.snapshot(), self.metrics.pipeline_step).encode("utf-8")
+            else:
+                status = b"404 Not Found"
+                content_type = b"text/plain; charset=utf-8"
+                body = b"Not Found\n"
+
+            response = (
+                b"HTTP/1.1 " + status + b"\r\n"
+                b"Content-Type: " + content_type + b"\r\n"
+                b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n"
+                b"Connection: close\r\n\r\n" + body
+            )
+            try:
+                await stream.send(response)
+            except anyio.BrokenResourceError:
+                return
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 __all__ = [
+    "FileSystemBlobStore",
     "FileSystemMessageTracker",
     "FileSystemSagaStorage",
     "FileSystemSubscriptionStorage",
 ]
 
+from .file_system_blob_store import FileSystemBlobStore
 from .file_system_message_tracker import FileSystemMessageTracker
 from .file_system_saga_storage import FileSystemSagaStorage
 from .file_system_subscription_storage import FileSystemSubscriptionStorage
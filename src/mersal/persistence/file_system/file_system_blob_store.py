@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import anyio
+
+from mersal.claim_check import BlobStore
+from mersal.exceptions import MersalExceptionError
+from mersal.utils import KeyedLock
+
+__all__ = ("FileSystemBlobStore",)
+
+
+class FileSystemBlobStore(BlobStore):
+    """Stores message bodies as files.
+
+    Payloads are content addressed, identical payloads share a single file. Each outstanding claim is a
+    separate (empty) file and a payload is removed once no claims refer to it.
+
+    Adding and releasing claims on a payload is serialised through a lock file so that several processes
+    can share the directory. The lock is taken by hard linking a file named after its owner to the lock
+    path, which fails atomically if the lock is held. A lock left behind by a crashed process is broken
+    once it is older than ``stale_lock_timeout`` seconds; it is first moved aside under the breaker's
+    name, so that of several processes breaking the same lock only one succeeds, and put back if it
+    turns out to be a fresh lock. Tasks of the same process wait on an in-process lock rather than the
+    lock file, other processes are waited for without blocking the event loop. File I/O is done on a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        base_directory: str | Path,
+        stale_lock_timeout: float = 30,
+        lock_retry_interval: float = 0.01,
+    ) -> None:
+        base_directory = Path(base_directory) / "blobs"
+        self._blobs_directory = base_directory / "data"
+        self._claims_directory = base_directory / "claims"
+        self._locks_directory = base_directory / "locks"
+        self._stale_lock_timeout = stale_lock_timeout
+        self._lock_retry_interval = lock_retry_interval
+        self._local_locks = KeyedLock()
+
+    async def __call__(self) -> None:
+        await anyio.to_thread.run_sync(self._create_directories)
+
+    async def put(self, data: bytes, claims: int = 1) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        token = uuid.uuid4().hex
+        temporary_path = await anyio.to_thread.run_sync(self._write_temporary, digest, token, data)
+        async with self._lock(digest):
+            await anyio.to_thread.run_sync(self._add_claims, digest, token, claims, temporary_path)
+        return f"{digest}.{token}"
+
+    async def get(self, key: str) -> bytes:
+        data = await anyio.to_thread.run_sync(self._get, key)
+        if data is None:
+            raise MersalExceptionError(f"No blob stored for key {key}")
+        return data
+
+    async def release(self, key: str) -> None:
+        digest, _, token = key.partition(".")
+        async with self._lock(digest):
+            await anyio.to_thread.run_sync(self._release, digest, token)
+
+    def _create_directories(self) -> None:
+        for directory in (self._blobs_directory, self._claims_directory, self._locks_directory):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def _write_temporary(self, digest: str, token: str, data: bytes) -> Path:
+        temporary_path = self._blobs_directory / f"{digest}.{token}.tmp"
+        temporary_path.write_bytes(data)
+        return temporary_path
+
+    def _add_claims(self, digest: str, token: str, claims: int, temporary_path: Path) -> None:
+        claims_directory = self._claims_directory / digest
+        claims_directory.mkdir(exist_ok=True)
+        for i in range(claims):
+            (claims_directory / f"{token}.{i}").touch()
+        os.replace(temporary_path, self._blobs_directory / digest)
+
+    def _get(self, key: str) -> bytes | None:
+        digest, _, token = key.partition(".")
+        if next((self._claims_directory / digest).glob(f"{token}.*"), None) is None:
+            return None
+        try:
+            return (self._blobs_directory / digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _release(self, digest: str, token: str) -> None:
+        claims_directory = self._claims_directory / digest
+        claim = next(iter(sorted(claims_directory.glob(f"{token}.*"))), None)
+        if claim is None:
+            return
+        claim.unlink()
+        if next(claims_directory.iterdir(), None) is not None:
+            return
+        claims_directory.rmdir()
+        (self._blobs_directory / digest).unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def _lock(self, digest: str) -> AsyncIterator[None]:
+        path = self._locks_directory / f"{digest}.lock"
+        owner = f"{digest}.{os.getpid()}.{uuid.uuid4().hex}.owner"
+        async with self._local_locks.lock(digest):
+            try:
+                while not await anyio.to_thread.run_sync(self._try_lock, path, owner):
+                    await anyio.sleep(self._lock_retry_interval)
+                yield
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await anyio.to_thread.run_sync(self._unlock, path, owner)
+
+    def _try_lock(self, path: Path, owner: str) -> bool:
+        owner_path = self._locks_directory / owner
+        owner_path.touch()
+        try:
+            os.link(owner_path, path)
+        except FileExistsError:
+            self._break_stale_lock(path, owner)
+            return False
+        return True
+
+    def _unlock(self, path: Path, owner: str) -> None:
+        owner_path = self._locks_directory / owner
+        try:
+            held = path.samefile(owner_path)
+        except FileNotFoundError:
+            held = False
+        if held:
+            path.unlink()
+        owner_path.unlink(missing_ok=True)
+
+    def _break_stale_lock(self, path: Path, owner: str) -> None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        if time.time() - stat.st_mtime <= self._stale_lock_timeout:
+            return
+
+        broken_path = self._locks_directory / f"{owner}.broken"
+        try:
+            os.replace(path, broken_path)
+        except FileNotFoundError:
+            # Another process broke it first.
+            return
+        try:
+            if broken_path.stat().st_ino == stat.st_ino:
+                return
+            # The stale lock was broken and taken again in the meantime, hand the fresh one back.
+            try:
+                os.link(broken_path, path)
+            except FileExistsError:
+                pass
+        finally:
+            broken_path.unlink(missing_ok=True)
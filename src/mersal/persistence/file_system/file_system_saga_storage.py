@@ -3,7 +3,6 @@ from __future__ import annotations
 import importlib
 import json
 import uuid
-from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -44,7 +43,7 @@ class FileSystemSagaStorage(SagaStorage):
                 continue
 
             if hasattr(saga_data.data, property_name) and getattr(saga_data.data, property_name) == property_value:
-                return deepcopy(saga_data)
+                return saga_data
 
         return None
 
@@ -62,7 +61,7 @@ class FileSystemSagaStorage(SagaStorage):
         if saga_data.revision != 0:
             raise MersalExceptionError("Inserted data must have revision=0")
 
-        self._write_saga(path, deepcopy(saga_data))
+        self._write_saga(path, saga_data)
 
     async def update(
         self,
@@ -79,9 +78,7 @@ class FileSystemSagaStorage(SagaStorage):
         if not current_saga_data.revision == saga_data.revision:
             raise ConcurrencyExceptionError("Concurrency issues, different revisios")
 
-        _copy = deepcopy(saga_data)
-        _copy.revision += 1
-        self._write_saga(path, _copy)
+        self._write_saga(path, saga_data, revision=saga_data.revision + 1)
         saga_data.revision += 1
 
     async def delete(self, saga_data: SagaData, transaction_context: TransactionContext) -> None:
@@ -98,8 +95,11 @@ class FileSystemSagaStorage(SagaStorage):
         data = json.loads(path.read_text(encoding="utf-8"))
         return _deserialize_saga_data(data)
 
-    def _write_saga(self, path: Path, saga_data: SagaData) -> None:
+    def _write_saga(self, path: Path, saga_data: SagaData, revision: int | None = None) -> None:
+        # Saga data is serialized, never stored, so no copy of it is needed.
         data = _serialize_saga_data(saga_data)
+        if revision is not None:
+            data["revision"] = revision
         path.write_text(json.dumps(data), encoding="utf-8")
 
     def _read_all(self) -> list[SagaData]:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 __all__ = [
+    "InMemoryBlobStore",
     "InMemoryMessageTracker",
     "InMemorySagaStorage",
     "InMemorySubscriptionStorage",
     "InMemorySubscriptionStore",
 ]
 
+from .in_memory_blob_store import InMemoryBlobStore
 from .in_memory_message_tracker import InMemoryMessageTracker
 from .in_memory_saga_storage import InMemorySagaStorage
 from .in_memory_subscription_storage import (
@@ -0,0 +1,60 @@
+import hashlib
+import uuid
+
+from mersal.claim_check import BlobStore
+from mersal.exceptions import MersalExceptionError
+
+__all__ = ("InMemoryBlobStore",)
+
+
+class InMemoryBlobStore(BlobStore):
+    """Stores message bodies in memory.
+
+    Identical payloads are stored once regardless of how many messages refer
+    to them.
+    """
+
+    def __init__(self) -> None:
+        self._blobs: dict[str, bytes] = {}
+        self._claims: dict[str, int] = {}
+        self._keys_per_digest: dict[str, int] = {}
+
+    async def __call__(self) -> None:
+        pass
+
+    async def put(self, data: bytes, claims: int = 1) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        key = f"{digest}.{uuid.uuid4().hex}"
+        self._blobs.setdefault(digest, data)
+        self._claims[key] = claims
+        self._keys_per_digest[digest] = self._keys_per_digest.get(digest, 0) + 1
+        return key
+
+    async def get(self, key: str) -> bytes:
+        blob = self._blobs.get(self._digest(key))
+        if blob is None or key not in self._claims:
+            raise MersalExceptionError(f"No blob stored for key {key}")
+        return blob
+
+    async def release(self, key: str) -> None:
+        remaining = self._claims.get(key)
+        if remaining is None:
+            return
+        if remaining > 1:
+            self._claims[key] = remaining - 1
+            return
+        del self._claims[key]
+        digest = self._digest(key)
+        keys = self._keys_per_digest[digest] - 1
+        if keys:
+            self._keys_per_digest[digest] = keys
+            return
+        del self._keys_per_digest[digest]
+        self._blobs.pop(digest, None)
+
+    @property
+    def blobs_count(self) -> int:
+        return len(self._blobs)
+
+    def _digest(self, key: str) -> str:
+        return key.partition(".")[0]
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 from mersal.exceptions import MersalExceptionError
 from mersal.exceptions.base_exceptions import ConcurrencyExceptionError
 from mersal.sagas.saga_storage import SagaStorage
+from mersal.sagas.snapshot_strategy import DeepCopySnapshotStrategy, SnapshotStrategy
 
 if TYPE_CHECKING:
     import uuid
@@ -18,8 +18,15 @@ __all__ = ("InMemorySagaStorage",)
 
 
 class InMemorySagaStorage(SagaStorage):
-    def __init__(self) -> None:
+    def __init__(self, snapshot_strategy: SnapshotStrategy | None = None) -> None:
+        """Store saga data in memory.
+
+        Args:
+            snapshot_strategy: How data is copied in and out of the storage,
+                defaults to :class:`DeepCopySnapshotStrategy`.
+        """
         self._store: dict[uuid.UUID, SagaData] = {}
+        self._snapshot = snapshot_strategy if snapshot_strategy is not None else DeepCopySnapshotStrategy()
 
     async def __call__(self) -> None:
         self._store = {}
@@ -33,7 +40,7 @@ class InMemorySagaStorage(SagaStorage):
                 continue
 
             if hasattr(data.data, property_name) and getattr(data.data, property_name) == property_value:
-                return deepcopy(data)
+                return self._snapshot(data)
 
         return None
 
@@ -50,7 +57,7 @@ class InMemorySagaStorage(SagaStorage):
         if saga_data.revision != 0:
             raise MersalExceptionError("Inserted data must have revision=0")
 
-        self._store[saga_data.id] = deepcopy(saga_data)
+        self._store[saga_data.id] = self._snapshot(saga_data)
 
     async def update(
         self,
@@ -66,7 +73,7 @@ class InMemorySagaStorage(SagaStorage):
         if not current_saga_data.revision == saga_data.revision:
             raise ConcurrencyExceptionError("Concurrency issues, different revisios")
 
-        _copy = deepcopy(saga_data)
+        _copy = self._snapshot(saga_data)
         _copy.revision += 1
         self._store[saga_data.id] = _copy
         saga_data.revision += 1
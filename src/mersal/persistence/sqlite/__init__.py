@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+__all__ = ["SqliteSagaStorage"]
+
+from .sqlite_saga_storage import SqliteSagaStorage
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import importlib
+import json
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import anyio
+
+from mersal.exceptions import MersalExceptionError
+from mersal.exceptions.base_exceptions import ConcurrencyExceptionError
+from mersal.sagas.saga_data import SagaData
+from mersal.sagas.saga_storage import SagaStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from mersal.sagas import CorrelationProperty
+    from mersal.transport import TransactionContext
+
+__all__ = ("SqliteSagaStorage",)
+
+T = TypeVar("T")
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sagas (
+        id TEXT PRIMARY KEY,
+        saga_type TEXT NOT NULL,
+        revision INTEGER NOT NULL,
+        data TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS saga_index (
+        saga_type TEXT NOT NULL,
+        property_name TEXT NOT NULL,
+        value TEXT NOT NULL,
+        saga_id TEXT NOT NULL,
+        PRIMARY KEY (saga_type, property_name, value)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS saga_index_saga_id ON saga_index (saga_id)",
+)
+
+
+@dataclass
+class _PendingWrite:
+    statements: list[tuple[str, tuple[Any, ...]]]
+    expected_revision: int | None = None
+
+
+class SqliteSagaStorage(SagaStorage):
+    """A `SagaStorage` backed by a SQLite database in WAL mode.
+
+    Correlation property values are kept in a side table with a unique
+    index on (saga type, property, value), so finding a saga and checking
+    that correlation values are unique are single indexed lookups. Unset
+    (`None`) values are not indexed and so don't have to be unique.
+
+    Writes are validated eagerly and applied when the transaction context
+    commits, in one SQLite transaction. `update` raises
+    `ConcurrencyExceptionError` if the stored revision is no longer the one
+    that was loaded, which `LoadSagaDataStep` resolves through the saga's
+    `resolve_conflict`. A conflicting update committed after that check,
+    by another transaction or process, is only detected on commit: the
+    commit raises `ConcurrencyExceptionError`, the transaction fails and
+    the message is redelivered and handled against the fresh data. Enable
+    `SagaConfig.lock_sagas` to avoid such conflicts within a process.
+
+    Properties that were never saved as correlation properties of a saga
+    type, and unset values, are looked up by scanning the stored JSON of
+    that type.
+
+    SQLite calls run on a worker thread, one at a time, so they don't block
+    the event loop.
+    """
+
+    _pending_writes_key = "sqlite-saga-storage-pending-writes"
+
+    def __init__(self, path: str | Path, timeout: float = 5.0) -> None:
+        self._path = Path(path)
+        self._timeout = timeout
+        self._connection: sqlite3.Connection | None = None
+        self._indexed_properties: set[tuple[str, str]] = set()
+        self._limiter: anyio.CapacityLimiter | None = None
+
+    async def __call__(self) -> None:
+        await self._run(self._create_schema)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def find_using_id(self, saga_data_type: type, message_id: uuid.UUID) -> SagaData | None:
+        return await self._run(partial(self._find_using_id, saga_data_type, message_id))
+
+    async def find(self, saga_data_type: type, property_name: str, property_value: Any) -> SagaData | None:
+        return await self._run(partial(self._find, saga_data_type, property_name, property_value))
+
+    async def insert(
+        self,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+        transaction_context: TransactionContext,
+    ) -> None:
+        write, index_rows = await self._run(partial(self._prepare_insert, saga_data, correlation_properties))
+        self._enqueue(write, index_rows, transaction_context)
+
+    async def update(
+        self,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+        transaction_context: TransactionContext,
+    ) -> None:
+        write, index_rows = await self._run(partial(self._prepare_update, saga_data, correlation_properties))
+        self._enqueue(write, index_rows, transaction_context)
+        saga_data.revision += 1
+
+    async def delete(self, saga_data: SagaData, transaction_context: TransactionContext) -> None:
+        saga_id = str(saga_data.id)
+        statements: list[tuple[str, tuple[Any, ...]]] = [
+            ("DELETE FROM saga_index WHERE saga_id = ?", (saga_id,)),
+            ("DELETE FROM sagas WHERE id = ?", (saga_id,)),
+        ]
+        self._enqueue(_PendingWrite(statements), [], transaction_context)
+        saga_data.revision += 1
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(1)
+        return await anyio.to_thread.run_sync(func, limiter=self._limiter)
+
+    def _create_schema(self) -> None:
+        connection = self._connect()
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        self._indexed_properties = set(
+            connection.execute("SELECT DISTINCT saga_type, property_name FROM saga_index").fetchall()
+        )
+
+    def _find_using_id(self, saga_data_type: type, message_id: uuid.UUID) -> SagaData | None:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT id, revision, data FROM sagas WHERE id = ? AND saga_type = ?",
+                (str(message_id), _type_name(saga_data_type)),
+            )
+            .fetchone()
+        )
+        return _deserialize_saga_data(row) if row is not None else None
+
+    def _find(self, saga_data_type: type, property_name: str, property_value: Any) -> SagaData | None:
+        saga_type = _type_name(saga_data_type)
+        connection = self._connect()
+        if property_value is not None and (saga_type, property_name) in self._indexed_properties:
+            row = connection.execute(
+                "SELECT s.id, s.revision, s.data FROM saga_index i JOIN sagas s ON s.id = i.saga_id "
+                "WHERE i.saga_type = ? AND i.property_name = ? AND i.value = ?",
+                (saga_type, property_name, _index_value(property_value)),
+            ).fetchone()
+            return _deserialize_saga_data(row) if row is not None else None
+
+        for row in connection.execute("SELECT id, revision, data FROM sagas WHERE saga_type = ?", (saga_type,)):
+            saga_data = _deserialize_saga_data(row)
+            if getattr(saga_data.data, property_name, _missing) == property_value:
+                return saga_data
+        return None
+
+    def _prepare_insert(
+        self, saga_data: SagaData, correlation_properties: Sequence[CorrelationProperty]
+    ) -> tuple[_PendingWrite, list[tuple[str, str, str, str]]]:
+        saga_id = str(saga_data.id)
+        if self._stored_revision(saga_id) is not None:
+            raise MersalExceptionError("SagaData already exist")
+        if saga_data.revision != 0:
+            raise MersalExceptionError("Inserted data must have revision=0")
+
+        saga_type = _type_name(type(saga_data.data))
+        index_rows = self._index_rows(saga_id, saga_type, saga_data, correlation_properties)
+        self._verify_correlation_properties_uniqueness(saga_id, index_rows)
+
+        statements = [
+            (
+                "INSERT INTO sagas (id, saga_type, revision, data) VALUES (?, ?, ?, ?)",
+                (saga_id, saga_type, 0, _serialize_data(saga_data.data)),
+            ),
+            *self._index_statements(saga_id, index_rows),
+        ]
+        return _PendingWrite(statements), index_rows
+
+    def _prepare_update(
+        self, saga_data: SagaData, correlation_properties: Sequence[CorrelationProperty]
+    ) -> tuple[_PendingWrite, list[tuple[str, str, str, str]]]:
+        saga_id = str(saga_data.id)
+        stored_revision = self._stored_revision(saga_id)
+        if stored_revision is None:
+            raise MersalExceptionError("Saga couldn't be found")
+        if stored_revision != saga_data.revision:
+            raise ConcurrencyExceptionError("Concurrency issues, different revisios")
+
+        saga_type = _type_name(type(saga_data.data))
+        index_rows = self._index_rows(saga_id, saga_type, saga_data, correlation_properties)
+        self._verify_correlation_properties_uniqueness(saga_id, index_rows)
+
+        statements = [
+            (
+                "UPDATE sagas SET revision = ?, data = ? WHERE id = ? AND revision = ?",
+                (saga_data.revision + 1, _serialize_data(saga_data.data), saga_id, saga_data.revision),
+            ),
+            *self._index_statements(saga_id, index_rows),
+        ]
+        return _PendingWrite(statements, saga_data.revision), index_rows
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection = connection
+        return self._connection
+
+    def _stored_revision(self, saga_id: str) -> int | None:
+        row = self._connect().execute("SELECT revision FROM sagas WHERE id = ?", (saga_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _index_rows(
+        self,
+        saga_id: str,
+        saga_type: str,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+    ) -> list[tuple[str, str, str, str]]:
+        rows: dict[str, tuple[str, str, str, str]] = {}
+        for correlation_property in correlation_properties:
+            property_name = correlation_property.property_name
+            if property_name in rows:
+                continue
+            value = getattr(saga_data.data, property_name, None)
+            if value is None:
+                continue
+            rows[property_name] = (saga_type, property_name, _index_value(value), saga_id)
+        return list(rows.values())
+
+    def _index_statements(
+        self, saga_id: str, index_rows: list[tuple[str, str, str, str]]
+    ) -> list[tuple[str, tuple[Any, ...]]]:
+        statements: list[tuple[str, tuple[Any, ...]]] = [("DELETE FROM saga_index WHERE saga_id = ?", (saga_id,))]
+        statements.extend(
+            ("INSERT INTO saga_index (saga_type, property_name, value, saga_id) VALUES (?, ?, ?, ?)", row)
+            for row in index_rows
+        )
+        return statements
+
+    def _verify_correlation_properties_uniqueness(
+        self, saga_id: str, index_rows: list[tuple[str, str, str, str]]
+    ) -> None:
+        connection = self._connect()
+        for saga_type, property_name, value, _ in index_rows:
+            row = connection.execute(
+                "SELECT saga_id FROM saga_index WHERE saga_type = ? AND property_name = ? AND value = ?",
+                (saga_type, property_name, value),
+            ).fetchone()
+            if row is not None and row[0] != saga_id:
+                raise MersalExceptionError("Correlation properties are not unique!")
+
+    def _enqueue(
+        self,
+        write: _PendingWrite,
+        index_rows: list[tuple[str, str, str, str]],
+        transaction_context: TransactionContext,
+    ) -> None:
+        pending_writes: list[_PendingWrite] | None = transaction_context.items.get(self._pending_writes_key)
+        if pending_writes is None:
+            pending_writes = []
+            transaction_context.items[self._pending_writes_key] = pending_writes
+
+            async def commit(_: TransactionContext) -> None:
+                await self._run(partial(self._commit, pending_writes))
+
+            transaction_context.on_commit(commit)
+
+        pending_writes.append(write)
+        self._indexed_properties.update((saga_type, property_name) for saga_type, property_name, _, _ in index_rows)
+
+    def _commit(self, pending_writes: list[_PendingWrite]) -> None:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for write in pending_writes:
+                for index, (statement, parameters) in enumerate(write.statements):
+                    cursor = connection.execute(statement, parameters)
+                    if index == 0 and write.expected_revision is not None and cursor.rowcount == 0:
+                        raise ConcurrencyExceptionError("Concurrency issues, different revisios")
+        except sqlite3.IntegrityError as e:
+            connection.execute("ROLLBACK")
+            raise MersalExceptionError("Correlation properties are not unique!") from e
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+
+_missing = object()
+
+
+def _type_name(data_type: type) -> str:
+    return f"{data_type.__module__}:{data_type.__qualname__}"
+
+
+def _index_value(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _serialize_data(data_obj: Any) -> str:
+    data_type = type(data_obj)
+    return json.dumps(
+        {
+            "data": vars(data_obj) if hasattr(data_obj, "__dict__") else data_obj,
+            "data_type_module": data_type.__module__,
+            "data_type_name": data_type.__qualname__,
+        }
+    )
+
+
+def _deserialize_saga_data(row: tuple[str, int, str]) -> SagaData:
+    saga_id, revision, serialized = row
+    raw = json.loads(serialized)
+    module = importlib.import_module(raw["data_type_module"])
+    data_type = getattr(module, raw["data_type_name"])
+    data_dict = raw["data"]
+    data_obj = data_type(**data_dict) if isinstance(data_dict, dict) else data_dict
+    return SagaData(id=uuid.UUID(saga_id), revision=revision, data=data_obj)
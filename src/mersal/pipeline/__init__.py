@@ -1,3 +1,4 @@
+from .conditional_step import ConditionalStep
 from .default_pipeline import DefaultIncomingPipeline, DefaultOutgoingPipeline
 from .incoming_step_context import IncomingStepContext
 from .iterative_pipeline_invoker import IterativePipelineInvoker
@@ -14,10 +15,16 @@ from .send.destination_addresses import DestinationAddresses
 from .send.flow_correlation_step import FlowCorrelationStep
 from .send.send_outgoing_message_step import SendOutgoingMessageStep
 from .send.serialize_outgoing_message_step import SerializeOutgoingMessageStep
-from .send.set_default_headers_step import MessageIdGenerator, SetDefaultHeadersStep
+from .send.set_default_headers_step import (
+    IsoTimestampClock,
+    MessageIdGenerator,
+    SetDefaultHeadersStep,
+    TimeOrderedMessageIdGenerator,
+)
 
 __all__ = [
     "ActivateHandlersStep",
+    "ConditionalStep",
     "DefaultIncomingPipeline",
     "DefaultOutgoingPipeline",
     "DeserializeIncomingMessageStep",
@@ -26,6 +33,7 @@ __all__ = [
     "FlowCorrelationStep",
     "IncomingPipeline",
     "IncomingStepContext",
+    "IsoTimestampClock",
     "IterativePipelineInvoker",
     "MessageContext",
     "MessageIdGenerator",
@@ -39,4 +47,5 @@ __all__ = [
     "SendOutgoingMessageStep",
     "SerializeOutgoingMessageStep",
     "SetDefaultHeadersStep",
+    "TimeOrderedMessageIdGenerator",
 ]
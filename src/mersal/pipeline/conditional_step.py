@@ -0,0 +1,66 @@
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+__all__ = (
+    "ConditionalStep",
+    "ConditionalStepsFilter",
+)
+
+
+StepT = TypeVar("StepT")
+
+
+@runtime_checkable
+class ConditionalStep(Protocol):
+    """A step that only needs to run for some message types.
+
+    Pipeline invokers skip the step for messages of types it doesn't apply
+    to. `applies_to` may return None while it can't tell yet, the step then
+    runs; once it returns a bool for a message type, that answer is cached
+    and must not change.
+    """
+
+    def applies_to(self, message_type: type) -> bool | None: ...
+
+
+class ConditionalStepsFilter:
+    """Selects the steps of a pipeline that apply to a message type.
+
+    The selection is cached per message type as indexes into the pipeline,
+    so it stays valid when the steps at those positions are swapped for
+    decorated ones. Decorating steps should forward `applies_to` to the
+    step they decorate.
+    """
+
+    def __init__(self, steps: Sequence[Any]) -> None:
+        self._steps = steps
+        self._has_conditional_steps = any(isinstance(step, ConditionalStep) for step in steps)
+        # None when all the steps apply.
+        self._indexes: dict[type, tuple[int, ...] | None] = {}
+
+    def __call__(self, message_type: type | None) -> Sequence[Any]:
+        steps = self._steps
+        if message_type is None or not self._has_conditional_steps:
+            return steps
+        try:
+            indexes = self._indexes[message_type]
+        except KeyError:
+            indexes = self._select(message_type)
+        if indexes is None:
+            return steps
+        return [steps[index] for index in indexes]
+
+    def _select(self, message_type: type) -> tuple[int, ...] | None:
+        indexes: list[int] = []
+        decided = True
+        for index, step in enumerate(self._steps):
+            applies = step.applies_to(message_type) if isinstance(step, ConditionalStep) else True
+            if applies is None:
+                decided = False
+            if applies is not False:
+                indexes.append(index)
+
+        selected = None if len(indexes) == len(self._steps) else tuple(indexes)
+        if decided:
+            self._indexes[message_type] = selected
+        return selected
@@ -1,13 +1,24 @@
-from mersal.messages import TransportMessage
+from typing import ClassVar
+
+from mersal.messages import LogicalMessage, TransportMessage
 from mersal.transport import TransactionContext
 
+from .receive.handler_invokers import HandlerInvokers
 from .step_context import StepContext
 
 __all__ = ("IncomingStepContext",)
 
 
 class IncomingStepContext(StepContext):
+    __slots__ = ("handler_invokers", "logical_message", "transaction_context", "transport_message")
+
     step_context_key = "incoming_step_context"
+    _slot_names: ClassVar[dict[type, str]] = {
+        TransportMessage: "transport_message",
+        LogicalMessage: "logical_message",
+        TransactionContext: "transaction_context",
+        HandlerInvokers: "handler_invokers",
+    }
 
     def __init__(
         self,
@@ -15,6 +26,10 @@ class IncomingStepContext(StepContext):
         transaction_context: TransactionContext,
     ) -> None:
         super().__init__()
-        self.save(message)
-        self.save(transaction_context, TransactionContext)
+        self.transport_message = message
+        self.transaction_context = transaction_context
+        # None until the message is deserialized and its handlers are activated,
+        # typed like the result of `load`.
+        self.logical_message: LogicalMessage = None  # type: ignore[assignment]
+        self.handler_invokers: HandlerInvokers = None  # type: ignore[assignment]
         transaction_context.items[self.step_context_key] = self
@@ -1,9 +1,11 @@
 from collections.abc import Sequence
 
+from mersal.messages import MessageTypeRegistry
 from mersal.pipeline.incoming_step import IncomingStep
 from mersal.pipeline.outgoing_step import OutgoingStep
 from mersal.types.callable_types import AsyncAnyCallable
 
+from .conditional_step import ConditionalStepsFilter
 from .incoming_step_context import IncomingStepContext
 from .outgoing_step_context import OutgoingStepContext
 from .pipeline import IncomingPipeline, OutgoingPipeline
@@ -20,10 +22,12 @@ class IterativePipelineInvoker(PipelineInvoker):
     def __init__(self, incoming_pipeline: IncomingPipeline, outgoing_pipeline: OutgoingPipeline) -> None:
         self.incoming_steps = incoming_pipeline()
         self.outgoing_steps = outgoing_pipeline()
+        self._incoming_steps_filter = ConditionalStepsFilter(self.incoming_steps)
 
     async def __call__(self, context: IncomingStepContext | OutgoingStepContext) -> None:
         if isinstance(context, IncomingStepContext):
-            await self._invoke_incoming_pipeline(self.incoming_steps, context)
+            message_type = MessageTypeRegistry.resolve(context.transport_message.headers.message_type)
+            await self._invoke_incoming_pipeline(self._incoming_steps_filter(message_type), context)
         elif isinstance(context, OutgoingStepContext):
             await self._invoke_outgoing_pipeline(self.outgoing_steps, context)
 
@@ -1,4 +1,6 @@
-from mersal.messages import LogicalMessage
+from typing import ClassVar
+
+from mersal.messages import LogicalMessage, TransportMessage
 from mersal.transport import TransactionContext
 
 from .send.destination_addresses import DestinationAddresses
@@ -8,6 +10,15 @@ __all__ = ("OutgoingStepContext",)
 
 
 class OutgoingStepContext(StepContext):
+    __slots__ = ("destination_addresses", "logical_message", "transaction_context", "transport_message")
+
+    _slot_names: ClassVar[dict[type, str]] = {
+        LogicalMessage: "logical_message",
+        TransportMessage: "transport_message",
+        TransactionContext: "transaction_context",
+        DestinationAddresses: "destination_addresses",
+    }
+
     def __init__(
         self,
         message: LogicalMessage,
@@ -15,6 +26,8 @@ class OutgoingStepContext(StepContext):
         destination_addresses: DestinationAddresses,
     ) -> None:
         super().__init__()
-        self.save(message)
-        self.save(transaction_context, TransactionContext)
-        self.save(destination_addresses)
+        self.logical_message = message
+        self.transaction_context = transaction_context
+        self.destination_addresses = destination_addresses
+        # None until the message is serialized.
+        self.transport_message: TransportMessage | None = None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from mersal.messages import BatchMessage, LogicalMessage
@@ -11,6 +11,8 @@ from mersal.pipeline.receive.saga_handler_invoker import SagaHandlerInvoker
 from mersal.transport import TransactionContext
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from mersal.activation import HandlerActivator
     from mersal.pipeline.incoming_step_context import IncomingStepContext
     from mersal.types import AsyncAnyCallable
@@ -18,53 +20,65 @@ if TYPE_CHECKING:
 __all__ = ("ActivateHandlersStep",)
 
 
-@dataclass
-class _HandlerWithMessage:
-    message: Any
-    handler: Any
-
-
 class ActivateHandlersStep(IncomingStep):
     def __init__(self, handler_activator: HandlerActivator) -> None:
+        from mersal.sagas.saga import SagaBase
+
         self.handler_activator = handler_activator
+        # Optional on the HandlerActivator protocol; without it, bodies are
+        # deserialized to resolve handlers from the message.
+        self._get_handlers_for_type: Callable[[type, TransactionContext], Awaitable[Sequence[Any]]] | None = getattr(
+            handler_activator, "get_handlers_for_type", None
+        )
+        self._saga_base = SagaBase
+        # Whether a handler type is a saga, resolved once per handler type.
+        self._is_saga_handler_type: dict[type, bool] = {}
 
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
-        transaction_context = context.load(TransactionContext)  # type: ignore[type-abstract]
-        logical_message = context.load(LogicalMessage)
-        message = logical_message.body
-        handlers_with_message: list[_HandlerWithMessage] = []
-
-        messages = message.messages if isinstance(message, BatchMessage) else [message]
+        transaction_context = context.transaction_context
+        logical_message = context.logical_message
+        message_type = logical_message.body_type
 
-        for m in messages:
-            handlers_with_message.extend(
-                [
-                    _HandlerWithMessage(m, handler)
-                    for handler in await self.handler_activator.get_handlers(m, transaction_context)
-                ]
-            )
         _handler_invokers: list[HandlerInvoker | SagaHandlerInvoker] = []
-        for _handler_with_message in handlers_with_message:
-
-            async def action(_handler_with_message: _HandlerWithMessage = _handler_with_message) -> None:
-                _handler = _handler_with_message.handler
-                _message = _handler_with_message.message
-                await _handler(_message)
-
-            handler_invoker = HandlerInvoker(
-                action,
-                _handler_with_message.handler,
-                transaction_context,
-            )
-
-            from mersal.sagas.saga import SagaBase
-
-            if isinstance(_handler_with_message.handler, SagaBase):
-                invoker = SagaHandlerInvoker(_handler_with_message.handler, handler_invoker)
-                _handler_invokers.append(invoker)
-            else:
-                _handler_invokers.append(handler_invoker)
-
-        handler_invokers = HandlerInvokers(logical_message, _handler_invokers)
-        context.save(handler_invokers)
+        if message_type is BatchMessage:
+            for m in logical_message.body.messages:
+                for handler in await self.handler_activator.get_handlers(m, transaction_context):
+                    self._add_invoker(_handler_invokers, handler, partial(handler, m), transaction_context)
+        elif self._get_handlers_for_type is not None:
+            # Handlers are resolved from the message type alone; the body is only
+            # deserialized when the first handler is invoked.
+            for handler in await self._get_handlers_for_type(message_type, transaction_context):
+                action = partial(_invoke_with_body, handler, logical_message)
+                self._add_invoker(_handler_invokers, handler, action, transaction_context)
+        else:
+            body = logical_message.body
+            for handler in await self.handler_activator.get_handlers(body, transaction_context):
+                self._add_invoker(_handler_invokers, handler, partial(handler, body), transaction_context)
+
+        context.handler_invokers = HandlerInvokers(logical_message, _handler_invokers)
         await next_step()
+
+    def _add_invoker(
+        self,
+        handler_invokers: list[HandlerInvoker | SagaHandlerInvoker],
+        handler: Any,
+        action: AsyncAnyCallable,
+        transaction_context: TransactionContext,
+    ) -> None:
+        handler_invoker = HandlerInvoker(action, handler, transaction_context)
+        if self._is_saga_handler(handler):
+            handler_invokers.append(SagaHandlerInvoker(handler, handler_invoker))
+        else:
+            handler_invokers.append(handler_invoker)
+
+    def _is_saga_handler(self, handler: object) -> bool:
+        handler_type = type(handler)
+        is_saga = self._is_saga_handler_type.get(handler_type)
+        if is_saga is None:
+            is_saga = self._is_saga_handler_type[handler_type] = isinstance(handler, self._saga_base)
+        return is_saga
+
+
+def _invoke_with_body(handler: Any, logical_message: LogicalMessage) -> Awaitable[Any]:
+    invocation: Awaitable[Any] = handler(logical_message.body)
+    return invocation
@@ -1,4 +1,3 @@
-from mersal.messages import TransportMessage
 from mersal.pipeline.incoming_step import IncomingStep
 from mersal.pipeline.incoming_step_context import IncomingStepContext
 from mersal.serialization import MessageSerializer
@@ -12,10 +11,6 @@ class DeserializeIncomingMessageStep(IncomingStep):
         self.serializer = serializer
 
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
-        transport_message = context.load(TransportMessage)
-
-        message = await self.serializer.deserialize(transport_message)
-
-        context.save(message)
+        context.logical_message = await self.serializer.deserialize(context.transport_message)
 
         await next_step()
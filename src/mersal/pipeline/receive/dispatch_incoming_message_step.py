@@ -1,8 +1,6 @@
 from mersal.exceptions import MersalExceptionError
-from mersal.messages import LogicalMessage
 from mersal.pipeline.incoming_step import IncomingStep
 from mersal.pipeline.incoming_step_context import IncomingStepContext
-from mersal.pipeline.receive.handler_invokers import HandlerInvokers
 from mersal.types import AsyncAnyCallable
 
 __all__ = ("DispatchIncomingMessageStep",)
@@ -10,12 +8,12 @@ __all__ = ("DispatchIncomingMessageStep",)
 
 class DispatchIncomingMessageStep(IncomingStep):
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
-        invokers: HandlerInvokers = context.load(HandlerInvokers)
-        logical_message = context.load(LogicalMessage)
-        message = logical_message.body
+        invokers = context.handler_invokers
         if not invokers:
+            logical_message = context.logical_message
             raise MersalExceptionError(
-                f"Message {type(message)}/{logical_message.message_label} was not dispatched to any handlers"
+                f"Message {logical_message.body_type}/{logical_message.message_label} "
+                "was not dispatched to any handlers"
             )
 
         for invoker in invokers:
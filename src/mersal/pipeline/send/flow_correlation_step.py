@@ -1,12 +1,9 @@
 from collections.abc import Callable
 from typing import cast
 
-from mersal.messages import LogicalMessage
 from mersal.messages.message_headers import MessageHeaders
-from mersal.messages.transport_message import TransportMessage
 from mersal.pipeline.incoming_step_context import IncomingStepContext
 from mersal.pipeline.outgoing_step_context import OutgoingStepContext
-from mersal.transport.transaction_context import TransactionContext
 
 __all__ = ("FlowCorrelationStep",)
 
@@ -15,13 +12,10 @@ class FlowCorrelationStep:
     """A send step to inject correlation headers."""
 
     async def __call__(self, context: OutgoingStepContext, next_step: Callable) -> None:
-        logical_message: LogicalMessage = context.load(LogicalMessage)
-        headers = logical_message.headers
-
-        transaction_context = context.load(TransactionContext)  # type: ignore[type-abstract]
+        headers = context.logical_message.headers
         incoming_step_context = cast(
             "IncomingStepContext | None",
-            transaction_context.items.get(IncomingStepContext.step_context_key),
+            context.transaction_context.items.get(IncomingStepContext.step_context_key),
         )
         if not headers.get(MessageHeaders.correlation_id_key):
             (
@@ -42,7 +36,7 @@ class FlowCorrelationStep:
         sent_message_headers: MessageHeaders,
     ) -> tuple[str | None, int]:
         if incoming_step_context:
-            incoming_message_headers = incoming_step_context.load(TransportMessage).headers
+            incoming_message_headers = incoming_step_context.transport_message.headers
             correlation_id = (
                 incoming_message_headers.correlation_id
                 if incoming_message_headers.correlation_id is not None
@@ -67,5 +61,5 @@ class FlowCorrelationStep:
         sent_message_headers: MessageHeaders,
     ) -> str | None:
         if incoming_step_context:
-            return incoming_step_context.load(TransportMessage).headers.message_id
+            return incoming_step_context.transport_message.headers.message_id
         return sent_message_headers.message_id
@@ -1,9 +1,8 @@
 from collections.abc import Callable
 
-from mersal.messages import TransportMessage
+from mersal.exceptions import MersalExceptionError
 from mersal.pipeline.outgoing_step_context import OutgoingStepContext
-from mersal.pipeline.send.destination_addresses import DestinationAddresses
-from mersal.transport import TransactionContext, Transport
+from mersal.transport import Transport
 
 __all__ = ("SendOutgoingMessageStep",)
 
@@ -13,11 +12,11 @@ class SendOutgoingMessageStep:
         self._transport = transport
 
     async def __call__(self, context: OutgoingStepContext, next_step: Callable) -> None:
-        transport_message = context.load(TransportMessage)
-        destination_addresses = context.load(DestinationAddresses)
-
-        transaction_context = context.load(TransactionContext)  # type: ignore[type-abstract]
-        for address in destination_addresses:
+        transport_message = context.transport_message
+        if transport_message is None:
+            raise MersalExceptionError("The message must be serialized before it is sent")
+        transaction_context = context.transaction_context
+        for address in context.destination_addresses:
             await self._transport.send(address, transport_message, transaction_context)
 
         await next_step()
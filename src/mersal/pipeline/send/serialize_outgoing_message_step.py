@@ -1,6 +1,5 @@
 from collections.abc import Callable
 
-from mersal.messages import LogicalMessage
 from mersal.pipeline.outgoing_step_context import OutgoingStepContext
 from mersal.serialization import MessageSerializer
 
@@ -8,12 +7,17 @@ __all__ = ("SerializeOutgoingMessageStep",)
 
 
 class SerializeOutgoingMessageStep:
+    """A send step to serialize the logical message.
+
+    Messages that enter the pipeline already serialized (a `TransportMessage`
+    is present in the context) are passed through unchanged.
+    """
+
     def __init__(self, serializer: MessageSerializer):
         self.serializer = serializer
 
     async def __call__(self, context: OutgoingStepContext, next_step: Callable) -> None:
-        logical_message = context.load(LogicalMessage)
-        transport_message = await self.serializer.serialize(logical_message)
-        context.save(transport_message)
+        if context.transport_message is None:
+            context.transport_message = await self.serializer.serialize(context.logical_message)
 
         await next_step()
@@ -1,14 +1,19 @@
+import random
+import threading
+import time
 import uuid
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, Protocol
 
-from mersal.messages import LogicalMessage
+from mersal.messages import LogicalMessage, MessageTypeRegistry
 from mersal.pipeline.outgoing_step_context import OutgoingStepContext
 
 __all__ = (
+    "IsoTimestampClock",
     "MessageIdGenerator",
     "SetDefaultHeadersStep",
+    "TimeOrderedMessageIdGenerator",
 )
 
 
@@ -18,20 +23,95 @@ class MessageIdGenerator(Protocol):
     def __call__(self, message: LogicalMessage) -> Any: ...
 
 
+class TimeOrderedMessageIdGenerator:
+    """Generates time-ordered, UUIDv7 formatted message ids.
+
+    Ids start with the Unix time in milliseconds followed by a 12 bit counter
+    (RFC 9562, method 1), so ids generated by one generator are strictly
+    increasing and ids from different processes sort roughly by send time,
+    keeping index inserts in tables keyed by message id append-only. The
+    remaining 62 bits are random. Ids are returned as strings.
+    """
+
+    _counter_bits = 12
+    _max_counter = (1 << _counter_bits) - 1
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+        self._random = random.Random()
+
+    def __call__(self, message: LogicalMessage) -> str:
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self._last_ms:
+                self._last_ms = ms
+                # Start low in the counter range, leaving room for ids in the same millisecond.
+                self._counter = self._random.getrandbits(self._counter_bits - 1)
+            else:
+                self._counter += 1
+                if self._counter > self._max_counter:
+                    # Counter exhausted: borrow the next millisecond to stay monotonic.
+                    self._last_ms += 1
+                    self._counter = 0
+            ms = self._last_ms
+            counter = self._counter
+            random_bits = self._random.getrandbits(62)
+
+        value = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class IsoTimestampClock:
+    """Formats the current UTC time like `datetime.now(UTC).isoformat()`.
+
+    The date and time up to the second are formatted once per second and
+    reused, only the microseconds are formatted per call. The second and its
+    formatted prefix are replaced together as one tuple, so the clock can be
+    called from several threads without a lock.
+    """
+
+    def __init__(self) -> None:
+        self._cached: tuple[int, str] | None = None
+
+    def __call__(self) -> str:
+        second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        cached = self._cached
+        if cached is not None and cached[0] == second:
+            prefix = cached[1]
+        else:
+            prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+            self._cached = (second, prefix)
+        microseconds = nanoseconds // 1000
+        if microseconds:
+            return f"{prefix}.{microseconds:06d}+00:00"
+        return f"{prefix}+00:00"
+
+
 class SetDefaultHeadersStep:
     """A send step to inject default message headers if they don't exist."""
 
-    def __init__(self, message_id_generator: MessageIdGenerator | None = None):
+    def __init__(
+        self,
+        message_id_generator: MessageIdGenerator | None = None,
+        clock: Callable[[], str] | None = None,
+    ):
         self.message_id_generator = message_id_generator if message_id_generator else lambda _: uuid.uuid4()
+        self.clock = clock if clock else IsoTimestampClock()
 
     async def __call__(self, context: OutgoingStepContext, next_step: Callable) -> None:
-        logical_message: LogicalMessage = context.load(LogicalMessage)
+        logical_message = context.logical_message
         headers = logical_message.headers
 
         if not headers.get("message_id"):
             headers["message_id"] = self.message_id_generator(logical_message)
 
         if not headers.get("sent_time"):
-            headers["sent_time"] = datetime.now(UTC).isoformat()
+            headers["sent_time"] = self.clock()
+
+        if not headers.get("message_type"):
+            headers["message_type"] = MessageTypeRegistry.register(type(logical_message.body))
 
         await next_step()
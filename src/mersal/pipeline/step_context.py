@@ -1,4 +1,4 @@
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 __all__ = ("StepContext",)
 
@@ -7,7 +7,17 @@ T = TypeVar("T")
 
 
 class StepContext:
+    """Items shared by the steps of one pipeline invocation.
+
+    Subclasses keep their well-known items in slots, listed by item type in
+    `_slot_names`; `save` and `load` go through those slots for these types,
+    so steps may use either the attributes or `save`/`load`.
+    """
+
+    __slots__ = ("_items", "_items_keys")
+
     step_context_key = "step_context"
+    _slot_names: ClassVar[dict[type, str]] = {}
 
     def __init__(self) -> None:
         self._items: dict[type, Any] = {}
@@ -15,7 +25,11 @@ class StepContext:
 
     def save(self, instance: Any, instance_type: type | None = None) -> None:
         _type = instance_type if instance_type else type(instance)
-        self._items[_type] = instance
+        slot_name = self._slot_names.get(_type)
+        if slot_name is None:
+            self._items[_type] = instance
+        else:
+            setattr(self, slot_name, instance)
 
     def save_keys(self, key: str, value: Any) -> None:
         self._items_keys[key] = value
@@ -23,7 +37,10 @@ class StepContext:
     def load(self, instance_type: type[T]) -> T:
         # Actually returns None when instance_type was never saved; callers that may hit
         # that case are expected to falsy-check the result despite the non-Optional type.
-        return cast("T", self._items.get(instance_type))
+        slot_name = self._slot_names.get(instance_type)
+        if slot_name is None:
+            return cast("T", self._items.get(instance_type))
+        return cast("T", getattr(self, slot_name))
 
     def load_keys(self, key: str) -> Any:
         return self._items_keys.get(key)
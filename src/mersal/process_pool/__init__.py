@@ -0,0 +1,12 @@
+from .config import ProcessPoolConfig
+from .plugin import ProcessPoolPlugin
+from .process_pool_handler import ProcessPoolHandler, process_pool_handler_factory
+from .process_pool_handler_executor import ProcessPoolHandlerExecutor
+
+__all__ = [
+    "ProcessPoolConfig",
+    "ProcessPoolHandler",
+    "ProcessPoolHandlerExecutor",
+    "ProcessPoolPlugin",
+    "process_pool_handler_factory",
+]
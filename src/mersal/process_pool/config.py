@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mersal.process_pool.plugin import ProcessPoolPlugin
+
+__all__ = ("ProcessPoolConfig",)
+
+
+@dataclass
+class ProcessPoolConfig:
+    """Configuration for running handlers in a process pool."""
+
+    max_workers: int | None = None
+    """Number of worker processes, defaults to the number of CPUs."""
+    max_pending: int | None = None
+    """Maximum number of handler invocations submitted to the pool at once, defaults to twice `max_workers`."""
+    start_method: str = "spawn"
+    """Multiprocessing start method of the worker processes."""
+
+    @property
+    def plugin(self) -> ProcessPoolPlugin:
+        return ProcessPoolPlugin(self)
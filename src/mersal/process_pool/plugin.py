@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mersal.lifespan.lifespan_hooks_registration_plugin import (
+    LifespanHooksRegistrationPluginConfig,
+)
+from mersal.plugins import Plugin
+from mersal.process_pool.process_pool_handler_executor import (
+    ProcessPoolHandlerExecutor,
+)
+from mersal.utils.sync import AsyncCallable
+
+if TYPE_CHECKING:
+    from mersal.configuration import StandardConfigurator
+    from mersal.process_pool.config import ProcessPoolConfig
+
+__all__ = ("ProcessPoolPlugin",)
+
+
+class ProcessPoolPlugin(Plugin):
+    def __init__(self, config: ProcessPoolConfig):
+        self._executor = ProcessPoolHandlerExecutor(
+            max_workers=config.max_workers,
+            max_pending=config.max_pending,
+            start_method=config.start_method,
+        )
+
+    def __call__(self, configurator: StandardConfigurator) -> None:
+        configurator.register(ProcessPoolHandlerExecutor, lambda _: self._executor)
+
+        plugin = LifespanHooksRegistrationPluginConfig(
+            on_startup_hooks=[lambda _: AsyncCallable(self._executor.start)],
+            on_shutdown_hooks=[lambda _: AsyncCallable(self._executor.stop)],
+        ).plugin
+        plugin(configurator)
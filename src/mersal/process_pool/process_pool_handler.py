@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from mersal._activation.handler_activator import HandlerFactory
+    from mersal.core.app import Mersal
+    from mersal.pipeline import MessageContext
+    from mersal.process_pool.process_pool_handler_executor import (
+        ProcessPoolHandlerExecutor,
+    )
+
+__all__ = (
+    "ProcessPoolHandler",
+    "process_pool_handler_factory",
+)
+
+MessageT = TypeVar("MessageT")
+
+
+class ProcessPoolHandler(Generic[MessageT]):
+    """Message handler that runs the wrapped handler in a process pool.
+
+    The wrapped handler and the message are pickled to the worker process, so
+    both must be picklable and the handler can not rely on anything that only
+    exists in the receiving process (the app, the message context, the
+    transaction). Its return value and exceptions are passed back unchanged.
+    """
+
+    def __init__(self, handler: Any, executor: ProcessPoolHandlerExecutor) -> None:
+        self.handler = handler
+        self._executor = executor
+
+    @property
+    def __wrapped__(self) -> Any:
+        # Lets `inspect.unwrap` find the registered handler, e.g. to classify it by type.
+        return self.handler
+
+    async def __call__(self, message: MessageT) -> Any:
+        return await self._executor.run(self.handler, message)
+
+
+def process_pool_handler_factory(factory: HandlerFactory[MessageT]) -> HandlerFactory[MessageT]:
+    """Wrap a handler factory so that the handlers it creates run in the app's process pool.
+
+    Requires the app to be configured with :class:`ProcessPoolConfig`.
+    """
+    from mersal.exceptions import MersalExceptionError
+    from mersal.process_pool.process_pool_handler_executor import (
+        ProcessPoolHandlerExecutor,
+    )
+
+    def create(message_context: MessageContext, app: Mersal) -> Any:
+        executor = app.configurator.get_optional(ProcessPoolHandlerExecutor)
+        if executor is None:
+            raise MersalExceptionError(
+                "Handler registered to run in a process pool but the app has no ProcessPoolConfig plugin."
+            )
+        return ProcessPoolHandler(factory(message_context, app), executor)
+
+    return create
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from mersal.exceptions import MersalExceptionError
+from mersal.utils.predicates import is_async_callable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ("ProcessPoolHandlerExecutor",)
+
+
+class ProcessPoolHandlerExecutor:
+    """Runs message handlers in a pool of worker processes.
+
+    At most ``max_pending`` handler invocations are submitted to the pool at
+    any time; further invocations wait for a slot, which applies backpressure
+    to the worker instead of growing the pool's queue without bound.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        start_method: str = "spawn",
+    ) -> None:
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.max_pending = max_pending if max_pending is not None else 2 * self.max_workers
+        self._start_method = start_method
+        self._executor: ProcessPoolExecutor | None = None
+        self._limiter = anyio.CapacityLimiter(self.max_pending)
+        # Threads waiting on pool futures; one per pending invocation.
+        self._thread_limiter = anyio.CapacityLimiter(self.max_pending)
+
+    async def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self._start_method),
+        )
+
+    async def stop(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await anyio.to_thread.run_sync(lambda: executor.shutdown(wait=True, cancel_futures=True))
+
+    @property
+    def pending(self) -> int:
+        return int(self._limiter.borrowed_tokens)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool and return its result.
+
+        Async callables are run in a fresh event loop in the worker process.
+        Exceptions raised in the worker are re-raised in the caller.
+        """
+        async with self._limiter:
+            if self._executor is None:
+                raise MersalExceptionError("ProcessPoolHandlerExecutor used before it was started.")
+            future = self._executor.submit(_invoke, fn, *args)
+            try:
+                return await anyio.to_thread.run_sync(
+                    future.result,
+                    abandon_on_cancel=True,
+                    limiter=self._thread_limiter,
+                )
+            except anyio.get_cancelled_exc_class():
+                future.cancel()
+                raise
+
+
+def _invoke(fn: Callable[..., Any], *args: Any) -> Any:
+    if is_async_callable(fn):
+        return anyio.run(fn, *args)
+    return fn(*args)
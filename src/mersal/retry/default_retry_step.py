@@ -1,12 +1,11 @@
 import pdb  # noqa: T100
 import sys
-from copy import deepcopy
 from typing import Any
 
+from mersal.exceptions import MessageDeferredError
 from mersal.logging import Logger
-from mersal.messages import TransportMessage
+from mersal.messages import MessageHeaders, TransportMessage
 from mersal.pipeline import IncomingStepContext
-from mersal.transport import TransactionContext
 from mersal.transport.transaction_scope import TransactionScope
 from mersal.types import AsyncAnyCallable
 
@@ -34,15 +33,18 @@ class DefaultRetryStep(RetryStep):
         self.pdb_on_exception = pdb_on_exception
 
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
-        transport_message = context.load(TransportMessage)
-
-        transaction_context: TransactionContext = context.load(TransactionContext)  # type: ignore[type-abstract]
+        transport_message = context.transport_message
+        transaction_context = context.transaction_context
 
         message_id: Any = transport_message.headers.message_id
 
         try:
             await next_step()
             transaction_context.set_result(commit=True, ack=True)
+        except MessageDeferredError as e:
+            self.logger.debug("retry.deferred", message=transport_message.message_label, message_id=message_id)
+            transaction_context.items[MessageDeferredError.transaction_context_key] = e.delay
+            transaction_context.set_result(commit=False, ack=False)
         except Exception as e:
             if self.pdb_on_exception:
                 pdb.post_mortem(sys.exc_info()[2])
@@ -58,7 +60,9 @@ class DefaultRetryStep(RetryStep):
                 self.logger.exception(
                     "retry.deadletter", message=transport_message.message_label, message_id=message_id
                 )
-                await self._handle_poisonous_message(transport_message, message_id)
+                # Steps may replace the received message (e.g. to restore a
+                # claim-checked body), dead-letter the latest version of it.
+                await self._handle_poisonous_message(context.transport_message, message_id)
                 transaction_context.set_result(commit=False, ack=True)
             else:
                 transaction_context.set_result(commit=False, ack=False)
@@ -75,7 +79,9 @@ class DefaultRetryStep(RetryStep):
             exception = Exception("--".join(str(e) for e in exceptions))
         else:
             exception = Exception("Message failed too many times")
-        message = deepcopy(transport_message)
+        # The error handler adds headers to the message; copy them rather than
+        # the whole message, the body isn't modified.
+        message = TransportMessage(transport_message.body, MessageHeaders(transport_message.headers))
         await self._pass_to_deadletter_queue(message, exception)
         await self.error_tracker.clean_up(message_id)
 
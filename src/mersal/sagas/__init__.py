@@ -1,13 +1,27 @@
+from .cached_saga_storage import CachedSagaStorage
 from .config import SagaConfig
 from .correlation_property import CorrelationProperty
 from .saga import SagaBase
 from .saga_data import SagaData
+from .saga_metadata import SagaMetadata
 from .saga_storage import SagaStorage
+from .snapshot_strategy import (
+    DataclassReplaceSnapshotStrategy,
+    DeepCopySnapshotStrategy,
+    PickleSnapshotStrategy,
+    SnapshotStrategy,
+)
 
 __all__ = [
+    "CachedSagaStorage",
     "CorrelationProperty",
+    "DataclassReplaceSnapshotStrategy",
+    "DeepCopySnapshotStrategy",
+    "PickleSnapshotStrategy",
     "SagaBase",
     "SagaConfig",
     "SagaData",
+    "SagaMetadata",
     "SagaStorage",
+    "SnapshotStrategy",
 ]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from mersal.exceptions.base_exceptions import ConcurrencyExceptionError
+from mersal.sagas.saga_storage import SagaStorage
+from mersal.sagas.snapshot_strategy import DeepCopySnapshotStrategy, SnapshotStrategy
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Hashable, Sequence
+
+    from mersal.sagas.correlation_property import CorrelationProperty
+    from mersal.sagas.saga_data import SagaData
+    from mersal.transport import TransactionContext
+
+__all__ = ("CachedSagaStorage",)
+
+
+class CachedSagaStorage(SagaStorage):
+    """An in-process LRU cache in front of a `SagaStorage`.
+
+    Saga data is cached by id and by the correlation lookups that found it,
+    so consecutive messages for the same saga skip the storage read. Writes
+    go to the decorated storage and the written data is cached once the
+    transaction commits. A stale entry (the saga was changed by another
+    process) fails the storage's revision check on update; the entry is
+    then evicted and the `ConcurrencyExceptionError` propagates so the
+    caller reloads the saga.
+    """
+
+    def __init__(
+        self,
+        storage: SagaStorage,
+        max_size: int,
+        snapshot_strategy: SnapshotStrategy | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._storage = storage
+        self._snapshot = snapshot_strategy if snapshot_strategy is not None else DeepCopySnapshotStrategy()
+        self._max_size = max_size
+        self._entries: OrderedDict[uuid.UUID, SagaData] = OrderedDict()
+        self._correlations: dict[Hashable, uuid.UUID] = {}
+        self._correlations_by_id: dict[uuid.UUID, set[Hashable]] = {}
+
+    async def __call__(self) -> None:
+        self._clear()
+        await self._storage()
+
+    async def find_using_id(self, saga_data_type: type, message_id: uuid.UUID) -> SagaData | None:
+        saga_data = self._get(message_id)
+        if saga_data is not None:
+            return self._snapshot(saga_data)
+
+        saga_data = await self._storage.find_using_id(saga_data_type, message_id)
+        if saga_data is not None:
+            self._put(saga_data)
+        return saga_data
+
+    async def find(self, saga_data_type: type, property_name: str, property_value: Any) -> SagaData | None:
+        key = (saga_data_type, property_name, property_value)
+        try:
+            saga_id = self._correlations.get(key)
+        except TypeError:  # unhashable correlation value, not cacheable
+            return await self._storage.find(saga_data_type, property_name, property_value)
+
+        if saga_id is not None:
+            saga_data = self._get(saga_id)
+            if saga_data is not None:
+                if getattr(saga_data.data, property_name, None) == property_value:
+                    return self._snapshot(saga_data)
+                # the correlation property changed since it was looked up
+                del self._correlations[key]
+                self._correlations_by_id[saga_id].discard(key)
+
+        saga_data = await self._storage.find(saga_data_type, property_name, property_value)
+        if saga_data is not None:
+            self._put(saga_data, key)
+        return saga_data
+
+    async def insert(
+        self,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+        transaction_context: TransactionContext,
+    ) -> None:
+        await self._storage.insert(saga_data, correlation_properties, transaction_context)
+        self._put_on_commit(saga_data, correlation_properties, transaction_context)
+
+    async def update(
+        self,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+        transaction_context: TransactionContext,
+    ) -> None:
+        try:
+            await self._storage.update(saga_data, correlation_properties, transaction_context)
+        except ConcurrencyExceptionError:
+            self._evict(saga_data.id)
+            raise
+
+        self._put_on_commit(saga_data, correlation_properties, transaction_context)
+
+    async def delete(self, saga_data: SagaData, transaction_context: TransactionContext) -> None:
+        self._evict(saga_data.id)
+        await self._storage.delete(saga_data, transaction_context)
+
+    def _put_on_commit(
+        self,
+        saga_data: SagaData,
+        correlation_properties: Sequence[CorrelationProperty],
+        transaction_context: TransactionContext,
+    ) -> None:
+        # Until the write commits the cached entry may be ahead of or behind storage.
+        self._entries.pop(saga_data.id, None)
+        snapshot = self._snapshot(saga_data)
+        keys = [
+            (type(snapshot.data), p.property_name, getattr(snapshot.data, p.property_name, None))
+            for p in correlation_properties
+        ]
+
+        async def put(_: TransactionContext) -> None:
+            self._put(snapshot, copy=False)
+            for key in keys:
+                self._index(key, snapshot.id)
+
+        async def forget(_: TransactionContext) -> None:
+            self._forget_correlations(snapshot.id)
+
+        transaction_context.on_commit(put)
+        transaction_context.on_rollback(forget)
+
+    def _get(self, saga_id: uuid.UUID) -> SagaData | None:
+        saga_data = self._entries.get(saga_id)
+        if saga_data is not None:
+            self._entries.move_to_end(saga_id)
+        return saga_data
+
+    def _put(self, saga_data: SagaData, key: Hashable | None = None, copy: bool = True) -> None:
+        self._entries[saga_data.id] = self._snapshot(saga_data) if copy else saga_data
+        self._entries.move_to_end(saga_data.id)
+        if key is not None:
+            self._index(key, saga_data.id)
+
+        while len(self._entries) > self._max_size:
+            oldest, _ = self._entries.popitem(last=False)
+            self._forget_correlations(oldest)
+
+    def _index(self, key: Hashable, saga_id: uuid.UUID) -> None:
+        try:
+            self._correlations[key] = saga_id
+        except TypeError:  # unhashable correlation value
+            return
+        self._correlations_by_id.setdefault(saga_id, set()).add(key)
+
+    def _evict(self, saga_id: uuid.UUID) -> None:
+        self._entries.pop(saga_id, None)
+        self._forget_correlations(saga_id)
+
+    def _forget_correlations(self, saga_id: uuid.UUID) -> None:
+        for key in self._correlations_by_id.pop(saga_id, ()):
+            if self._correlations.get(key) == saga_id:
+                del self._correlations[key]
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._correlations.clear()
+        self._correlations_by_id.clear()
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from mersal.sagas.correlation_error_handler import CorrelationErrorHandler
 from mersal.sagas.plugin import SagaPlugin
 from mersal.sagas.saga_storage import SagaStorage
+from mersal.sagas.snapshot_strategy import SnapshotStrategy
 
 __all__ = ("SagaConfig",)
 
@@ -11,6 +12,29 @@ __all__ = ("SagaConfig",)
 class SagaConfig:
     storage: SagaStorage
     correlation_error_handler: CorrelationErrorHandler | None = None
+    cache_size: int | None = None
+    """Number of sagas to keep in an in-process cache in front of the storage.
+
+    See :class:`CachedSagaStorage`. `None` disables the cache.
+    """
+    cache_snapshot_strategy: SnapshotStrategy | None = None
+    """How the cache copies saga data, defaults to :class:`DeepCopySnapshotStrategy`."""
+    lock_sagas: bool = False
+    """Handle messages for the same saga one at a time within this process.
+
+    Concurrent messages correlated to the same saga (by saga data type and
+    correlation property value) wait for each other instead of loading the
+    same revision and retrying on a concurrency conflict when saving.
+    """
+    detect_changes: bool = False
+    """Skip updating saga data that handling a message left unchanged.
+
+    Changes are detected by comparing the pickled saga data before and after
+    the handlers run, which pickles the loaded saga data twice per message;
+    data that can't be pickled is always updated. Off by default, so every
+    loaded saga is updated, bumping its revision. Setting `is_unchanged`
+    on the saga skips the update regardless.
+    """
 
     @property
     def plugin(self) -> SagaPlugin:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -7,15 +9,18 @@ from mersal.exceptions.base_exceptions import (
     ConcurrencyExceptionError,
     MersalExceptionError,
 )
+from mersal.messages import BatchMessage
 from mersal.pipeline.incoming_step import IncomingStep
 from mersal.pipeline.message_context import MessageContext
 from mersal.pipeline.receive.handler_invokers import HandlerInvokers
 from mersal.pipeline.receive.saga_handler_invoker import SagaHandlerInvoker
+from mersal.sagas.saga_metadata import SagaMetadata
 from mersal.transport.transaction_context import TransactionContext
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Hashable, Iterable, Sequence
 
+    from mersal.messages import LogicalMessage
     from mersal.pipeline import IncomingStepContext
     from mersal.sagas.correlation_error_handler import CorrelationErrorHandler
     from mersal.sagas.correlation_property import CorrelationProperty
@@ -23,6 +28,7 @@ if TYPE_CHECKING:
     from mersal.sagas.saga_data import SagaData
     from mersal.sagas.saga_storage import SagaStorage
     from mersal.types import AsyncAnyCallable
+    from mersal.utils import KeyedLock
 
 __all__ = (
     "LoadSagaDataStep",
@@ -35,6 +41,7 @@ class SagasOperationWrapper:
     saga_data: SagaData
     correlation_properties: Sequence[CorrelationProperty]
     saga: Saga
+    fingerprint: bytes | None = None
 
 
 class LoadSagaDataStep(IncomingStep):
@@ -42,39 +49,101 @@ class LoadSagaDataStep(IncomingStep):
         self,
         saga_storage: SagaStorage,
         correlation_error_handler: CorrelationErrorHandler,
+        saga_lock: KeyedLock | None = None,
+        detect_changes: bool = False,
     ) -> None:
+        """Load saga data before the handlers are invoked and save it after.
+
+        Once a message of a type was handled by sagas, the step applies to
+        every message of that type. Whether a type is handled by sagas at all
+        can't be told from the registered handler factories, which may be
+        registered or return sagas at any time, so the step is never skipped.
+
+        Args:
+            saga_storage: Where saga data is stored.
+            correlation_error_handler: Invoked for non-initiating messages without saga data.
+            saga_lock: When given, messages for the same saga (the same saga data type and
+                correlation property value) are handled one at a time in this process
+                instead of conflicting when saving. A saga's lock is held until the
+                transaction closes, since storages may only write when it commits.
+            detect_changes: Skip updating loaded saga data the handlers left unchanged,
+                as detected by comparing its pickled form before and after handling.
+        """
         self.correlation_error_handler = correlation_error_handler
         self.saga_storage = saga_storage
+        self.saga_lock = saga_lock
+        self.detect_changes = detect_changes
+        # Message types seen handled by sagas.
+        self._saga_message_types: set[type] = {BatchMessage}
+
+    def applies_to(self, message_type: type) -> bool | None:
+        # A type seen without sagas may still get saga handlers later, so it is left undecided.
+        return True if message_type in self._saga_message_types else None
 
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
         handler_invokers = context.load(HandlerInvokers)
         transaction_context = context.load(TransactionContext)  # type: ignore[type-abstract]
         message = handler_invokers.message
-        message_type = type(message.body)
+        message_type = message.body_type
         saga_invokers: list[SagaHandlerInvoker] = [
             invoker for invoker in handler_invokers if isinstance(invoker, SagaHandlerInvoker)
         ]
+        if not saga_invokers:
+            await next_step()
+            return
+
+        self._saga_message_types.add(message_type)
+        if self.saga_lock is None:
+            await self._handle(saga_invokers, message, transaction_context, next_step)
+            return
+
+        keys = self._lock_keys(saga_invokers, message_type, transaction_context)
+        lock = AsyncExitStack()
+        await lock.enter_async_context(self.saga_lock.lock(*keys))
+
+        async def release(_: TransactionContext) -> None:
+            await lock.aclose()
+
+        try:
+            transaction_context.on_close(release)
+        except:
+            await lock.aclose()
+            raise
+        await self._handle(saga_invokers, message, transaction_context, next_step)
+
+    async def _handle(
+        self,
+        saga_invokers: list[SagaHandlerInvoker],
+        message: LogicalMessage,
+        transaction_context: TransactionContext,
+        next_step: AsyncAnyCallable,
+    ) -> None:
+        message_type = message.body_type
         loaded_sagas: list[SagasOperationWrapper] = []
         created_sagas: list[SagasOperationWrapper] = []
         for saga_invoker in saga_invokers:
             saga = saga_invoker.saga
-            message_correlation_properties = [
-                cr for cr in saga.correlation_properties if cr.message_type is message_type
-            ]
+            metadata = SagaMetadata.of(saga)
+            message_correlation_properties = metadata.correlation_properties_for(message_type)
             found_existing_data = await self._try_to_find_existing_saga(
                 saga, message_correlation_properties, transaction_context
             )
 
             if not found_existing_data:
-                if message_type in saga.initiating_message_types:
+                if message_type in metadata.initiating_message_types:
                     saga.data = saga.generate_new_data()
-                    created_sagas.append(SagasOperationWrapper(saga.data, message_correlation_properties, saga))
+                    created_sagas.append(SagasOperationWrapper(saga.data, metadata.correlation_properties, saga))
                 else:
-                    await self.correlation_error_handler(saga.correlation_properties, saga_invoker, message)
+                    await self.correlation_error_handler(metadata.correlation_properties, saga_invoker, message)
             else:
-                loaded_sagas.append(SagasOperationWrapper(saga.data, message_correlation_properties, saga))
+                fingerprint = self._fingerprint(saga.data.data) if self.detect_changes else None
+                loaded_sagas.append(
+                    SagasOperationWrapper(saga.data, metadata.correlation_properties, saga, fingerprint)
+                )
         await next_step()
-        sagas_to_update = [s for s in loaded_sagas if not s.saga.is_completed and not s.saga.is_unchanged]
+        sagas_to_update = [
+            s for s in loaded_sagas if not s.saga.is_completed and not s.saga.is_unchanged and self._has_changed(s)
+        ]
         for d in sagas_to_update:
             await self._save_saga_data(d, insert=False, transaction_context=transaction_context)
         sagas_to_insert = [s for s in created_sagas if not s.saga.is_completed]
@@ -84,6 +153,37 @@ class LoadSagaDataStep(IncomingStep):
         for s in sagas_to_delete:
             await self.saga_storage.delete(s.saga_data, transaction_context)
 
+    def _fingerprint(self, data: object) -> bytes | None:
+        try:
+            return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            return None
+
+    def _has_changed(self, data: SagasOperationWrapper) -> bool:
+        if data.fingerprint is None:
+            return True
+        return self._fingerprint(data.saga_data.data) != data.fingerprint
+
+    def _lock_keys(
+        self,
+        saga_invokers: list[SagaHandlerInvoker],
+        message_type: type,
+        transaction_context: TransactionContext,
+    ) -> list[Hashable]:
+        message_context = MessageContext(transaction_context)
+        keys: list[Hashable] = []
+        for saga_invoker in saga_invokers:
+            saga = saga_invoker.saga
+            for correlation_property in SagaMetadata.of(saga).correlation_properties_for(message_type):
+                value = correlation_property.value_extractor(message_context)
+                key = (saga.data_type, correlation_property.property_name, value)
+                try:
+                    hash(key)
+                except TypeError:  # unhashable correlation value, can't be locked on
+                    continue
+                keys.append(key)
+        return keys
+
     async def _try_to_find_existing_saga(
         self,
         saga: Saga,
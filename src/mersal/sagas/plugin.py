@@ -12,10 +12,12 @@ from mersal.pipeline import (
 )
 from mersal.pipeline.pipeline import IncomingPipeline, Pipeline
 from mersal.plugins import Plugin
+from mersal.sagas.cached_saga_storage import CachedSagaStorage
 from mersal.sagas.default_correlation_error_handler import (
     DefaultCorrelationErrorHandler,
 )
 from mersal.sagas.load_saga_data_step import LoadSagaDataStep
+from mersal.utils import KeyedLock
 from mersal.utils.sync import AsyncCallable
 
 if TYPE_CHECKING:
@@ -27,8 +29,18 @@ __all__ = ("SagaPlugin",)
 
 class SagaPlugin(Plugin):
     def __init__(self, config: SagaConfig):
-        self._storage = config.storage
+        self._storage = (
+            CachedSagaStorage(
+                config.storage,
+                max_size=config.cache_size,
+                snapshot_strategy=config.cache_snapshot_strategy,
+            )
+            if config.cache_size is not None
+            else config.storage
+        )
         self._correlation_error_handler = config.correlation_error_handler
+        self._saga_lock = KeyedLock() if config.lock_sagas else None
+        self._detect_changes = config.detect_changes
 
     def __call__(self, configurator: StandardConfigurator) -> None:
         from mersal.pipeline import ActivateHandlersStep
@@ -42,6 +54,8 @@ class SagaPlugin(Plugin):
             step = LoadSagaDataStep(
                 saga_storage=self._storage,
                 correlation_error_handler=correlation_error_handler,
+                saga_lock=self._saga_lock,
+                detect_changes=self._detect_changes,
             )
 
             pipeline = PipelineInjector(configurator.get(IncomingPipeline))  # type: ignore[type-abstract]
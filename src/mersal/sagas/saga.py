@@ -6,6 +6,7 @@ from typing import Any, Generic, Protocol, Self, cast, runtime_checkable
 from mersal.sagas.correlation_property import CorrelationProperty
 from mersal.sagas.correlator import Correlator
 from mersal.sagas.saga_data import SagaData, SagaDataT
+from mersal.sagas.saga_metadata import SagaMetadata
 
 __all__ = (
     "Saga",
@@ -52,8 +53,7 @@ class SagaBase(Saga, Generic[SagaDataT], metaclass=ABCMeta):
 
     @property
     def correlation_properties(self) -> Sequence[CorrelationProperty]:
-        self.correlate_messages(self.correlator)
-        return self.correlator.correlation_properties
+        return SagaMetadata.of(self).correlation_properties
 
     @abstractmethod
     def generate_new_data(self) -> SagaData[SagaDataT]: ...
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar
+
+from mersal.sagas.correlator import Correlator
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from mersal.sagas.correlation_property import CorrelationProperty
+    from mersal.sagas.saga import Saga
+
+__all__ = ("SagaMetadata",)
+
+
+@dataclass(frozen=True)
+class SagaMetadata:
+    """Correlation metadata of a saga class.
+
+    Computed from the first instance of a saga class seen and shared by all
+    its instances, so `correlate_messages` runs once per class.
+    """
+
+    correlation_properties: tuple[CorrelationProperty, ...]
+    initiating_message_types: frozenset[type]
+    _properties_by_message_type: Mapping[type, tuple[CorrelationProperty, ...]] = field(repr=False)
+
+    _cache: ClassVar[dict[type, SagaMetadata]] = {}
+
+    @classmethod
+    def of(cls, saga: Saga) -> SagaMetadata:
+        metadata = cls._cache.get(type(saga))
+        if metadata is None:
+            metadata = cls._cache[type(saga)] = cls._create(saga)
+        return metadata
+
+    @classmethod
+    def _create(cls, saga: Saga) -> SagaMetadata:
+        correlator = Correlator(saga.data_type)
+        saga.correlate_messages(correlator)
+        correlation_properties = tuple(correlator.correlation_properties)
+
+        properties_by_message_type: dict[type, list[CorrelationProperty]] = defaultdict(list)
+        for correlation_property in correlation_properties:
+            properties_by_message_type[correlation_property.message_type].append(correlation_property)
+
+        return cls(
+            correlation_properties=correlation_properties,
+            initiating_message_types=frozenset(saga.initiating_message_types),
+            _properties_by_message_type={k: tuple(v) for k, v in properties_by_message_type.items()},
+        )
+
+    def correlation_properties_for(self, message_type: type) -> tuple[CorrelationProperty, ...]:
+        return self._properties_by_message_type.get(message_type, ())
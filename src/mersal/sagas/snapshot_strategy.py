@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import dataclasses
+import pickle
+from copy import deepcopy
+from typing import Protocol
+
+from mersal.sagas.saga_data import SagaData
+
+__all__ = (
+    "DataclassReplaceSnapshotStrategy",
+    "DeepCopySnapshotStrategy",
+    "PickleSnapshotStrategy",
+    "SnapshotStrategy",
+)
+
+
+class SnapshotStrategy(Protocol):
+    """Copy saga data so that the copy and the original can change independently.
+
+    Saga storages keeping data in memory take a snapshot whenever data crosses
+    the storage boundary, so handlers can't modify stored data in place.
+    """
+
+    def __call__(self, saga_data: SagaData) -> SagaData: ...
+
+
+class DeepCopySnapshotStrategy(SnapshotStrategy):
+    """Snapshot with `copy.deepcopy`; works for any data but is the slowest."""
+
+    def __call__(self, saga_data: SagaData) -> SagaData:
+        return deepcopy(saga_data)
+
+
+class PickleSnapshotStrategy(SnapshotStrategy):
+    """Snapshot with a pickle round-trip; usually several times faster than `deepcopy`.
+
+    The data must be picklable.
+    """
+
+    def __call__(self, saga_data: SagaData) -> SagaData:
+        return SagaData(
+            saga_data.id,
+            saga_data.revision,
+            pickle.loads(pickle.dumps(saga_data.data, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+
+
+class DataclassReplaceSnapshotStrategy(SnapshotStrategy):
+    """Snapshot dataclass data with `dataclasses.replace`, a shallow copy.
+
+    Only the dataclass instance is copied, its field values are shared. Use it
+    for flat data whose fields hold immutable values (numbers, strings,
+    tuples, frozen dataclasses...), where sharing is safe. Frozen dataclass
+    data is shared as is. Data that isn't a dataclass instance falls back to
+    `deepcopy`.
+    """
+
+    def __call__(self, saga_data: SagaData) -> SagaData:
+        data = saga_data.data
+        if not dataclasses.is_dataclass(data) or isinstance(data, type):
+            return deepcopy(saga_data)
+
+        if not type(data).__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            data = dataclasses.replace(data)
+        return SagaData(saga_data.id, saga_data.revision, data)
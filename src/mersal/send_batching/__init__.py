@@ -0,0 +1,15 @@
+from .config import SendBatchingConfig
+from .plugin import SendBatchingPlugin
+from .send_batching_steps import (
+    OutgoingMessageBatches,
+    SendBatchingIncomingStep,
+    SendBatchingOutgoingStep,
+)
+
+__all__ = [
+    "OutgoingMessageBatches",
+    "SendBatchingConfig",
+    "SendBatchingIncomingStep",
+    "SendBatchingOutgoingStep",
+    "SendBatchingPlugin",
+]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mersal.send_batching.plugin import SendBatchingPlugin
+
+__all__ = ("SendBatchingConfig",)
+
+
+@dataclass
+class SendBatchingConfig:
+    """Configuration for batching the messages sent while handling a message.
+
+    Messages sent to the same destination by the handlers of one incoming
+    message are delivered as `BatchMessage` envelopes once the handlers
+    complete. The serialized messages, each with its own headers, are framed
+    into a single bytes body (see `encode_batch`), so their bodies must be
+    bytes, str or JSON serializable; messages that can't be framed are sent
+    one by one. When combined with the claim check, register this plugin
+    after `ClaimCheckConfig` so that envelopes, rather than the messages
+    inside them, are checked.
+    """
+
+    max_messages: int = 100
+    """Maximum number of messages in one batch."""
+    max_bytes: int | None = 256 * 1024
+    """Maximum combined size (in bytes) of the serialized bodies in one batch.
+
+    Only bodies serialized to `bytes` or `str` are counted; `None` disables the limit.
+    """
+
+    @property
+    def plugin(self) -> SendBatchingPlugin:
+        return SendBatchingPlugin(self)
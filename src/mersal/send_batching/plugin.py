@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from mersal.pipeline import PipelineInjectionPosition, PipelineInjector
+from mersal.pipeline.pipeline import IncomingPipeline, OutgoingPipeline, Pipeline
+from mersal.pipeline.pipeline_invoker import PipelineInvoker
+from mersal.pipeline.send.serialize_outgoing_message_step import (
+    SerializeOutgoingMessageStep,
+)
+from mersal.plugins import Plugin
+from mersal.retry.default_retry_step import DefaultRetryStep
+from mersal.send_batching.send_batching_steps import (
+    SendBatchingIncomingStep,
+    SendBatchingOutgoingStep,
+)
+
+if TYPE_CHECKING:
+    from mersal.configuration import StandardConfigurator
+    from mersal.send_batching.config import SendBatchingConfig
+
+__all__ = ("SendBatchingPlugin",)
+
+
+class SendBatchingPlugin(Plugin):
+    def __init__(self, config: SendBatchingConfig):
+        self._config = config
+
+    def __call__(self, configurator: StandardConfigurator) -> None:
+        def decorate_incoming_pipeline(configurator: StandardConfigurator) -> Pipeline:
+            step = SendBatchingIncomingStep(
+                # resolved lazily: the invoker is built from the pipelines being decorated here
+                pipeline_invoker=lambda: configurator.get(PipelineInvoker),  # type: ignore[type-abstract]
+                max_messages=self._config.max_messages,
+                max_bytes=self._config.max_bytes,
+            )
+
+            pipeline = PipelineInjector(configurator.get(IncomingPipeline))  # type: ignore[type-abstract]
+            pipeline.inject_step(step, PipelineInjectionPosition.AFTER, DefaultRetryStep)
+            return pipeline
+
+        def decorate_outgoing_pipeline(configurator: StandardConfigurator) -> Pipeline:
+            pipeline = PipelineInjector(configurator.get(OutgoingPipeline))  # type: ignore[type-abstract]
+            pipeline.inject_step(
+                SendBatchingOutgoingStep(), PipelineInjectionPosition.AFTER, SerializeOutgoingMessageStep
+            )
+            return pipeline
+
+        configurator.decorate(IncomingPipeline, decorate_incoming_pipeline)
+        configurator.decorate(OutgoingPipeline, decorate_outgoing_pipeline)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar
+
+from mersal.messages import BatchMessage, LogicalMessage, MessageHeaders, MessageTypeRegistry, TransportMessage
+from mersal.pipeline.incoming_step import IncomingStep
+from mersal.pipeline.outgoing_step import OutgoingStep
+from mersal.pipeline.outgoing_step_context import OutgoingStepContext
+from mersal.pipeline.send.destination_addresses import DestinationAddresses
+from mersal.transport import TransactionContext
+from mersal.transport.wire_format import encode_batch
+
+if TYPE_CHECKING:
+    from mersal.pipeline import IncomingStepContext
+    from mersal.pipeline.pipeline_invoker import PipelineInvoker
+    from mersal.types import AsyncAnyCallable
+
+__all__ = (
+    "OutgoingMessageBatches",
+    "SendBatchingIncomingStep",
+    "SendBatchingOutgoingStep",
+)
+
+
+class OutgoingMessageBatches:
+    """Serialized outgoing messages buffered per destination address.
+
+    A destination's buffer is flushed as soon as it reaches `max_messages`
+    messages or adding a message would take it past `max_bytes`; whatever is
+    left is flushed by `flush`. Buffers holding a single message are sent as
+    that message, larger ones as one `BatchMessage` envelope whose body
+    frames every message with its own headers (see `encode_batch`). Messages
+    whose serialized bodies can not be framed (neither bytes, str nor JSON,
+    e.g. objects passed through the identity serializer) are sent one by one.
+    """
+
+    def __init__(
+        self,
+        pipeline_invoker: PipelineInvoker,
+        transaction_context: TransactionContext,
+        max_messages: int,
+        max_bytes: int | None,
+    ) -> None:
+        self._pipeline_invoker = pipeline_invoker
+        self._transaction_context = transaction_context
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._messages: dict[str, list[tuple[LogicalMessage, TransportMessage]]] = {}
+        self._sizes: dict[str, int] = {}
+
+    async def add(self, address: str, logical_message: LogicalMessage, transport_message: TransportMessage) -> None:
+        size = _body_size(transport_message.body)
+        messages = self._messages.get(address)
+        if messages and self._max_bytes is not None and self._sizes[address] + size > self._max_bytes:
+            await self._flush(address)
+            messages = None
+
+        if messages is None:
+            messages = self._messages[address] = []
+            self._sizes[address] = 0
+
+        messages.append((logical_message, transport_message))
+        self._sizes[address] += size
+        if len(messages) >= self._max_messages:
+            await self._flush(address)
+
+    async def flush(self) -> None:
+        for address in list(self._messages):
+            await self._flush(address)
+
+    async def _flush(self, address: str) -> None:
+        messages = self._messages.pop(address)
+        del self._sizes[address]
+
+        if len(messages) == 1:
+            await self._send(address, *messages[0])
+            return
+
+        try:
+            body = encode_batch(transport_message for _, transport_message in messages)
+        except (TypeError, ValueError):
+            for logical_message, transport_message in messages:
+                await self._send(address, logical_message, transport_message)
+            return
+
+        headers = _common_headers([logical_message.headers for logical_message, _ in messages])
+        headers[BatchMessage.header_key] = len(messages)
+        headers[MessageHeaders.message_type_key] = MessageTypeRegistry.register(BatchMessage)
+        batch = BatchMessage([m.body for m, _ in messages], [t.headers for _, t in messages])
+        # Shares the headers with the logical message so the header steps ahead
+        # of serialization (message id, sent time) apply to the envelope as well.
+        await self._send(address, LogicalMessage(batch, headers), TransportMessage(body, headers))
+
+    async def _send(self, address: str, logical_message: LogicalMessage, transport_message: TransportMessage) -> None:
+        context = OutgoingStepContext(logical_message, self._transaction_context, DestinationAddresses({address}))
+        context.save(transport_message)
+        context.save_keys(SendBatchingOutgoingStep.flushing_key, True)
+        await self._pipeline_invoker(context)
+
+
+class SendBatchingIncomingStep(IncomingStep):
+    """Batch the messages sent while handling an incoming message.
+
+    Outgoing messages are buffered for the duration of the handlers and
+    flushed once they complete successfully; if they fail, the buffered
+    messages are dropped along with the rest of the transaction.
+    """
+
+    batches_key: ClassVar[str] = "send-batching-batches"
+
+    def __init__(
+        self,
+        pipeline_invoker: Callable[[], PipelineInvoker],
+        max_messages: int,
+        max_bytes: int | None,
+    ) -> None:
+        self._pipeline_invoker = pipeline_invoker
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+
+    async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable) -> None:
+        transaction_context: TransactionContext = context.load(TransactionContext)  # type: ignore[type-abstract]
+        batches = OutgoingMessageBatches(
+            self._pipeline_invoker(),
+            transaction_context,
+            max_messages=self._max_messages,
+            max_bytes=self._max_bytes,
+        )
+        transaction_context.items[self.batches_key] = batches
+
+        await next_step()
+
+        del transaction_context.items[self.batches_key]
+        await batches.flush()
+
+
+class SendBatchingOutgoingStep(OutgoingStep):
+    """Divert serialized outgoing messages into the transaction's batches.
+
+    Messages sent outside of a batching transaction, batches the application
+    sends itself, and messages being flushed continue down the pipeline.
+    """
+
+    flushing_key: ClassVar[str] = "send-batching-flushing"
+
+    async def __call__(self, context: OutgoingStepContext, next_step: Callable) -> None:
+        transaction_context: TransactionContext = context.load(TransactionContext)  # type: ignore[type-abstract]
+        batches: OutgoingMessageBatches | None = transaction_context.items.get(SendBatchingIncomingStep.batches_key)
+        logical_message = context.load(LogicalMessage)
+
+        if batches is None or context.load_keys(self.flushing_key) or isinstance(logical_message.body, BatchMessage):
+            await next_step()
+            return
+
+        transport_message = context.load(TransportMessage)
+        for address in context.load(DestinationAddresses):
+            await batches.add(address, logical_message, transport_message)
+
+
+def _body_size(body: object) -> int:
+    if isinstance(body, bytes | bytearray | str):
+        return len(body)
+    return 0
+
+
+def _common_headers(headers: list[MessageHeaders]) -> MessageHeaders:
+    first, *rest = headers
+    common = MessageHeaders(
+        {
+            key: value
+            for key, value in first.items()
+            if key not in (MessageHeaders.message_id_key, MessageHeaders.message_type_key, "sent_time")
+            and all(other.get(key) == value for other in rest)
+        }
+    )
+    return common
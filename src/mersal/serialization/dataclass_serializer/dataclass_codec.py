@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import types
+import typing
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+__all__ = ("DataclassCodec",)
+
+
+Encoder = Callable[[Any], Any]
+Decoder = Callable[[Any], Any]
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+_TEMPORAL_TYPES = (datetime.datetime, datetime.date, datetime.time)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class DataclassCodec:
+    """Encode and decode functions generated for one dataclass type.
+
+    The dataclass fields and their type hints are inspected once; the
+    generated `encode` reads each field directly and only converts the
+    values that need it (nested dataclasses, enums, UUIDs, dates and
+    collections of those), and `decode` rebuilds them from the encoded
+    form. Fields typed as primitives are passed through without copying.
+    """
+
+    _cache: typing.ClassVar[dict[type, DataclassCodec]] = {}
+
+    def __init__(self, data_type: type) -> None:
+        self.data_type = data_type
+        self.encode: Encoder = self._encode_lazily
+        self.decode: Decoder = self._decode_lazily
+
+    @classmethod
+    def of(cls, data_type: type) -> DataclassCodec:
+        codec = cls._cache.get(data_type)
+        if codec is None:
+            # Registered before compiling so self-referencing types resolve to this codec.
+            codec = cls._cache[data_type] = cls(data_type)
+            try:
+                codec._compile()
+            except BaseException:
+                del cls._cache[data_type]
+                raise
+        return codec
+
+    def _encode_lazily(self, value: Any) -> Any:
+        return self.encode(value)
+
+    def _decode_lazily(self, value: Any) -> Any:
+        return self.decode(value)
+
+    def _compile(self) -> None:
+        fields = dataclasses.fields(self.data_type)
+        hints = _type_hints(self.data_type)
+        namespace: dict[str, Any] = {"_data_type": self.data_type}
+
+        encode_items = []
+        decode_lines = []
+        for index, field in enumerate(fields):
+            field_type = hints.get(field.name, Any)
+            encoder = _encoder_for(field_type)
+            if encoder is _identity:
+                encode_items.append(f"{field.name!r}: obj.{field.name}")
+            else:
+                namespace[f"_encode_{index}"] = encoder
+                encode_items.append(f"{field.name!r}: _encode_{index}(obj.{field.name})")
+
+            if not field.init:
+                decode_lines.append(f"kwargs.pop({field.name!r}, None)")
+                continue
+            decoder = _decoder_for(field_type)
+            if decoder is _identity:
+                continue
+            namespace[f"_decode_{index}"] = decoder
+            conversion = f"kwargs[{field.name!r}] = _decode_{index}(kwargs[{field.name!r}])"
+            has_default = field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+            decode_lines.append(f"if {field.name!r} in kwargs: {conversion}" if has_default else conversion)
+
+        source = f"def encode(obj):\n    return {{{', '.join(encode_items)}}}\n"
+        if decode_lines:
+            source += "def decode(data):\n    kwargs = dict(data)\n"
+            source += "".join(f"    {line}\n" for line in decode_lines)
+            source += "    return _data_type(**kwargs)\n"
+        else:
+            source += "def decode(data):\n    return _data_type(**data)\n"
+        exec(source, namespace)  # noqa: S102
+        self.encode = namespace["encode"]
+        self.decode = namespace["decode"]
+
+
+def _type_hints(data_type: type) -> dict[str, Any]:
+    try:
+        return typing.get_type_hints(data_type)
+    except (NameError, TypeError):
+        # Unresolvable annotations (e.g. types local to a function) are treated as Any.
+        return {f.name: f.type for f in dataclasses.fields(data_type) if not isinstance(f.type, str)}
+
+
+def _is_optional_union(origin: Any) -> bool:
+    return origin is typing.Union or origin is types.UnionType
+
+
+def _encoder_for(tp: Any) -> Encoder:
+    if tp is Any:
+        return _encode_any
+    if isinstance(tp, type):
+        if issubclass(tp, _PRIMITIVES) and not issubclass(tp, enum.Enum):
+            return _identity
+        if dataclasses.is_dataclass(tp):
+            return DataclassCodec.of(tp).encode
+        if issubclass(tp, enum.Enum):
+            return _encode_enum
+        if issubclass(tp, uuid.UUID):
+            return str
+        if issubclass(tp, _TEMPORAL_TYPES):
+            return _encode_temporal
+        return _encode_any
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if _is_optional_union(origin):
+        non_none = [a for a in args if a is not type(None)]
+        if len(non_none) != 1:
+            return _encode_any
+        encoder = _encoder_for(non_none[0])
+        if encoder is _identity:
+            return _identity
+        return lambda value: None if value is None else encoder(value)
+    if origin in (list, set, frozenset, tuple) or origin is Sequence:
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return _encode_any
+        encoder = _encoder_for(args[0]) if args else _encode_any
+        if encoder is _identity and origin in (list, Sequence):
+            return _identity
+        return lambda value: [encoder(item) for item in value]
+    if origin in (dict, Mapping):
+        encoder = _encoder_for(args[1]) if len(args) == 2 else _encode_any
+        if encoder is _identity:
+            return _identity
+        return lambda value: {key: encoder(item) for key, item in value.items()}
+    if origin is typing.Literal:
+        return _identity
+    return _encode_any
+
+
+def _decoder_for(tp: Any) -> Decoder:
+    if isinstance(tp, type):
+        if issubclass(tp, _PRIMITIVES) and not issubclass(tp, enum.Enum):
+            return _identity
+        if dataclasses.is_dataclass(tp):
+            return DataclassCodec.of(tp).decode
+        if issubclass(tp, enum.Enum):
+            return tp
+        if issubclass(tp, uuid.UUID):
+            return lambda value: value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+        if issubclass(tp, _TEMPORAL_TYPES):
+            return lambda value: value if isinstance(value, tp) else tp.fromisoformat(value)
+        return _identity
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if _is_optional_union(origin):
+        non_none = [a for a in args if a is not type(None)]
+        if len(non_none) != 1:
+            return _identity
+        decoder = _decoder_for(non_none[0])
+        if decoder is _identity:
+            return _identity
+        return lambda value: None if value is None else decoder(value)
+    if origin in (list, set, frozenset, tuple) or origin is Sequence:
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return _identity
+        decoder = _decoder_for(args[0]) if args else _identity
+        container = list if origin is Sequence else origin
+        if decoder is _identity and container is list:
+            return _identity
+        return lambda value: container(decoder(item) for item in value)
+    if origin in (dict, Mapping):
+        decoder = _decoder_for(args[1]) if len(args) == 2 else _identity
+        if decoder is _identity:
+            return _identity
+        return lambda value: {key: decoder(item) for key, item in value.items()}
+    return _identity
+
+
+def _encode_enum(value: enum.Enum) -> Any:
+    return value.value
+
+
+def _encode_temporal(value: datetime.date | datetime.time) -> str:
+    return value.isoformat()
+
+
+def _encode_any(value: Any) -> Any:
+    if isinstance(value, _PRIMITIVES) and not isinstance(value, enum.Enum):
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return DataclassCodec.of(type(value)).encode(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, _TEMPORAL_TYPES):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode_any(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode_any(item) for key, item in value.items()}
+    return value
@@ -1,17 +1,27 @@
-from dataclasses import asdict
 from typing import Any
 
 from mersal.serialization import Serializer
 
+from .dataclass_codec import DataclassCodec
+
 __all__ = ("DataclassSerializer",)
 
 
 class DataclassSerializer(Serializer):
+    """Serializes dataclass messages to `{"type": <class name>, "data": <fields>}`.
+
+    Each type gets a `DataclassCodec` generated from its fields on first
+    use, so nested dataclasses, enums, UUIDs, dates and collections of them
+    round-trip without the recursive deep copy of `dataclasses.asdict`.
+    """
+
     def __init__(self, types: set[type]) -> None:
         self._types = {t.__name__: t for t in types}
+        self._decoders = {name: DataclassCodec.of(t).decode for name, t in self._types.items()}
 
     def serialize(self, obj: Any) -> Any:
-        return {"type": type(obj).__name__, "data": asdict(obj)}
+        data_type = type(obj)
+        return {"type": data_type.__name__, "data": DataclassCodec.of(data_type).encode(obj)}
 
     def deserialize(self, data: Any) -> Any:
-        return self._types[data["type"]](**data["data"])
+        return self._decoders[data["type"]](data["data"])
@@ -1,17 +1,56 @@
-from mersal.messages import LogicalMessage, TransportMessage
+from functools import partial
+
+from mersal.messages import BatchMessage, LogicalMessage, MessageHeaders, TransportMessage
 from mersal.serialization.serializers import MessageBodySerializer
+from mersal.transport.wire_format import decode_batch, encode_batch
 
 __all__ = ("MessageSerializer",)
 
 
 class MessageSerializer:
+    """Serialize logical messages to transport messages and back.
+
+    A `BatchMessage` body is serialized element-wise, each element along
+    with its own headers, into a single bytes body (see `encode_batch`) and
+    flagged with the `BatchMessage.header_key` header so the receiving side
+    can rebuild the batch. When the serialized elements can't be framed
+    (neither bytes, str nor JSON serializable, e.g. objects passed through
+    the identity serializer), the batch is serialized as a whole instead.
+
+    Other bodies are deserialized lazily, on first access of
+    `LogicalMessage.body`, so messages that are dropped before reaching a
+    handler are never decoded.
+    """
+
     def __init__(self, serializer: MessageBodySerializer) -> None:
         self._serializer = serializer
 
     async def serialize(self, logical_message: LogicalMessage) -> TransportMessage:
-        body = self._serializer.serialize(logical_message.body)
-        return TransportMessage(body, logical_message.headers)
+        body = logical_message.body
+        if isinstance(body, BatchMessage):
+            headers = MessageHeaders(logical_message.headers)
+            headers[BatchMessage.header_key] = len(body.messages)
+            messages_headers = body.headers if body.headers is not None else [MessageHeaders() for _ in body.messages]
+            messages = (
+                TransportMessage(self._serializer.serialize(message), message_headers)
+                for message, message_headers in zip(body.messages, messages_headers, strict=True)
+            )
+            try:
+                return TransportMessage(encode_batch(messages), headers)
+            except (TypeError, ValueError):
+                pass
+
+        return TransportMessage(self._serializer.serialize(body), logical_message.headers)
 
     async def deserialize(self, transport_message: TransportMessage) -> LogicalMessage:
-        body = self._serializer.deserialize(transport_message.body)
-        return LogicalMessage(body, transport_message.headers)
+        if transport_message.headers.get(BatchMessage.header_key) is not None:
+            messages = decode_batch(transport_message.body)
+            body = BatchMessage(
+                [self._serializer.deserialize(message.body) for message in messages],
+                [message.headers for message in messages],
+            )
+            return LogicalMessage(body, transport_message.headers)
+
+        return LogicalMessage.deferred(
+            partial(self._serializer.deserialize, transport_message.body), transport_message.headers
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from mersal.messages.control import SubscribeRequest, UnsubscribeRequest
 from mersal.subscription.handlers import SubscribeRequestHandler, UnsubscribeRequestHandler
@@ -24,6 +24,9 @@ class InternalHandlersActivator:
 
     Registers handlers for `SubscribeRequest`/`UnsubscribeRequest` so that any app
     can act as the owner (publisher) of a topic when subscription storage is decentralized.
+
+    Use `decorate` to also resolve handlers by message type when the inner
+    activator supports it.
     """
 
     def __init__(self, inner: HandlerActivator, subscription_storage: SubscriptionStorage) -> None:
@@ -33,14 +36,20 @@ class InternalHandlersActivator:
             UnsubscribeRequest: [UnsubscribeRequestHandler(subscription_storage)],
         }
 
+    @classmethod
+    def decorate(cls, inner: HandlerActivator, subscription_storage: SubscriptionStorage) -> InternalHandlersActivator:
+        """Decorate inner, exposing `get_handlers_for_type` only if inner does."""
+        if hasattr(inner, "get_handlers_for_type"):
+            return _TypedInternalHandlersActivator(inner, subscription_storage)
+        return cls(inner, subscription_storage)
+
     async def get_handlers(
         self,
         message: MessageT,
         transaction_context: TransactionContext,
     ) -> Sequence[MessageHandler[MessageT]]:
-        own_handlers = self._internal_handlers.get(type(message), [])
         handlers = await self._inner.get_handlers(message, transaction_context)
-        return [*handlers, *own_handlers]
+        return self._with_own_handlers(handlers, type(message))
 
     def register(
         self,
@@ -61,3 +70,23 @@ class InternalHandlersActivator:
     @app.setter
     def app(self, value: Mersal) -> None:
         self._inner.app = value
+
+    def _with_own_handlers(
+        self, handlers: Sequence[MessageHandler[MessageT]], message_type: type
+    ) -> Sequence[MessageHandler[MessageT]]:
+        own_handlers = self._internal_handlers.get(message_type)
+        if own_handlers is None:
+            return handlers
+        return [*handlers, *own_handlers]
+
+
+class _TypedInternalHandlersActivator(InternalHandlersActivator):
+    async def get_handlers_for_type(
+        self,
+        message_type: type[MessageT],
+        transaction_context: TransactionContext,
+    ) -> Sequence[MessageHandler[MessageT]]:
+        handlers: Sequence[MessageHandler[MessageT]] = await cast("Any", self._inner).get_handlers_for_type(
+            message_type, transaction_context
+        )
+        return self._with_own_handlers(handlers, message_type)
@@ -6,14 +6,20 @@ from .transaction_context import TransactionContext
 from .transaction_scope import TransactionScope
 from .transport import Transport
 from .transport_bridge import TransportBridge
+from .wire_format import BinaryWireFormat, JsonWireFormat, WireFormat, decode_batch, encode_batch
 
 __all__ = [
     "AmbientContext",
+    "BinaryWireFormat",
     "DefaultTransactionContext",
     "DefaultTransactionContextWithOwningApp",
+    "JsonWireFormat",
     "OutgoingMessage",
     "TransactionContext",
     "TransactionScope",
     "Transport",
     "TransportBridge",
+    "WireFormat",
+    "decode_batch",
+    "encode_batch",
 ]
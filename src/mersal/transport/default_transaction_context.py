@@ -17,6 +17,20 @@ __all__ = (
 
 
 class DefaultTransactionContext(TransactionContext):
+    __slots__ = (
+        "_closed",
+        "_completed",
+        "_must_ack",
+        "_must_commit",
+        "_on_ack_actions",
+        "_on_closed_actions",
+        "_on_committed_actions",
+        "_on_error_actions",
+        "_on_nack_actions",
+        "_on_rollback_actions",
+        "items",
+    )
+
     def __init__(self) -> None:
         self.items: dict[str | type, Any] = {}
         self._on_committed_actions: list[AsyncTransactionContextCallable] = []
@@ -11,6 +11,8 @@ __all__ = ("DefaultTransactionContextWithOwningApp",)
 
 
 class DefaultTransactionContextWithOwningApp(DefaultTransactionContext):
+    __slots__ = ("app",)
+
     def __init__(self, app: Mersal) -> None:
         super().__init__()
         self.app = app
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-import base64
-import json
 import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from mersal.messages import TransportMessage
-from mersal.messages.message_headers import MessageHeaders
 from mersal.transport.base_transport import BaseTransport
+from mersal.transport.wire_format import BinaryWireFormat, JsonWireFormat, WireFormat
 
 if TYPE_CHECKING:
+    from mersal.messages import TransportMessage
     from mersal.transport import TransactionContext
     from mersal.transport.outgoing_message import OutgoingMessage
 
@@ -26,6 +24,12 @@ __all__ = (
 class FileSystemTransportConfig:
     base_directory: str | Path
     input_queue_address: str
+    wire_format: WireFormat = field(default_factory=JsonWireFormat)
+    """Format of the message files written by this transport.
+
+    Files in either built-in format are received regardless of this setting,
+    so endpoints can switch formats independently.
+    """
 
     @property
     def transport(self) -> FileSystemTransport:
@@ -37,6 +41,11 @@ class FileSystemTransport(BaseTransport):
         super().__init__(address=config.input_queue_address)
         self._base_directory = Path(config.base_directory)
         self._input_queue_address = config.input_queue_address
+        self._wire_format = config.wire_format
+        self._wire_formats: dict[str, WireFormat] = {
+            wire_format.file_extension: wire_format
+            for wire_format in (JsonWireFormat(), BinaryWireFormat(), config.wire_format)
+        }
 
     async def create_queue(self, address: str) -> None:
         self._get_directory(address).mkdir(parents=True, exist_ok=True)
@@ -49,15 +58,15 @@ class FileSystemTransport(BaseTransport):
         if not queue_dir.exists():
             return None
 
-        files = sorted(f for f in queue_dir.iterdir() if f.suffix == ".json")
+        files = sorted(f for f in queue_dir.iterdir() if f.suffix in self._wire_formats)
         if not files:
             return None
 
         file_path = files[0]
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = file_path.read_bytes()
         file_path.unlink()
 
-        message = _deserialize_transport_message(data)
+        message = self._wire_formats[file_path.suffix].decode(data)
 
         async def on_nack(_: TransactionContext) -> None:
             self._deliver(self._input_queue_address, message)
@@ -78,50 +87,10 @@ class FileSystemTransport(BaseTransport):
         queue_dir = self._get_directory(destination_address)
         queue_dir.mkdir(parents=True, exist_ok=True)
 
-        file_name = f"{time.time_ns():020d}_{uuid.uuid4().hex}.json"
+        file_name = f"{time.time_ns():020d}_{uuid.uuid4().hex}{self._wire_format.file_extension}"
         file_path = queue_dir / file_name
 
-        data = _serialize_transport_message(message)
-        file_path.write_text(json.dumps(data), encoding="utf-8")
+        file_path.write_bytes(self._wire_format.encode(message))
 
     def _get_directory(self, queue_name: str) -> Path:
         return self._base_directory / queue_name
-
-
-def _serialize_transport_message(message: TransportMessage) -> dict:
-    body = message.body
-    if isinstance(body, bytes | bytearray):
-        body_encoded = base64.b64encode(body).decode("ascii")
-        body_type = "bytes"
-    elif isinstance(body, str):
-        body_encoded = body
-        body_type = "str"
-    else:
-        body_encoded = json.dumps(body)
-        body_type = "json"
-
-    headers = {}
-    for key, value in message.headers.items():
-        headers[key] = str(value)
-
-    return {
-        "headers": headers,
-        "body": body_encoded,
-        "body_type": body_type,
-    }
-
-
-def _deserialize_transport_message(data: dict) -> TransportMessage:
-    body_type = data.get("body_type", "str")
-    body_encoded = data["body"]
-
-    if body_type == "bytes":
-        body = base64.b64decode(body_encoded)
-    elif body_type == "json":
-        body = json.loads(body_encoded)
-    else:
-        body = body_encoded
-
-    headers = MessageHeaders(data.get("headers", {}))
-
-    return TransportMessage(body=body, headers=headers)
@@ -12,6 +12,8 @@ __all__ = ("TransactionContext",)
 
 
 class TransactionContext(Protocol):
+    __slots__ = ()
+
     items: dict[str | type, Any]
 
     async def __aenter__(self) -> Self: ...
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import base64
+import json
+import struct
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
+
+from mersal.exceptions import MersalExceptionError
+from mersal.messages import TransportMessage
+from mersal.messages.message_headers import MessageHeaders
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "BinaryWireFormat",
+    "JsonWireFormat",
+    "WireFormat",
+    "decode_batch",
+    "encode_batch",
+)
+
+
+class WireFormat(Protocol):
+    """Encodes a `TransportMessage` to bytes for transports and storages that persist messages."""
+
+    @property
+    def file_extension(self) -> str:
+        """The extension of files holding messages in this format, e.g. ``.json``."""
+        ...
+
+    def encode(self, message: TransportMessage) -> bytes: ...
+
+    def decode(self, data: bytes) -> TransportMessage: ...
+
+
+class JsonWireFormat:
+    """Messages as JSON documents; bytes bodies are base64 encoded."""
+
+    file_extension: ClassVar[str] = ".json"
+
+    def encode(self, message: TransportMessage) -> bytes:
+        body = message.body
+        if isinstance(body, bytes | bytearray):
+            body_encoded = base64.b64encode(body).decode("ascii")
+            body_type = "bytes"
+        elif isinstance(body, str):
+            body_encoded = body
+            body_type = "str"
+        else:
+            body_encoded = json.dumps(body)
+            body_type = "json"
+
+        data = {
+            "headers": {key: str(value) for key, value in message.headers.items()},
+            "body": body_encoded,
+            "body_type": body_type,
+        }
+        return json.dumps(data).encode("utf-8")
+
+    def decode(self, data: bytes) -> TransportMessage:
+        raw = json.loads(data)
+        body_type = raw.get("body_type", "str")
+        body_encoded = raw["body"]
+
+        body: Any
+        if body_type == "bytes":
+            body = base64.b64decode(body_encoded)
+        elif body_type == "json":
+            body = json.loads(body_encoded)
+        else:
+            body = body_encoded
+
+        return TransportMessage(body=body, headers=MessageHeaders(raw.get("headers", {})))
+
+
+_MAGIC = b"MSL\x01"
+_PREAMBLE = struct.Struct("<4sH")
+_INTERNED_KEY = struct.Struct("<B")
+_LITERAL_KEY = struct.Struct("<BH")
+_VALUE_LENGTH = struct.Struct("<I")
+
+_BODY_BYTES = 0
+_BODY_STR = 1
+_BODY_JSON = 2
+
+_LITERAL_KEY_TAG = 0xFF
+
+
+class BinaryWireFormat:
+    """A compact framing of a message: a header table followed by the raw body.
+
+    Layout (little endian)::
+
+        magic "MSL\\x01" | uint16 header count
+        per header: uint8 key index into `interned_keys`, or 0xFF + uint16 length + key
+                    uint32 length + value
+        uint8 body type (bytes, str or JSON) | body until the end of the frame
+
+    Common header keys are written as a single byte and bytes bodies are
+    stored as is. `interned_keys` is part of the format and must only be
+    appended to.
+    """
+
+    file_extension: ClassVar[str] = ".bin"
+
+    interned_keys: ClassVar[tuple[str, ...]] = (
+        MessageHeaders.message_id_key,
+        "sent_time",
+        "message_type",
+        MessageHeaders.correlation_id_key,
+        MessageHeaders.correlation_sequence_key,
+        MessageHeaders.causation_id_key,
+        "error_details",
+        "mersal-batch",
+    )
+    _key_indexes: ClassVar[dict[str, int]] = {key: index for index, key in enumerate(interned_keys)}
+
+    def encode(self, message: TransportMessage) -> bytes:
+        headers = message.headers
+        parts = [_PREAMBLE.pack(_MAGIC, len(headers))]
+        key_indexes = self._key_indexes
+        for key, value in headers.items():
+            index = key_indexes.get(key)
+            if index is None:
+                encoded_key = key.encode("utf-8")
+                parts.append(_LITERAL_KEY.pack(_LITERAL_KEY_TAG, len(encoded_key)))
+                parts.append(encoded_key)
+            else:
+                parts.append(_INTERNED_KEY.pack(index))
+            encoded_value = str(value).encode("utf-8")
+            parts.append(_VALUE_LENGTH.pack(len(encoded_value)))
+            parts.append(encoded_value)
+
+        body = message.body
+        if isinstance(body, bytes | bytearray):
+            parts.append(bytes((_BODY_BYTES,)))
+            parts.append(bytes(body))
+        elif isinstance(body, str):
+            parts.append(bytes((_BODY_STR,)))
+            parts.append(body.encode("utf-8"))
+        else:
+            parts.append(bytes((_BODY_JSON,)))
+            parts.append(json.dumps(body).encode("utf-8"))
+        return b"".join(parts)
+
+    def decode(self, data: bytes) -> TransportMessage:
+        view = memoryview(data)
+        magic, headers_count = _PREAMBLE.unpack_from(view)
+        if magic != _MAGIC:
+            raise MersalExceptionError("Not a binary wire format message")
+
+        offset = _PREAMBLE.size
+        interned_keys = self.interned_keys
+        headers: dict[str, str] = {}
+        for _ in range(headers_count):
+            tag = view[offset]
+            if tag == _LITERAL_KEY_TAG:
+                _, key_length = _LITERAL_KEY.unpack_from(view, offset)
+                offset += _LITERAL_KEY.size
+                key = str(view[offset : offset + key_length], "utf-8")
+                offset += key_length
+            else:
+                key = interned_keys[tag]
+                offset += _INTERNED_KEY.size
+            (value_length,) = _VALUE_LENGTH.unpack_from(view, offset)
+            offset += _VALUE_LENGTH.size
+            headers[key] = str(view[offset : offset + value_length], "utf-8")
+            offset += value_length
+
+        body_type = view[offset]
+        raw_body = view[offset + 1 :]
+        body: Any
+        if body_type == _BODY_BYTES:
+            body = raw_body.tobytes()
+        elif body_type == _BODY_STR:
+            body = str(raw_body, "utf-8")
+        else:
+            body = json.loads(raw_body.tobytes())
+
+        return TransportMessage(body=body, headers=MessageHeaders(headers))
+
+
+def encode_batch(messages: Iterable[TransportMessage]) -> bytes:
+    """Frame messages into a single body, each as a uint32 length followed by its `BinaryWireFormat` encoding.
+
+    Raises:
+        TypeError: a body is neither bytes, str nor JSON serializable.
+    """
+    wire_format = BinaryWireFormat()
+    parts: list[bytes] = []
+    for message in messages:
+        encoded = wire_format.encode(message)
+        parts.append(_VALUE_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def decode_batch(data: bytes) -> list[TransportMessage]:
+    """Split a body framed by `encode_batch` back into its messages."""
+    wire_format = BinaryWireFormat()
+    view = memoryview(data)
+    messages: list[TransportMessage] = []
+    offset = 0
+    while offset < len(view):
+        (length,) = _VALUE_LENGTH.unpack_from(view, offset)
+        offset += _VALUE_LENGTH.size
+        messages.append(wire_format.decode(view[offset : offset + length].tobytes()))
+        offset += length
+    return messages
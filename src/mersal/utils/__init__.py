@@ -1,3 +1,4 @@
+from .keyed_lock import KeyedLock
 from .retrier import AsyncRetrier
 from .singleton import Singleton
 from .sync import AsyncCallable
@@ -5,5 +6,6 @@ from .sync import AsyncCallable
 __all__ = [
     "AsyncCallable",
     "AsyncRetrier",
+    "KeyedLock",
     "Singleton",
 ]
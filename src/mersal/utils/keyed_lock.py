@@ -0,0 +1,59 @@
+from collections.abc import AsyncIterator, Hashable
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import anyio
+
+__all__ = ("KeyedLock",)
+
+
+class _Entry:
+    __slots__ = ("lock", "references")
+
+    def __init__(self) -> None:
+        # Unlike anyio.Lock, a semaphore can be released by another task than
+        # the one that acquired it.
+        self.lock = anyio.Semaphore(1)
+        self.references = 0
+
+
+class KeyedLock:
+    """A set of locks identified by keys, created on demand.
+
+    A key's lock exists only while a task holds or waits for it, so the
+    number of locks is bounded by the number of concurrent holders. Locks
+    are not bound to tasks: the context entered by `lock` may be exited by
+    another task, e.g. from a transaction callback.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, _Entry] = {}
+
+    @asynccontextmanager
+    async def lock(self, *keys: Hashable) -> AsyncIterator[None]:
+        """Hold the locks of all the given keys.
+
+        The locks are acquired in a consistent order so that tasks locking
+        overlapping sets of keys cannot deadlock.
+        """
+        async with AsyncExitStack() as stack:
+            for key in sorted(set(keys), key=lambda k: (hash(k), repr(k))):
+                await stack.enter_async_context(self._lock(key))
+            yield
+
+    @property
+    def locks_count(self) -> int:
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def _lock(self, key: Hashable) -> AsyncIterator[None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+        entry.references += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.references -= 1
+            if not entry.references:
+                del self._entries[key]
@@ -1,9 +1,13 @@
 from .backoff import DefaultWorkerBackoffStrategy, WorkerBackoffStrategy
+from .concurrency_limit import AIMDConcurrencyLimit, ConcurrencyLimit, FixedConcurrencyLimit
 from .worker import Worker
 from .worker_factory import WorkerFactory
 
 __all__ = [
+    "AIMDConcurrencyLimit",
+    "ConcurrencyLimit",
     "DefaultWorkerBackoffStrategy",
+    "FixedConcurrencyLimit",
     "Worker",
     "WorkerBackoffStrategy",
     "WorkerFactory",
@@ -10,6 +10,7 @@ import anyio.abc
 import anyio.lowlevel
 from anyio import CancelScope
 
+from mersal.exceptions import MessageDeferredError
 from mersal.pipeline import IncomingStepContext, PipelineInvoker
 from mersal.transport import (
     DefaultTransactionContextWithOwningApp,
@@ -18,8 +19,11 @@ from mersal.transport import (
 )
 from mersal.transport.ambient_context import AmbientContext
 from mersal.workers.backoff import DefaultWorkerBackoffStrategy, WorkerBackoffStrategy
+from mersal.workers.concurrency_limit import ConcurrencyLimit, FixedConcurrencyLimit
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from mersal.core.app import Mersal
     from mersal.logging import Logger
     from mersal.messages import TransportMessage
@@ -38,6 +42,8 @@ class AnyioWorker:
         logger: Logger,
         backoff_strategy: WorkerBackoffStrategy | None = None,
         stop_grace_period: float | None = None,
+        concurrency_limit: ConcurrencyLimit | None = None,
+        max_deferred_messages: int | None = None,
     ) -> None:
         self.logger = logger
         self.name = name
@@ -47,8 +53,12 @@ class AnyioWorker:
         self._exit_stack: AsyncExitStack | None = None
         self._cancel_scope: CancelScope | None = None
         self._running = False
-        self._max_parallelism = max_parallelism
-        self._parallelism_limiter: anyio.Semaphore | None = None
+        self._concurrency_limit = (
+            concurrency_limit if concurrency_limit is not None else FixedConcurrencyLimit(max_parallelism)
+        )
+        self._parallelism_limiter: anyio.CapacityLimiter | None = None
+        self._max_deferred_messages = max_deferred_messages if max_deferred_messages is not None else max_parallelism
+        self._deferral_limiter: anyio.CapacityLimiter | None = None
         self._processing_tg: anyio.abc.TaskGroup | None = None
         self._backoff_strategy = backoff_strategy if backoff_strategy is not None else DefaultWorkerBackoffStrategy()
         self._stop_grace_period = stop_grace_period
@@ -59,6 +69,18 @@ class AnyioWorker:
     def running(self) -> bool:
         return self._running
 
+    @property
+    def concurrency_limit(self) -> int:
+        """The number of messages currently allowed to be handled concurrently."""
+        return self._concurrency_limit.limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of messages currently being handled."""
+        if self._parallelism_limiter is None:
+            return 0
+        return int(self._parallelism_limiter.borrowed_tokens)
+
     @property
     def heartbeat_age(self) -> float | None:
         """Seconds since the receive loop last made progress, or None before the first beat."""
@@ -82,7 +104,8 @@ class AnyioWorker:
 
     async def __aenter__(self) -> Self:
         self._exit_stack = AsyncExitStack()
-        self._parallelism_limiter = anyio.Semaphore(self._max_parallelism)
+        self._parallelism_limiter = anyio.CapacityLimiter(self._concurrency_limit.limit)
+        self._deferral_limiter = anyio.CapacityLimiter(max(self._max_deferred_messages, 1))
         self._processing_tg = anyio.create_task_group()
         await self._exit_stack.enter_async_context(self._processing_tg)
         self._cancel_scope = self._processing_tg.cancel_scope
@@ -126,7 +149,10 @@ class AnyioWorker:
     async def _receive_message(self) -> Literal["received", "empty", "error"]:
         if self._parallelism_limiter is None or self._processing_tg is None:
             raise RuntimeError("Worker must be entered as an async context manager before receiving messages")
-        await self._parallelism_limiter.acquire()
+        # Tokens are released by the task processing the message, not the
+        # receive loop, so each message borrows on behalf of its own token.
+        token = object()
+        await self._parallelism_limiter.acquire_on_behalf_of(token)
         outcome: Literal["received", "empty", "error"] = "empty"
         handed_off = False
         transaction_context = DefaultTransactionContextWithOwningApp(self.app)
@@ -141,7 +167,7 @@ class AnyioWorker:
 
             if transport_message:
                 _ = self._processing_tg.start_soon(
-                    self._process_message_in_background, transport_message, transaction_context
+                    self._process_message_in_background, transport_message, transaction_context, token
                 )
                 handed_off = True
                 outcome = "received"
@@ -149,20 +175,33 @@ class AnyioWorker:
                 await transaction_context.__aexit__(None, None, None)
         finally:
             if not handed_off:
-                self._parallelism_limiter.release()
+                self._parallelism_limiter.release_on_behalf_of(token)
         return outcome
 
     async def _process_message_in_background(
-        self, message: TransportMessage, transaction_context: TransactionContext
+        self, message: TransportMessage, transaction_context: TransactionContext, token: object
     ) -> None:
         if self._parallelism_limiter is None:
             raise RuntimeError("Worker must be entered as an async context manager before processing messages")
+        parallelism_limiter = self._parallelism_limiter
         scope = CancelScope(shield=True)
         self._shielded_scopes.add(scope)
+        started_at = time.monotonic()
+        released = False
+
+        def release_slot(dropped: bool) -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._record_sample(time.monotonic() - started_at, dropped)
+            parallelism_limiter.release_on_behalf_of(token)
+
+        dropped = True
         try:
             with scope:
                 try:
-                    await self._process_message(message, transaction_context)
+                    dropped = await self._process_message(message, transaction_context, release_slot)
                 finally:
                     # The stop-grace deadline may have cancelled this scope;
                     # shield the transaction close so ack/nack still runs.
@@ -171,20 +210,73 @@ class AnyioWorker:
                             await transaction_context.__aexit__(None, None, None)
                         except Exception:
                             self.logger.exception("worker.transaction.close.error", message=message.message_label)
-                    self._parallelism_limiter.release()
+                    release_slot(dropped)
         finally:
             self._shielded_scopes.discard(scope)
 
-    async def _process_message(self, message: TransportMessage, transaction_context: TransactionContext) -> None:
+    def _record_sample(self, latency: float, dropped: bool) -> None:
+        if self._parallelism_limiter is None:
+            return
+        try:
+            self._concurrency_limit.on_sample(latency, dropped, int(self._parallelism_limiter.borrowed_tokens))
+            limit = self._concurrency_limit.limit
+        except Exception:
+            self.logger.exception("worker.concurrency_limit.error", worker=self.name)
+            return
+        if limit != self._parallelism_limiter.total_tokens:
+            self._parallelism_limiter.total_tokens = max(limit, 1)
+
+    async def _wait_for_deferral(self, delay: float, release_slot: Callable[[bool], None]) -> None:
+        if self._deferral_limiter is None:
+            raise RuntimeError("Worker must be entered as an async context manager before processing messages")
+        deferral_limiter = self._deferral_limiter
+        token = object()
+        try:
+            deferral_limiter.acquire_on_behalf_of_nowait(token)
+        except anyio.WouldBlock:
+            await anyio.sleep(delay)
+            return
+        try:
+            release_slot(False)
+            await anyio.sleep(delay)
+        finally:
+            deferral_limiter.release_on_behalf_of(token)
+
+    async def _process_message(
+        self,
+        message: TransportMessage,
+        transaction_context: TransactionContext,
+        release_slot: Callable[[bool], None],
+    ) -> bool:
+        """Process the message, returning whether it was dropped (nacked or failed).
+
+        A deferred message is nacked to be redelivered later, which is not a
+        sign of overload and so does not count as dropped. Its slot is
+        released while it waits for its deferral delay, unless
+        ``max_deferred_messages`` messages are waiting already: it then keeps
+        its slot, which holds back the receive loop until deferrals drain.
+        """
+        dropped = False
+
+        async def on_nack(transaction_context: TransactionContext) -> None:
+            nonlocal dropped
+            dropped = MessageDeferredError.transaction_context_key not in transaction_context.items
+
         try:
+            transaction_context.on_nack(on_nack)
             AmbientContext().current = transaction_context
             step_context = IncomingStepContext(message, transaction_context)
             await self.pipeline_invoker(step_context)
+            defer_delay = transaction_context.items.get(MessageDeferredError.transaction_context_key)
+            if defer_delay:
+                await self._wait_for_deferral(defer_delay, release_slot)
             try:
                 await transaction_context.complete()
             except Exception:
                 self.logger.exception("worker.transaction.complete.error", message=message.message_label)
         except Exception:
             self.logger.exception("worker.message.error", message=message.message_label)
+            dropped = True
         finally:
             AmbientContext().current = None
+        return dropped
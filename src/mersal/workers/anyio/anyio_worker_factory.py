@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from mersal.pipeline import PipelineInvoker
     from mersal.transport import Transport
     from mersal.workers.backoff import WorkerBackoffStrategy
+    from mersal.workers.concurrency_limit import ConcurrencyLimit
 
 __all__ = ("AnyioWorkerFactory",)
 
@@ -23,6 +24,8 @@ class AnyioWorkerFactory:
         max_parallelism: int = 1,
         backoff_strategy: WorkerBackoffStrategy | None = None,
         stop_grace_period: float | None = None,
+        concurrency_limit: ConcurrencyLimit | None = None,
+        max_deferred_messages: int | None = None,
     ) -> None:
         self.transport = transport
         self.pipeline_invoker = pipeline_invoker
@@ -30,6 +33,8 @@ class AnyioWorkerFactory:
         self.max_parallelism = max_parallelism
         self.backoff_strategy = backoff_strategy
         self.stop_grace_period = stop_grace_period
+        self.concurrency_limit = concurrency_limit
+        self.max_deferred_messages = max_deferred_messages
         # Populated by Mersal.__init__ right after this factory is constructed.
         self.app: Mersal = cast("Mersal", None)
 
@@ -46,4 +51,6 @@ class AnyioWorkerFactory:
             logger=self.logger,
             backoff_strategy=self.backoff_strategy,
             stop_grace_period=self.stop_grace_period,
+            concurrency_limit=self.concurrency_limit,
+            max_deferred_messages=self.max_deferred_messages,
         )
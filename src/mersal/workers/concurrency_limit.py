@@ -0,0 +1,91 @@
+from typing import Protocol
+
+__all__ = (
+    "AIMDConcurrencyLimit",
+    "ConcurrencyLimit",
+    "FixedConcurrencyLimit",
+)
+
+
+class ConcurrencyLimit(Protocol):
+    """Decides how many messages a worker handles concurrently.
+
+    The worker reports every handled message through :meth:`on_sample` and
+    applies the updated :attr:`limit` before receiving the next message. A
+    lowered limit does not interrupt messages already in flight, it only
+    holds back new receives until enough of them complete.
+    """
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        ...
+
+    def on_sample(self, latency: float, dropped: bool, in_flight: int) -> None:
+        """Record the outcome of a handled message.
+
+        Args:
+            latency: seconds it took to handle the message, including
+                completing its transaction.
+            dropped: whether handling failed (the message was nacked or the
+                pipeline raised).
+            in_flight: number of messages being handled when the message
+                completed, including itself.
+        """
+        ...
+
+
+class FixedConcurrencyLimit:
+    """A constant concurrency limit, equivalent to `max_parallelism`."""
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self._limit = limit
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_sample(self, latency: float, dropped: bool, in_flight: int) -> None:
+        pass
+
+
+class AIMDConcurrencyLimit:
+    """Additive-increase/multiplicative-decrease concurrency limit.
+
+    The limit grows by one for every successful message handled while the
+    worker is using at least half of the current limit, and is multiplied by
+    ``backoff_ratio`` whenever a message fails or takes longer than
+    ``latency_threshold``. It always stays within ``[min_limit, max_limit]``.
+    Not growing while the worker is mostly idle keeps a quiet period from
+    inflating the limit past what the downstream can actually take.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 1,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        latency_threshold: float | None = None,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold
+        self._limit = float(initial_limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_sample(self, latency: float, dropped: bool, in_flight: int) -> None:
+        if dropped or (self.latency_threshold is not None and latency > self.latency_threshold):
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        elif in_flight * 2 >= self._limit:
+            self._limit = min(float(self.max_limit), self._limit + 1)
@@ -6,6 +6,7 @@ import anyio
 import anyio.lowlevel
 import pytest
 
+from mersal.messages import MessageTypeRegistry
 from mersal.pipeline import (
     IncomingStepContext,
     OutgoingStepContext,
@@ -23,6 +24,7 @@ from mersal.transport import DefaultTransactionContext
 from mersal.types import AsyncAnyCallable
 
 __all__ = (
+    "ConditionalIncomingStep",
     "DummyIncomingStep",
     "DummyOutgoingStep",
     "PipelineInvokerTestsBase",
@@ -49,6 +51,15 @@ class DummyIncomingStep(IncomingStep):
         await next_step()
 
 
+class ConditionalIncomingStep(DummyIncomingStep):
+    def __init__(self, order: int, message_types: set[type]) -> None:
+        super().__init__(order)
+        self.message_types = message_types
+
+    def applies_to(self, message_type: type) -> bool | None:
+        return message_type in self.message_types
+
+
 class DummyOutgoingStep(OutgoingStep):
     def __init__(self, order: int) -> None:
         self.order = order
@@ -82,6 +93,38 @@ class PipelineInvokerTestsBase:
         await subject(context)
         assert data == list(range(5))
 
+    async def test_skips_conditional_steps_not_applying_to_the_message_type(
+        self, pipeline_invoker_maker: Callable[..., PipelineInvoker]
+    ) -> None:
+        class Applying:
+            pass
+
+        class NotApplying:
+            pass
+
+        incoming_pipeline = DefaultIncomingPipeline()
+        incoming_pipeline.append_step(DummyIncomingStep(0))
+        incoming_pipeline.append_step(ConditionalIncomingStep(1, {Applying}))
+        incoming_pipeline.append_step(DummyIncomingStep(2))
+        subject = pipeline_invoker_maker(
+            incoming_pipeline=incoming_pipeline, outgoing_pipeline=DefaultOutgoingPipeline()
+        )
+
+        async def invoke(message_type: type | None) -> list[int]:
+            transport_message = TransportMessageBuilder.build()
+            if message_type is not None:
+                transport_message.headers["message_type"] = MessageTypeRegistry.register(message_type)
+            context = IncomingStepContext(message=transport_message, transaction_context=DefaultTransactionContext())
+            data: list[int] = []
+            context.save_keys("dummy-data", data)
+            await subject(context)
+            return data
+
+        assert await invoke(Applying) == [0, 1, 2]
+        assert await invoke(NotApplying) == [0, 2]
+        assert await invoke(NotApplying) == [0, 2]
+        assert await invoke(None) == [0, 1, 2]
+
     async def test_invokes_outgoing(self, pipeline_invoker_maker: Callable[..., PipelineInvoker]) -> None:
         incoming_pipeline = DefaultIncomingPipeline()
         outgoing_pipeline = DefaultOutgoingPipeline()
@@ -0,0 +1,131 @@
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+from mersal.activation import BatchingHandler
+from mersal.exceptions import MersalExceptionError
+from mersal.transport import DefaultTransactionContext, TransactionContext
+
+__all__ = (
+    "BatchHandlerError",
+    "CommitError",
+    "RecordingBatchHandler",
+    "TestBatchingHandler",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class BatchHandlerError(Exception):
+    pass
+
+
+class CommitError(Exception):
+    pass
+
+
+class RecordingBatchHandler:
+    def __init__(self, fail_on: set[int] | None = None) -> None:
+        self.batches: list[list[int]] = []
+        self.fail_on = fail_on or set()
+
+    async def __call__(self, messages: list[int]) -> None:
+        self.batches.append(messages)
+        if self.fail_on.intersection(messages):
+            raise BatchHandlerError("failed")
+
+
+def _message_context(message_id: int, transaction_context: TransactionContext):
+    return SimpleNamespace(headers=SimpleNamespace(message_id=message_id), transaction_context=transaction_context)
+
+
+async def _handle_concurrently(
+    subject: BatchingHandler, messages: list[int], failing_commits: set[int] | None = None
+) -> dict[int, BaseException | None]:
+    outcomes: dict[int, BaseException | None] = {}
+
+    async def fail_commit(_: TransactionContext) -> None:
+        raise CommitError()
+
+    async def handle(message: int) -> None:
+        # Settles the transaction the way the retry step and worker would.
+        async with DefaultTransactionContext() as transaction_context:
+            if message in (failing_commits or set()):
+                transaction_context.on_commit(fail_commit)
+            try:
+                await subject.handle(message, _message_context(message, transaction_context), None)  # type: ignore[arg-type]
+                outcomes[message] = None
+                transaction_context.set_result(commit=True, ack=True)
+            except Exception as e:  # noqa: BLE001
+                outcomes[message] = e
+                transaction_context.set_result(commit=False, ack=False)
+            try:
+                await transaction_context.complete()
+            except CommitError as e:
+                outcomes[message] = e
+
+    async with anyio.create_task_group() as tg:
+        for message in messages:
+            _ = tg.start_soon(handle, message)
+    return outcomes
+
+
+class TestBatchingHandler:
+    async def test_invokes_handler_once_per_full_batch(self):
+        handler = RecordingBatchHandler()
+        subject = BatchingHandler(lambda _, __: handler, max_batch_size=3, max_wait=10)
+
+        with anyio.fail_after(1):
+            outcomes = await _handle_concurrently(subject, [1, 2, 3, 4, 5, 6])
+
+        assert sorted(sorted(b) for b in handler.batches) == [[1, 2, 3], [4, 5, 6]]
+        assert all(outcome is None for outcome in outcomes.values())
+
+    async def test_flushes_partial_batch_after_max_wait(self):
+        handler = RecordingBatchHandler()
+        subject = BatchingHandler(lambda _, __: handler, max_batch_size=10, max_wait=0.05)
+
+        with anyio.fail_after(1):
+            await _handle_concurrently(subject, [1, 2])
+
+        assert [sorted(b) for b in handler.batches] == [[1, 2]]
+
+    async def test_failure_fails_every_message_of_the_batch(self):
+        handler = RecordingBatchHandler(fail_on={2})
+        subject = BatchingHandler(lambda _, __: handler, max_batch_size=3, max_wait=10)
+
+        outcomes = await _handle_concurrently(subject, [1, 2, 3])
+
+        assert all(isinstance(outcome, BatchHandlerError) for outcome in outcomes.values())
+
+    async def test_failed_messages_are_retried_individually(self):
+        handler = RecordingBatchHandler(fail_on={2})
+        subject = BatchingHandler(lambda _, __: handler, max_batch_size=3, max_wait=10)
+        await _handle_concurrently(subject, [1, 2, 3])
+        handler.batches.clear()
+
+        with anyio.fail_after(1):
+            outcomes = await _handle_concurrently(subject, [1, 2, 3])
+
+        assert sorted(handler.batches) == [[1], [2], [3]]
+        assert outcomes[1] is None
+        assert isinstance(outcomes[2], BatchHandlerError)
+        assert outcomes[3] is None
+
+    async def test_batch_fails_when_leader_commit_fails(self):
+        handler = RecordingBatchHandler()
+        subject = BatchingHandler(lambda _, __: handler, max_batch_size=3, max_wait=10)
+
+        with anyio.fail_after(1):
+            outcomes = await _handle_concurrently(subject, [1, 2, 3], failing_commits={1})
+
+        assert handler.batches == [[1, 2, 3]]
+        assert isinstance(outcomes[1], CommitError)
+        assert isinstance(outcomes[2], MersalExceptionError)
+        assert isinstance(outcomes[3], MersalExceptionError)
+
+    def test_rejects_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            BatchingHandler(lambda _, __: RecordingBatchHandler(), max_batch_size=0, max_wait=1)
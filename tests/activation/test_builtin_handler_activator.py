@@ -1,7 +1,15 @@
+import typing
+import uuid
+from dataclasses import dataclass
+
 import pytest
 
-from mersal.activation import BuiltinHandlerActivator
-from mersal.pipeline import IncomingStepContext
+from mersal.activation import BuiltinHandlerActivator, HandlerLifetime
+from mersal.core.app import Mersal
+from mersal.exceptions import MersalExceptionError
+from mersal.pipeline import IncomingStepContext, MessageContext
+from mersal.sagas import SagaBase, SagaData
+from mersal.sagas.correlator import Correlator
 from mersal.testing.core.test_doubles import TransportMessageBuilder
 from mersal.transport import TransactionContext
 from mersal.transport.transaction_scope import TransactionScope
@@ -10,6 +18,8 @@ __all__ = (
     "ChildDummyMessage",
     "DummyMessage",
     "DummyMessageHandler",
+    "DummySaga",
+    "DummySagaData",
     "TestBuiltinHandlerActivator",
 )
 
@@ -34,6 +44,28 @@ class DummyMessageHandler:
         self.count.append(self.calls)
 
 
+@dataclass
+class DummySagaData:
+    pass
+
+
+class DummySaga(SagaBase[DummySagaData]):
+    initiating_message_types: typing.ClassVar = {DummyMessage}
+
+    def correlate_messages(self, correlator: Correlator) -> None:
+        pass
+
+    def generate_new_data(self) -> SagaData[DummySagaData]:
+        return SagaData(uuid.uuid4(), revision=0, data=DummySagaData())
+
+    async def __call__(self, message: DummyMessage) -> None:
+        pass
+
+
+def create_dummy_saga(message_context: MessageContext, app: Mersal) -> DummySaga:
+    return DummySaga()
+
+
 class TestBuiltinHandlerActivator:
     def set_up_dummy_incoming_step_context(self, transaction_context: TransactionContext):
         _ = IncomingStepContext(TransportMessageBuilder.build(), transaction_context)
@@ -86,3 +118,75 @@ class TestBuiltinHandlerActivator:
                 await handler(child_message)
 
             assert calls == [1, 2]
+
+    async def test_registering_invalidates_resolved_handlers(self):
+        subject = BuiltinHandlerActivator()
+        calls: list[int] = []
+        child_message = ChildDummyMessage()
+        subject.register(ChildDummyMessage, lambda message_context, app: DummyMessageHandler(1, calls))
+        async with TransactionScope() as scope:
+            self.set_up_dummy_incoming_step_context(scope.transaction_context)
+            assert len(await subject.get_handlers(child_message, scope.transaction_context)) == 1
+
+            subject.register(DummyMessage, lambda message_context, app: DummyMessageHandler(2, calls))
+            handlers = await subject.get_handlers(child_message, scope.transaction_context)
+
+            for handler in handlers:
+                await handler(child_message)
+
+            assert calls == [1, 2]
+
+    async def _get_handler(self, subject: BuiltinHandlerActivator) -> object:
+        async with TransactionScope() as scope:
+            self.set_up_dummy_incoming_step_context(scope.transaction_context)
+            (handler,) = await subject.get_handlers(DummyMessage(), scope.transaction_context)
+        return handler
+
+    async def test_per_message_lifetime(self):
+        subject = BuiltinHandlerActivator()
+        subject.register(DummyMessage, lambda message_context, app: DummyMessageHandler(1, []))
+
+        assert await self._get_handler(subject) is not await self._get_handler(subject)
+
+    async def test_singleton_lifetime(self):
+        subject = BuiltinHandlerActivator()
+        subject.register(
+            DummyMessage,
+            lambda message_context, app: DummyMessageHandler(1, []),
+            lifetime=HandlerLifetime.SINGLETON,
+        )
+
+        assert await self._get_handler(subject) is await self._get_handler(subject)
+
+    async def test_pooled_lifetime_reuses_released_handlers(self):
+        subject = BuiltinHandlerActivator()
+        subject.register(
+            DummyMessage,
+            lambda message_context, app: DummyMessageHandler(1, []),
+            lifetime=HandlerLifetime.POOLED,
+        )
+
+        async with TransactionScope() as scope1, TransactionScope() as scope2:
+            self.set_up_dummy_incoming_step_context(scope1.transaction_context)
+            self.set_up_dummy_incoming_step_context(scope2.transaction_context)
+            (handler1,) = await subject.get_handlers(DummyMessage(), scope1.transaction_context)
+            (handler2,) = await subject.get_handlers(DummyMessage(), scope2.transaction_context)
+
+            assert handler1 is not handler2
+
+        assert await self._get_handler(subject) in (handler1, handler2)
+
+    @pytest.mark.parametrize("lifetime", [HandlerLifetime.SINGLETON, HandlerLifetime.POOLED])
+    async def test_rejects_shared_lifetimes_for_sagas(self, lifetime: HandlerLifetime):
+        subject = BuiltinHandlerActivator()
+
+        with pytest.raises(MersalExceptionError):
+            subject.register(DummyMessage, create_dummy_saga, lifetime=lifetime)
+
+    @pytest.mark.parametrize("lifetime", [HandlerLifetime.SINGLETON, HandlerLifetime.POOLED])
+    async def test_rejects_shared_lifetimes_for_sagas_from_unannotated_factories(self, lifetime: HandlerLifetime):
+        subject = BuiltinHandlerActivator()
+        subject.register(DummyMessage, lambda message_context, app: DummySaga(), lifetime=lifetime)
+
+        with pytest.raises(MersalExceptionError):
+            await self._get_handler(subject)
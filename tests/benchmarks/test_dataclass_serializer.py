@@ -0,0 +1,82 @@
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import pytest
+
+from mersal.serialization import Serializer
+from mersal.serialization.dataclass_serializer import DataclassSerializer
+
+__all__ = (
+    "AsdictSerializer",
+    "FlatMessage",
+    "NestedMessage",
+    "OrderLine",
+    "TestDataclassSerializerBenchmark",
+)
+
+
+@dataclass
+class FlatMessage:
+    order_id: str = "order-1"
+    customer_id: str = "customer-1"
+    amount: float = 10.5
+    currency: str = "USD"
+    quantity: int = 3
+    express: bool = False
+
+
+@dataclass
+class OrderLine:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclass
+class NestedMessage:
+    order_id: str = "order-1"
+    lines: list[OrderLine] = field(default_factory=lambda: [OrderLine(f"sku-{i}", i, 1.5) for i in range(20)])
+
+
+class AsdictSerializer:
+    """The previous `dataclasses.asdict` based implementation, as the baseline."""
+
+    def __init__(self, types: set[type]) -> None:
+        self._types = {t.__name__: t for t in types}
+
+    def serialize(self, obj: Any) -> Any:
+        return {"type": type(obj).__name__, "data": asdict(obj)}
+
+    def deserialize(self, data: Any) -> Any:
+        return self._types[data["type"]](**data["data"])
+
+
+class TestDataclassSerializerBenchmark:
+    """Compares the generated codecs with the `asdict` baseline.
+
+    Run with `--runslow -s`; the elapsed time is printed per serializer.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message_type", [FlatMessage, NestedMessage])
+    @pytest.mark.parametrize("serializer_type", [AsdictSerializer, DataclassSerializer])
+    def test_round_trip(self, serializer_type: type[Serializer], message_type: type) -> None:
+        serializer = serializer_type({message_type})  # type: ignore[call-arg]
+        message = message_type()
+
+        iterations = 20_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            data = serializer.serialize(message)
+        serialize_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            serializer.deserialize(data)
+        deserialize_time = time.perf_counter() - t0
+
+        print(
+            f"{serializer_type.__name__} {message_type.__name__}: {iterations} serializations took "
+            f"{serialize_time:.3f}s, deserializations took {deserialize_time:.3f}s"
+        )
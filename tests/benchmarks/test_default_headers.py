@@ -0,0 +1,50 @@
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pytest
+
+from mersal.messages import LogicalMessage, MessageHeaders
+from mersal.pipeline import IsoTimestampClock, TimeOrderedMessageIdGenerator
+
+__all__ = ("TestDefaultHeadersBenchmark",)
+
+
+class TestDefaultHeadersBenchmark:
+    """Compares generating message ids and sent times per outgoing message.
+
+    Run with `--runslow -s`; the elapsed time is printed per generator.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "generator",
+        [lambda _: uuid.uuid4(), TimeOrderedMessageIdGenerator()],
+        ids=["uuid4", "time_ordered"],
+    )
+    def test_message_id(self, generator: Callable[[LogicalMessage], object]) -> None:
+        message = LogicalMessage(body={}, headers=MessageHeaders())
+
+        iterations = 100_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            str(generator(message))
+        elapsed_time = time.perf_counter() - t0
+
+        print(f"{iterations} message ids took {elapsed_time:.3f}s")
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "clock",
+        [lambda: datetime.now(UTC).isoformat(), IsoTimestampClock()],
+        ids=["datetime_isoformat", "iso_timestamp_clock"],
+    )
+    def test_sent_time(self, clock: Callable[[], str]) -> None:
+        iterations = 100_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            clock()
+        elapsed_time = time.perf_counter() - t0
+
+        print(f"{iterations} sent times took {elapsed_time:.3f}s")
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator, HandlerLifetime
+from mersal.pipeline import IncomingStepContext
+from mersal.testing.core.test_doubles import TransportMessageBuilder
+from mersal.transport.transaction_scope import TransactionScope
+
+__all__ = (
+    "DummyMessageHandler",
+    "TestHandlerDispatchBenchmark",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _deep_hierarchy(depth: int) -> list[type]:
+    classes: list[type] = [type("Message0", (), {})]
+    for i in range(1, depth):
+        classes.append(type(f"Message{i}", (classes[-1],), {}))
+    return classes
+
+
+class DummyMessageHandler:
+    async def __call__(self, message: object) -> None:
+        pass
+
+
+class TestHandlerDispatchBenchmark:
+    """Measures the per-message cost of `BuiltinHandlerActivator.get_handlers`.
+
+    Run with `--runslow -s`; the elapsed time is printed per lifetime.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("lifetime", list(HandlerLifetime))
+    async def test_dispatch_for_deep_class_hierarchy(self, lifetime: HandlerLifetime) -> None:
+        classes = _deep_hierarchy(depth=20)
+        subject = BuiltinHandlerActivator()
+        subject.register(classes[0], lambda message_context, app: DummyMessageHandler(), lifetime=lifetime)
+        subject.register(classes[10], lambda message_context, app: DummyMessageHandler(), lifetime=lifetime)
+        message = classes[-1]()
+
+        iterations = 100_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            async with TransactionScope() as scope:
+                IncomingStepContext(TransportMessageBuilder.build(), scope.transaction_context)
+                handlers = await subject.get_handlers(message, scope.transaction_context)
+        elapsed_time = time.perf_counter() - t0
+
+        assert len(handlers) == 2
+        print(f"{lifetime.name}: {iterations} dispatches took {elapsed_time:.3f}s")
@@ -0,0 +1,52 @@
+import time
+import tracemalloc
+import uuid
+
+import pytest
+
+from mersal.messages import LogicalMessage, MessageHeaders, TransportMessage
+
+__all__ = ("TestMessageBenchmark",)
+
+
+def _headers() -> dict[str, str]:
+    return {
+        "message_id": str(uuid.uuid4()),
+        "sent_time": "2024-05-01T12:30:00+00:00",
+        "message_type": "orders:OrderPlaced",
+        "correlation_id": str(uuid.uuid4()),
+        "correlation_sequence": "0",
+    }
+
+
+class TestMessageBenchmark:
+    """Measures construction time and memory of messages and their headers.
+
+    Run with `--runslow -s`; the results are printed.
+    """
+
+    @pytest.mark.slow
+    def test_construction(self) -> None:
+        raw_headers = _headers()
+
+        iterations = 100_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            headers = MessageHeaders(raw_headers)
+            TransportMessage(b"", MessageHeaders(headers))
+            _ = LogicalMessage(None, headers).message_label
+        elapsed_time = time.perf_counter() - t0
+
+        print(f"{iterations} header/message constructions took {elapsed_time:.3f}s")
+
+    @pytest.mark.slow
+    def test_memory_per_message(self) -> None:
+        raw_headers = [_headers() for _ in range(10_000)]
+
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        messages = [LogicalMessage(None, MessageHeaders(h)) for h in raw_headers]
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{(after - before) / len(messages):.0f} bytes per message with headers")
@@ -0,0 +1,58 @@
+import time
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.core.app import Mersal
+from mersal.metrics import MetricsConfig
+from mersal.testing.core.test_doubles import DummyMessage
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = ("TestPipelineBenchmark",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestPipelineBenchmark:
+    """Measures the per-message overhead of the default incoming pipeline.
+
+    Messages are queued before the app starts so that only receiving,
+    pipeline and handler dispatch are timed. Run with `--runslow -s`.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("metrics", [None, MetricsConfig()], ids=["without_metrics", "with_metrics"])
+    async def test_incoming_pipeline_overhead(self, metrics: MetricsConfig | None) -> None:
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        activator = BuiltinHandlerActivator()
+        iterations = 20_000
+        handled = anyio.Event()
+        count = 0
+
+        async def handler(message: DummyMessage) -> None:
+            nonlocal count
+            count += 1
+            if count == iterations:
+                handled.set()
+
+        activator.register(DummyMessage, lambda _, __: handler)
+        plugins = [InMemoryTransportPluginConfig(network, queue_address).plugin]
+        app = Mersal("m1", activator, plugins=plugins, metrics=metrics)
+        message = DummyMessage()
+        for _ in range(iterations):
+            await app.send_local(message)
+
+        t0 = time.perf_counter()
+        await app.start()
+        with anyio.fail_after(120):
+            await handled.wait()
+        elapsed_time = time.perf_counter() - t0
+        await app.stop()
+
+        print(f"{iterations} messages took {elapsed_time:.3f}s ({elapsed_time / iterations * 1e6:.1f}us/message)")
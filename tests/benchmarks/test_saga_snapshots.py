@@ -0,0 +1,65 @@
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import pytest
+
+from mersal.sagas import (
+    DataclassReplaceSnapshotStrategy,
+    DeepCopySnapshotStrategy,
+    PickleSnapshotStrategy,
+    SagaData,
+    SnapshotStrategy,
+)
+
+__all__ = (
+    "FlatSagaData",
+    "NestedSagaData",
+    "TestSagaSnapshotBenchmark",
+)
+
+
+@dataclass
+class FlatSagaData:
+    order_id: str = "order-1"
+    customer_id: str = "customer-1"
+    amount: float = 10.5
+    currency: str = "USD"
+    paid: bool = False
+    shipped: bool = False
+    attempts: int = 0
+    status: str = "pending"
+
+
+@dataclass
+class NestedSagaData:
+    order_id: str = "order-1"
+    lines: list[dict[str, object]] = field(
+        default_factory=lambda: [{"sku": f"sku-{i}", "quantity": i, "price": 1.5} for i in range(20)]
+    )
+    events: list[str] = field(default_factory=lambda: [f"event-{i}" for i in range(20)])
+
+
+class TestSagaSnapshotBenchmark:
+    """Compares snapshot strategies at typical saga data sizes.
+
+    Run with `--runslow -s`; the elapsed time is printed per strategy.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("data_type", [FlatSagaData, NestedSagaData])
+    @pytest.mark.parametrize(
+        "strategy",
+        [DeepCopySnapshotStrategy(), PickleSnapshotStrategy(), DataclassReplaceSnapshotStrategy()],
+        ids=lambda s: type(s).__name__,
+    )
+    def test_snapshot(self, strategy: SnapshotStrategy, data_type: type) -> None:
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=data_type())
+
+        iterations = 20_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            strategy(saga_data)
+        elapsed_time = time.perf_counter() - t0
+
+        print(f"{type(strategy).__name__} {data_type.__name__}: {iterations} snapshots took {elapsed_time:.3f}s")
@@ -0,0 +1,91 @@
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from mersal.persistence.file_system import FileSystemSagaStorage
+from mersal.persistence.in_memory import InMemorySagaStorage
+from mersal.persistence.sqlite import SqliteSagaStorage
+from mersal.sagas import CorrelationProperty, SagaData, SagaStorage
+from mersal.transport import DefaultTransactionContext
+
+__all__ = (
+    "OrderSagaData",
+    "TestSagaStorageBenchmark",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class OrderSagaData:
+    order_id: str
+    status: str = "pending"
+    attempts: int = 0
+
+
+order_id_property = CorrelationProperty(
+    message_type=object,
+    saga_data_type=OrderSagaData,
+    property_name="order_id",
+    value_extractor=lambda context: None,
+)
+
+storage_factories: dict[str, Callable[[Path], SagaStorage]] = {
+    "in_memory": lambda _: InMemorySagaStorage(),
+    "file_system": lambda path: FileSystemSagaStorage(path),
+    "sqlite": lambda path: SqliteSagaStorage(path / "sagas.db"),
+}
+
+
+class TestSagaStorageBenchmark:
+    """Compares saga storage throughput for the find/update cycle of a saga message.
+
+    Run with `--runslow -s`; the elapsed time is printed per storage.
+    """
+
+    sagas_count = 200
+    messages_per_saga = 4
+
+    @pytest.fixture(params=list(storage_factories), ids=list(storage_factories))
+    async def storage(self, request: pytest.FixtureRequest, tmp_path: Path) -> AsyncIterator[SagaStorage]:
+        storage = storage_factories[request.param](tmp_path)
+        await storage()
+        yield storage
+        if isinstance(storage, SqliteSagaStorage):
+            storage.close()
+
+    @pytest.mark.slow
+    async def test_find_and_update(self, storage: SagaStorage) -> None:
+        order_ids = [f"order-{i}" for i in range(self.sagas_count)]
+
+        t0 = time.perf_counter()
+        for order_id in order_ids:
+            async with DefaultTransactionContext() as ctx:
+                saga_data = SagaData(uuid.uuid4(), revision=0, data=OrderSagaData(order_id))
+                await storage.insert(saga_data, [order_id_property], ctx)
+                ctx.set_result(commit=True, ack=True)
+                await ctx.complete()
+        insert_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(self.messages_per_saga):
+            for order_id in order_ids:
+                async with DefaultTransactionContext() as ctx:
+                    found = await storage.find(OrderSagaData, "order_id", order_id)
+                    assert found is not None
+                    found.data.attempts += 1
+                    await storage.update(found, [order_id_property], ctx)
+                    ctx.set_result(commit=True, ack=True)
+                    await ctx.complete()
+        update_time = time.perf_counter() - t0
+
+        updates = self.sagas_count * self.messages_per_saga
+        print(
+            f"{type(storage).__name__}: {self.sagas_count} inserts took {insert_time:.3f}s, "
+            f"{updates} find/updates took {update_time:.3f}s"
+        )
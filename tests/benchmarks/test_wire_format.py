@@ -0,0 +1,51 @@
+import time
+import uuid
+
+import pytest
+
+from mersal.messages import TransportMessage
+from mersal.messages.message_headers import MessageHeaders
+from mersal.transport import BinaryWireFormat, JsonWireFormat, WireFormat
+
+__all__ = ("TestWireFormatBenchmark",)
+
+
+def _message(body: object) -> TransportMessage:
+    return TransportMessage(
+        body=body,
+        headers=MessageHeaders(
+            {
+                "message_id": str(uuid.uuid4()),
+                "sent_time": "2024-05-01T12:30:00+00:00",
+                "message_type": "orders.OrderPlaced",
+                "correlation_id": str(uuid.uuid4()),
+                "correlation_sequence": "0",
+            }
+        ),
+    )
+
+
+class TestWireFormatBenchmark:
+    """Compares encoding and decoding transport messages with the JSON and binary formats.
+
+    Run with `--runslow -s`; the elapsed time and encoded size are printed per format.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "body",
+        [b"x" * 64, b"x" * 64 * 1024, {"order_id": "order-1", "lines": [{"sku": "sku-1", "quantity": 2}] * 20}],
+        ids=["small-bytes", "large-bytes", "json"],
+    )
+    @pytest.mark.parametrize("wire_format", [JsonWireFormat(), BinaryWireFormat()], ids=lambda f: type(f).__name__)
+    def test_round_trip(self, wire_format: WireFormat, body: object) -> None:
+        message = _message(body)
+
+        iterations = 10_000
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            encoded = wire_format.encode(message)
+            wire_format.decode(encoded)
+        elapsed_time = time.perf_counter() - t0
+
+        print(f"{type(wire_format).__name__}: {iterations} round trips took {elapsed_time:.3f}s, {len(encoded)} bytes")
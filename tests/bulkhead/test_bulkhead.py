@@ -0,0 +1,73 @@
+import pytest
+
+from mersal.bulkhead import Bulkhead
+
+__all__ = ("TestBulkhead",)
+
+
+class Slow:
+    pass
+
+
+class Fast:
+    pass
+
+
+class TestBulkhead:
+    def test_enforces_limits(self):
+        subject = Bulkhead(limits={Slow: 2})
+
+        assert subject.try_enter({Slow})
+        assert subject.try_enter({Slow})
+        assert not subject.try_enter({Slow})
+        assert subject.try_enter({Fast})
+
+        subject.exit({Slow})
+        assert subject.try_enter({Slow})
+
+    def test_enters_all_compartments_or_none(self):
+        subject = Bulkhead(limits={Slow: 1, Fast: 1})
+        assert subject.try_enter({Slow})
+
+        assert not subject.try_enter({Slow, Fast})
+        assert subject.in_flight(Fast) == 0
+
+    def test_weighted_compartment_may_use_spare_capacity(self):
+        subject = Bulkhead(weights={Slow: 1, Fast: 1}, capacity=4)
+
+        for _ in range(4):
+            assert subject.try_enter({Slow})
+        assert not subject.try_enter({Slow})
+
+    def test_weighted_compartment_over_its_share_yields_to_contending_ones(self):
+        subject = Bulkhead(weights={Slow: 1, Fast: 3}, capacity=4)
+        for _ in range(4):
+            assert subject.try_enter({Slow})
+
+        assert not subject.try_enter({Fast})
+        subject.exit({Slow})
+
+        # Fast was turned away recently, the freed slot is reserved for it.
+        assert not subject.try_enter({Slow})
+        assert subject.try_enter({Fast})
+
+    def test_contention_expires(self):
+        subject = Bulkhead(weights={Slow: 1, Fast: 1}, capacity=2, contention_window=0)
+        assert subject.try_enter({Slow})
+        assert subject.try_enter({Slow})
+        assert not subject.try_enter({Fast})
+        subject.exit({Slow})
+
+        assert subject.try_enter({Slow})
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"weights": {Slow: 1}},
+            {"limits": {Slow: 0}},
+            {"weights": {Slow: 0}, "capacity": 1},
+        ],
+    )
+    def test_rejects_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            Bulkhead(**kwargs)
@@ -0,0 +1,156 @@
+import typing
+import uuid
+from dataclasses import dataclass
+
+import anyio
+import pytest
+
+from mersal.bulkhead import Bulkhead, BulkheadStep
+from mersal.exceptions import MessageDeferredError
+from mersal.messages import BatchMessage, LogicalMessage, MessageHeaders
+from mersal.pipeline import IncomingStepContext
+from mersal.pipeline.receive.handler_invoker import HandlerInvoker
+from mersal.pipeline.receive.handler_invokers import HandlerInvokers
+from mersal.pipeline.receive.saga_handler_invoker import SagaHandlerInvoker
+from mersal.process_pool.process_pool_handler import ProcessPoolHandler
+from mersal.process_pool.process_pool_handler_executor import ProcessPoolHandlerExecutor
+from mersal.sagas import SagaBase, SagaData
+from mersal.sagas.correlator import Correlator
+from mersal.testing.core.counter import Counter
+from mersal.testing.core.test_doubles import TransportMessageBuilder
+from mersal.transport import DefaultTransactionContext, TransactionContext
+
+pytestmark = pytest.mark.anyio
+
+
+__all__ = ("TestBulkheadStep",)
+
+
+class Message:
+    pass
+
+
+class DerivedMessage(Message):
+    pass
+
+
+class OtherMessage:
+    pass
+
+
+@dataclass
+class SagaDataForTest:
+    value: int = 0
+
+
+class Saga(SagaBase[SagaDataForTest]):
+    initiating_message_types: typing.ClassVar = {OtherMessage}
+
+    def correlate_messages(self, correlator: Correlator) -> None:
+        pass
+
+    def generate_new_data(self) -> SagaData[SagaDataForTest]:
+        return SagaData(uuid.uuid4(), revision=0, data=SagaDataForTest())
+
+
+class Handler:
+    async def __call__(self, message):
+        pass
+
+
+def _context(body: object, handlers: list | None = None) -> IncomingStepContext:
+    transaction_context = DefaultTransactionContext()
+    context = IncomingStepContext(
+        message=TransportMessageBuilder.build(),
+        transaction_context=transaction_context,
+    )
+    logical_message = LogicalMessage(body, MessageHeaders())
+    context.save(logical_message, LogicalMessage)
+    invokers = [HandlerInvoker(Counter().task, h, transaction_context) for h in handlers or []]
+    context.save(HandlerInvokers(logical_message, invokers))
+    return context
+
+
+class TestBulkheadStep:
+    async def test_holds_compartment_while_next_step_runs(self):
+        bulkhead = Bulkhead(limits={Message: 1})
+        subject = BulkheadStep(bulkhead, key="message_type", defer_delay=0)
+        in_flight = []
+
+        async def next_step():
+            in_flight.append(bulkhead.in_flight(Message))
+
+        await subject(_context(DerivedMessage()), next_step)
+
+        assert in_flight == [1]
+        assert bulkhead.in_flight(Message) == 0
+
+    async def test_defers_messages_when_compartment_is_full(self):
+        bulkhead = Bulkhead(limits={Message: 1})
+        subject = BulkheadStep(bulkhead, key="message_type", defer_delay=0)
+        counter = Counter()
+        assert bulkhead.try_enter({Message})
+
+        with pytest.raises(MessageDeferredError):
+            await subject(_context(Message()), counter.task)
+
+        assert counter.total == 0
+
+    async def test_defers_with_delay_without_waiting(self):
+        bulkhead = Bulkhead(limits={Message: 1})
+        subject = BulkheadStep(bulkhead, key="message_type", defer_delay=10)
+        assert bulkhead.try_enter({Message})
+
+        with anyio.fail_after(1), pytest.raises(MessageDeferredError) as e:
+            await subject(_context(Message()), Counter().task)
+
+        assert e.value.delay == 10
+
+    async def test_passes_through_messages_without_compartment(self):
+        bulkhead = Bulkhead(limits={Message: 1})
+        subject = BulkheadStep(bulkhead, key="message_type", defer_delay=0)
+        assert bulkhead.try_enter({Message})
+        counter = Counter()
+
+        await subject(_context(OtherMessage()), counter.task)
+
+        assert counter.total == 1
+
+    async def test_batch_messages_enter_compartments_of_all_their_messages(self):
+        bulkhead = Bulkhead(limits={Message: 1, OtherMessage: 1})
+        subject = BulkheadStep(bulkhead, key="message_type", defer_delay=0)
+        assert bulkhead.try_enter({OtherMessage})
+
+        with pytest.raises(MessageDeferredError):
+            await subject(_context(BatchMessage([Message(), OtherMessage()])), Counter().task)
+
+        assert bulkhead.in_flight(Message) == 0
+
+    async def test_handler_type_compartments(self):
+        bulkhead = Bulkhead(limits={Handler: 1})
+        subject = BulkheadStep(bulkhead, key="handler_type", defer_delay=0)
+        assert bulkhead.try_enter({Handler})
+
+        with pytest.raises(MessageDeferredError):
+            await subject(_context(OtherMessage(), [Handler()]), Counter().task)
+
+    async def test_handler_type_compartments_of_wrapped_handlers(self):
+        bulkhead = Bulkhead(limits={Handler: 1})
+        subject = BulkheadStep(bulkhead, key="handler_type", defer_delay=0)
+        assert bulkhead.try_enter({Handler})
+        handler = ProcessPoolHandler(Handler(), typing.cast("ProcessPoolHandlerExecutor", None))
+
+        with pytest.raises(MessageDeferredError):
+            await subject(_context(OtherMessage(), [handler]), Counter().task)
+
+    async def test_saga_handler_type_compartments(self):
+        bulkhead = Bulkhead(limits={Saga: 1})
+        subject = BulkheadStep(bulkhead, key="handler_type", defer_delay=0)
+        context = _context(OtherMessage())
+        transaction_context = context.load(TransactionContext)
+        invoker = SagaHandlerInvoker(Saga(), HandlerInvoker(Counter().task, Saga(), transaction_context))
+        context.save(HandlerInvokers(context.load(LogicalMessage), [invoker]))
+        assert bulkhead.try_enter({Saga})
+
+        with pytest.raises(MessageDeferredError):
+            await subject(context, Counter().task)
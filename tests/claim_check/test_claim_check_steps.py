@@ -0,0 +1,181 @@
+import pytest
+
+from mersal.claim_check import (
+    CLAIM_CHECK_ENCODING_KEY,
+    CLAIM_CHECK_KEY,
+    ClaimCheckIncomingStep,
+    ClaimCheckOutgoingStep,
+)
+from mersal.messages import LogicalMessage, MessageHeaders, TransportMessage
+from mersal.persistence.in_memory import InMemoryBlobStore
+from mersal.pipeline import DestinationAddresses, IncomingStepContext, OutgoingStepContext
+from mersal.testing.core.counter import Counter
+from mersal.testing.core.test_doubles import (
+    LogicalMessageBuilder,
+    TransportMessageBuilder,
+)
+from mersal.transport import DefaultTransactionContext
+
+pytestmark = pytest.mark.anyio
+
+
+__all__ = (
+    "TestClaimCheckIncomingStep",
+    "TestClaimCheckOutgoingStep",
+)
+
+
+def _outgoing_context(
+    body: object,
+    transaction_context: DefaultTransactionContext,
+    addresses: set[str] | None = None,
+) -> OutgoingStepContext:
+    context = OutgoingStepContext(
+        message=LogicalMessageBuilder.build(use_dummy_message=True),
+        transaction_context=transaction_context,
+        destination_addresses=DestinationAddresses(addresses if addresses is not None else {"queue"}),
+    )
+    context.save(TransportMessage(body=body, headers=MessageHeaders(message_id="1")))
+    return context
+
+
+class TestClaimCheckOutgoingStep:
+    async def test_stores_large_bytes_body(self):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        context = _outgoing_context(b"a" * 10, DefaultTransactionContext())
+        counter = Counter()
+
+        await subject(context, counter.task)
+
+        transport_message = context.load(TransportMessage)
+        assert counter.total == 1
+        assert transport_message.body == b""
+        assert transport_message.headers.message_id == "1"
+        assert transport_message.headers[CLAIM_CHECK_ENCODING_KEY] == "bytes"
+        assert await store.get(transport_message.headers[CLAIM_CHECK_KEY]) == b"a" * 10
+
+    async def test_stores_large_str_body(self):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        context = _outgoing_context("ب" * 5, DefaultTransactionContext())
+
+        await subject(context, Counter().task)
+
+        transport_message = context.load(TransportMessage)
+        assert transport_message.headers[CLAIM_CHECK_ENCODING_KEY] == "str"
+        assert await store.get(transport_message.headers[CLAIM_CHECK_KEY]) == ("ب" * 5).encode()
+
+    @pytest.mark.parametrize("body", [b"a" * 9, "a" * 9, {"a": "a" * 100}])
+    async def test_leaves_small_or_unsupported_bodies(self, body):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        context = _outgoing_context(body, DefaultTransactionContext())
+        counter = Counter()
+
+        await subject(context, counter.task)
+
+        transport_message = context.load(TransportMessage)
+        assert counter.total == 1
+        assert transport_message.body == body
+        assert CLAIM_CHECK_KEY not in transport_message.headers
+        assert store.blobs_count == 0
+
+    async def test_skips_messages_without_destinations(self):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        context = _outgoing_context(b"a" * 10, DefaultTransactionContext(), addresses=set())
+
+        await subject(context, Counter().task)
+
+        assert CLAIM_CHECK_KEY not in context.load(TransportMessage).headers
+        assert store.blobs_count == 0
+
+    async def test_claims_once_per_destination(self):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        context = _outgoing_context(b"a" * 10, DefaultTransactionContext(), addresses={"q1", "q2"})
+
+        await subject(context, Counter().task)
+
+        key = context.load(TransportMessage).headers[CLAIM_CHECK_KEY]
+        await store.release(key)
+        assert store.blobs_count == 1
+        await store.release(key)
+        assert store.blobs_count == 0
+
+    async def test_releases_claims_on_rollback(self):
+        store = InMemoryBlobStore()
+        subject = ClaimCheckOutgoingStep(blob_store=store, threshold=10)
+        transaction_context = DefaultTransactionContext()
+        context = _outgoing_context(b"a" * 10, transaction_context, addresses={"q1", "q2"})
+
+        await subject(context, Counter().task)
+        assert store.blobs_count == 1
+
+        transaction_context.set_result(commit=False, ack=False)
+        await transaction_context.complete()
+        assert store.blobs_count == 0
+
+
+class TestClaimCheckIncomingStep:
+    async def test_resolves_body(self):
+        store = InMemoryBlobStore()
+        key = await store.put("ب".encode())
+        subject = ClaimCheckIncomingStep(blob_store=store, release_after_ack=True)
+        transport_message = TransportMessageBuilder.build()
+        transport_message.body = b""
+        transport_message.headers[CLAIM_CHECK_KEY] = key
+        transport_message.headers[CLAIM_CHECK_ENCODING_KEY] = "str"
+        context = IncomingStepContext(
+            message=transport_message,
+            transaction_context=DefaultTransactionContext(),
+        )
+        counter = Counter()
+
+        await subject(context, counter.task)
+
+        resolved = context.load(TransportMessage)
+        assert counter.total == 1
+        assert resolved.body == "ب"
+        assert CLAIM_CHECK_KEY not in resolved.headers
+        assert CLAIM_CHECK_ENCODING_KEY not in resolved.headers
+        assert resolved.headers.message_id == transport_message.headers.message_id
+        assert transport_message.headers[CLAIM_CHECK_KEY] == key
+
+    async def test_passes_through_messages_without_claim(self):
+        subject = ClaimCheckIncomingStep(blob_store=InMemoryBlobStore(), release_after_ack=True)
+        transport_message = TransportMessageBuilder.build()
+        context = IncomingStepContext(
+            message=transport_message,
+            transaction_context=DefaultTransactionContext(),
+        )
+        counter = Counter()
+
+        await subject(context, counter.task)
+
+        assert counter.total == 1
+        assert context.load(TransportMessage) is transport_message
+
+    @pytest.mark.parametrize(
+        ("ack", "release_after_ack", "expected_blobs_count"),
+        [(True, True, 0), (False, True, 1), (True, False, 1)],
+    )
+    async def test_release(self, ack: bool, release_after_ack: bool, expected_blobs_count: int):
+        store = InMemoryBlobStore()
+        key = await store.put(b"data")
+        subject = ClaimCheckIncomingStep(blob_store=store, release_after_ack=release_after_ack)
+        transport_message = TransportMessageBuilder.build()
+        transport_message.headers[CLAIM_CHECK_KEY] = key
+        transaction_context = DefaultTransactionContext()
+        context = IncomingStepContext(
+            message=transport_message,
+            transaction_context=transaction_context,
+        )
+        context.save(LogicalMessageBuilder.build(use_dummy_message=True), LogicalMessage)
+
+        await subject(context, Counter().task)
+        transaction_context.set_result(commit=ack, ack=ack)
+        await transaction_context.complete()
+
+        assert store.blobs_count == expected_blobs_count
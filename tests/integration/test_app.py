@@ -20,7 +20,7 @@ from mersal.transport.in_memory import InMemoryNetwork
 from mersal.transport.in_memory.in_memory_transport_plugin import (
     InMemoryTransportPluginConfig,
 )
-from mersal.workers import WorkerBackoffStrategy
+from mersal.workers import AIMDConcurrencyLimit, WorkerBackoffStrategy
 
 __all__ = ("TestAppIntegration",)
 
@@ -137,6 +137,23 @@ class TestAppIntegration:
 
         assert all_running.is_set()
 
+    async def test_concurrency_limit_is_wired_through_app_configuration(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+        ]
+        app = Mersal(
+            "m1",
+            activator,
+            plugins=plugins,
+            max_parallelism=3,
+            concurrency_limit=AIMDConcurrencyLimit(initial_limit=5, max_limit=10),
+        )
+        await app.start()
+        assert app.worker.concurrency_limit == 5
+        await app.stop()
+
     async def test_stop_grace_period_is_wired_through_app_configuration(self):
         network = InMemoryNetwork()
         activator = BuiltinHandlerActivator()
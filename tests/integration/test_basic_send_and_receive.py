@@ -6,6 +6,7 @@ from anyio import sleep
 
 from mersal.activation import BuiltinHandlerActivator
 from mersal.core.app import Mersal
+from mersal.messages import BatchMessage
 from mersal.routing.default import (
     DefaultRouterRegistrationConfig,
 )
@@ -203,3 +204,19 @@ class TestBasicSendAndReceiveIntegration:
         await app.stop()
         assert handler
         assert handler.headers.get("message_id") == message_id
+
+    async def test_sending_and_receiving_a_batch_of_objects(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        handler = DummyMessageHandler()
+        activator.register(DummyMessage, lambda _, __: handler)
+        plugins = [InMemoryTransportPluginConfig(network, "test-queue").plugin]
+        app = Mersal("m1", activator, plugins=plugins)
+        messages = [DummyMessage(), DummyMessage()]
+
+        await app.send_local(BatchMessage(messages))
+        await app.start()
+        await sleep(0.5)
+        await app.stop()
+
+        assert [m.internal for m in messages] == [[1], [1]]
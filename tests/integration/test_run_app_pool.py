@@ -0,0 +1,143 @@
+from functools import partial
+from pathlib import Path
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.core import run_app_pool
+from mersal.core.app import Mersal
+from mersal.exceptions import MersalExceptionError
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = ("TestRunAppPool",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class StartupError(Exception):
+    pass
+
+
+def _leaf_exceptions(exc: BaseException) -> list[BaseException]:
+    if isinstance(exc, BaseExceptionGroup):
+        return [leaf for inner in exc.exceptions for leaf in _leaf_exceptions(inner)]
+    return [exc]
+
+
+def _make_app() -> Mersal:
+    plugins = [InMemoryTransportPluginConfig(InMemoryNetwork(), "pool-queue").plugin]
+    return Mersal("pool", BuiltinHandlerActivator(), plugins=plugins)
+
+
+def _make_send_only_app() -> Mersal:
+    plugins = [InMemoryTransportPluginConfig(InMemoryNetwork(), "pool-queue").plugin]
+    return Mersal("pool", BuiltinHandlerActivator(), plugins=plugins, send_only=True)
+
+
+def _make_no_apps() -> list[Mersal]:
+    return []
+
+
+def _make_app_recording_calls(calls_directory: Path, failures: int) -> Mersal:
+    calls = len(list(calls_directory.iterdir()))
+    (calls_directory / str(calls)).touch()
+    if calls < failures:
+        raise StartupError("factory failed")
+    return _make_app()
+
+
+class TestRunAppPool:
+    async def test_starts_replicas_and_stops_them(self):
+        stop = anyio.Event()
+        ready = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+            _ = tg.start_soon(
+                partial(run_app_pool, _make_app, processes=2, stop=stop, ready=ready, handle_signals=False)
+            )
+            with anyio.fail_after(30):
+                await ready.wait()
+            stop.set()
+
+    async def test_send_only_replicas_become_ready(self):
+        stop = anyio.Event()
+        ready = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+            _ = tg.start_soon(
+                partial(run_app_pool, _make_send_only_app, processes=1, stop=stop, ready=ready, handle_signals=False)
+            )
+            with anyio.fail_after(30):
+                await ready.wait()
+            stop.set()
+
+    async def test_send_only_replicas_stay_responsive(self):
+        stop = anyio.Event()
+        ready = anyio.Event()
+        unresponsive: list[int] = []
+
+        async with anyio.create_task_group() as tg:
+            _ = tg.start_soon(
+                partial(
+                    run_app_pool,
+                    _make_send_only_app,
+                    processes=1,
+                    stop=stop,
+                    ready=ready,
+                    handle_signals=False,
+                    liveness_timeout=0.5,
+                    liveness_check_interval=0.1,
+                    on_unresponsive=lambda index, _: unresponsive.append(index),
+                )
+            )
+            with anyio.fail_after(30):
+                await ready.wait()
+            await anyio.sleep(1.5)
+            stop.set()
+
+        assert unresponsive == []
+
+    async def test_clean_exit_is_not_a_crash(self):
+        with anyio.fail_after(30):
+            await run_app_pool(_make_no_apps, processes=1, handle_signals=False, restart_on_crash=False)
+
+    async def test_restarts_crashed_replica(self, tmp_path: Path):
+        stop = anyio.Event()
+        ready = anyio.Event()
+        factory = partial(_make_app_recording_calls, tmp_path, 1)
+
+        async with anyio.create_task_group() as tg:
+            _ = tg.start_soon(
+                partial(
+                    run_app_pool,
+                    factory,
+                    processes=1,
+                    stop=stop,
+                    ready=ready,
+                    handle_signals=False,
+                    restart_backoff=0,
+                )
+            )
+            with anyio.fail_after(30):
+                await ready.wait()
+            stop.set()
+
+        assert len(list(tmp_path.iterdir())) == 2
+
+    async def test_crash_propagates_without_restart(self, tmp_path: Path):
+        factory = partial(_make_app_recording_calls, tmp_path, 10)
+
+        with anyio.fail_after(30), pytest.raises(BaseException) as exc_info:
+            await run_app_pool(factory, processes=1, handle_signals=False, restart_on_crash=False)
+
+        assert any(isinstance(e, MersalExceptionError) for e in _leaf_exceptions(exc_info.value))
+        assert len(list(tmp_path.iterdir())) == 1
+
+    async def test_rejects_invalid_process_count(self):
+        with pytest.raises(ValueError):
+            await run_app_pool(_make_app, processes=0, handle_signals=False)
@@ -0,0 +1,40 @@
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.core.app import Mersal
+from mersal.testing.core.messages import BasicMessageA
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = ("TestWithBatchingHandler",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestWithBatchingHandler:
+    async def test_messages_are_handled_in_batches(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        batches: list[list[BasicMessageA]] = []
+
+        async def handler(messages: list[BasicMessageA]) -> None:
+            batches.append(messages)
+
+        activator.register_batch(BasicMessageA, lambda _, __: handler, max_batch_size=5, max_wait=0.5)
+        plugins = [InMemoryTransportPluginConfig(network, "test-queue").plugin]
+        app = Mersal("m1", activator, plugins=plugins, max_parallelism=5)
+
+        for _ in range(10):
+            await app.send_local(BasicMessageA())
+        await app.start()
+        with anyio.fail_after(5):
+            while sum(len(b) for b in batches) < 10:
+                await anyio.sleep(0.01)
+        await app.stop()
+
+        assert [len(b) for b in batches] == [5, 5]
+        assert network.queue_count("test-queue") == 0
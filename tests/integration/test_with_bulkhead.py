@@ -0,0 +1,107 @@
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator, HandlerLifetime
+from mersal.bulkhead import BulkheadConfig
+from mersal.core.app import Mersal
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = (
+    "FastMessage",
+    "SlowHandler",
+    "SlowMessage",
+    "TestWithBulkhead",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowMessage:
+    pass
+
+
+class FastMessage:
+    pass
+
+
+class SlowHandler:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def __call__(self, _: SlowMessage) -> None:
+        SlowHandler.in_flight += 1
+        SlowHandler.max_in_flight = max(SlowHandler.max_in_flight, SlowHandler.in_flight)
+        await anyio.sleep(0.05)
+        SlowHandler.in_flight -= 1
+
+
+class TestWithBulkhead:
+    async def test_slow_messages_do_not_starve_fast_ones(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        slow_in_flight = 0
+        max_slow_in_flight = 0
+        handled: list[str] = []
+
+        async def slow_handler(_: SlowMessage) -> None:
+            nonlocal slow_in_flight, max_slow_in_flight
+            slow_in_flight += 1
+            max_slow_in_flight = max(max_slow_in_flight, slow_in_flight)
+            await anyio.sleep(0.1)
+            slow_in_flight -= 1
+            handled.append("slow")
+
+        async def fast_handler(_: FastMessage) -> None:
+            handled.append("fast")
+
+        activator.register(SlowMessage, lambda _, __: slow_handler)
+        activator.register(FastMessage, lambda _, __: fast_handler)
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+            BulkheadConfig(limits={SlowMessage: 1}, defer_delay=0.01).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins, max_parallelism=4)
+
+        for _ in range(3):
+            await app.send_local(SlowMessage())
+        await app.send_local(FastMessage())
+        await app.start()
+        with anyio.fail_after(5):
+            while len(handled) < 4:
+                await anyio.sleep(0.01)
+        await app.stop()
+
+        assert max_slow_in_flight == 1
+        assert handled[0] == "fast"
+        assert handled.count("slow") == 3
+
+    async def test_handler_type_compartments_with_lifetime_scoped_handlers(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        handled = 0
+
+        async def count(_: SlowMessage) -> None:
+            nonlocal handled
+            handled += 1
+
+        activator.register(SlowMessage, lambda _, __: SlowHandler(), lifetime=HandlerLifetime.POOLED)
+        activator.register(SlowMessage, lambda _, __: count)
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+            BulkheadConfig(limits={SlowHandler: 1}, key="handler_type", defer_delay=0.01).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins, max_parallelism=4)
+
+        for _ in range(3):
+            await app.send_local(SlowMessage())
+        await app.start()
+        with anyio.fail_after(5):
+            while handled < 3:
+                await anyio.sleep(0.01)
+        await app.stop()
+
+        assert SlowHandler.max_in_flight == 1
@@ -0,0 +1,88 @@
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.claim_check import CLAIM_CHECK_KEY, ClaimCheckConfig
+from mersal.configuration import StandardConfigurator
+from mersal.core.app import Mersal
+from mersal.persistence.in_memory import InMemoryBlobStore
+from mersal.serialization import Serializer
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = (
+    "LargeMessage",
+    "LargeMessageSerializer",
+    "TestClaimCheck",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class LargeMessage:
+    def __init__(self, payload: str) -> None:
+        self.payload = payload
+
+
+class LargeMessageSerializer(Serializer):
+    def serialize(self, obj):
+        return obj.payload if isinstance(obj, LargeMessage) else obj
+
+    def deserialize(self, data):
+        return LargeMessage(data) if isinstance(data, str) else data
+
+
+def _register_serializer(configurator: StandardConfigurator) -> None:
+    configurator.register(Serializer, lambda _: LargeMessageSerializer())
+
+
+class TestClaimCheck:
+    async def test_large_bodies_travel_through_the_store(self):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        activator = BuiltinHandlerActivator()
+        received: list[LargeMessage] = []
+
+        async def handler(message: LargeMessage) -> None:
+            received.append(message)
+
+        activator.register(LargeMessage, lambda _, __: handler)
+        store = InMemoryBlobStore()
+        plugins = [
+            InMemoryTransportPluginConfig(network, queue_address, use_cool_serializer=False).plugin,
+            _register_serializer,
+            ClaimCheckConfig(store=store, threshold=100).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins)
+
+        await app.start()
+        await app.send_local(LargeMessage("a" * 100))
+        await app.send_local(LargeMessage("b"))
+        await anyio.sleep(0.1)
+        await app.stop()
+
+        assert sorted(m.payload for m in received) == ["a" * 100, "b"]
+        assert store.blobs_count == 0
+
+    async def test_transport_only_sees_the_reference(self):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        activator = BuiltinHandlerActivator()
+        store = InMemoryBlobStore()
+        plugins = [
+            InMemoryTransportPluginConfig(network, queue_address, use_cool_serializer=False).plugin,
+            _register_serializer,
+            ClaimCheckConfig(store=store, threshold=100).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins)
+
+        await app.send_local(LargeMessage("a" * 100))
+
+        message = network.get_next(queue_address)
+        assert message is not None
+        assert message.body == b""
+        assert CLAIM_CHECK_KEY in message.headers
+        assert store.blobs_count == 1
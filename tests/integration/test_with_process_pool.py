@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.core.app import Mersal
+from mersal.exceptions import MersalExceptionError
+from mersal.process_pool import ProcessPoolConfig
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = (
+    "FailingHandler",
+    "RecordingHandler",
+    "TestWithProcessPool",
+    "WorkMessage",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class WorkMessage:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+
+class RecordingHandler:
+    async def __call__(self, message: WorkMessage) -> None:
+        message.path.write_text(str(os.getpid()))
+
+
+class FailingHandler:
+    def __call__(self, message: WorkMessage) -> None:
+        raise ValueError("handler failed")
+
+
+class TestWithProcessPool:
+    async def test_handler_runs_in_pool(self, tmp_path: Path):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        activator.register(WorkMessage, lambda _, __: RecordingHandler(), process_pool=True)
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+            ProcessPoolConfig(max_workers=1).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins)
+        path = tmp_path / "pid"
+
+        await app.start()
+        await app.send_local(WorkMessage(path))
+        with anyio.fail_after(30):
+            while not path.exists():
+                await anyio.sleep(0.05)
+        await app.stop()
+
+        assert int(path.read_text()) != os.getpid()
+
+    async def test_handler_errors_are_retried_and_deadlettered(self, tmp_path: Path):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        activator.register(WorkMessage, lambda _, __: FailingHandler(), process_pool=True)
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+            ProcessPoolConfig(max_workers=1).plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins)
+
+        await app.start()
+        await app.send_local(WorkMessage(tmp_path))
+        with anyio.fail_after(30):
+            while not network.queue_count("error"):
+                await anyio.sleep(0.05)
+        await app.stop()
+
+        assert network.queue_count("test-queue") == 0
+
+    async def test_requires_process_pool_plugin(self):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        activator.register(WorkMessage, lambda _, __: RecordingHandler(), process_pool=True)
+        app = Mersal("m1", activator, plugins=[InMemoryTransportPluginConfig(network, "test-queue").plugin])
+
+        factory = activator._handler_factories[WorkMessage][0]
+        with pytest.raises(MersalExceptionError):
+            factory(None, app)  # type: ignore[arg-type]
@@ -100,11 +100,12 @@ class TestSagaIntegration:
     def message_tracker(self) -> MessageTracker:
         return InMemoryMessageTracker()
 
-    @pytest.fixture
-    def saga_plugin_config(self, saga_storage: SagaStorage) -> SagaConfig:
+    @pytest.fixture(params=[None, 100], ids=["uncached", "cached"])
+    def saga_plugin_config(self, saga_storage: SagaStorage, request: pytest.FixtureRequest) -> SagaConfig:
         return SagaConfig(
             storage=saga_storage,
             correlation_error_handler=None,
+            cache_size=request.param,
         )
 
     async def test_initiating_message(self, saga_storage: SagaStorage, saga_plugin_config: SagaConfig):
@@ -155,3 +156,35 @@ class TestSagaIntegration:
         await sleep(0.1)
 
         assert saga.message1_handling_count == 1
+
+    async def test_saga_registered_after_a_message_of_its_type_was_handled(
+        self, saga_storage: SagaStorage, saga_plugin_config: SagaConfig
+    ):
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+        handled: list[Message1] = []
+
+        async def handler(message: Message1) -> None:
+            handled.append(message)
+
+        activator.register(Message1, lambda _, __: handler)
+        plugins = [
+            InMemoryTransportPluginConfig(network, "test-queue").plugin,
+            saga_plugin_config.plugin,
+        ]
+        app = Mersal("m1", activator, plugins=plugins)
+        await app.start()
+        await app.send_local(Message1(user_id=100))
+        await sleep(0.1)
+
+        saga = MySaga()
+        activator.register(Message1, lambda _, __: saga)
+        await app.send_local(Message1(user_id=200))
+        await sleep(0.1)
+        await app.stop()
+
+        assert len(handled) == 2
+        assert saga.message1_handling_count == 1
+        data = await saga_storage.find(MySagaData, "user_id", 200)
+        assert data
+        assert data.data.user_id == 200
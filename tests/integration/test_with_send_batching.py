@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.configuration import StandardConfigurator
+from mersal.core.app import Mersal
+from mersal.messages import BatchMessage
+from mersal.send_batching import SendBatchingConfig
+from mersal.serialization import Serializer
+from mersal.serialization.dataclass_serializer import DataclassSerializer
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = (
+    "BasicMessageA",
+    "BasicMessageB",
+    "HandlerError",
+    "TestSendBatching",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class BasicMessageA:
+    pass
+
+
+@dataclass
+class BasicMessageB:
+    index: int = 0
+
+
+class HandlerError(Exception):
+    pass
+
+
+def _register_serializer(configurator: StandardConfigurator) -> None:
+    # Batches are framed into a single bytes body, which needs serialized
+    # bodies the wire format can encode rather than the identity serializer's objects.
+    configurator.register(Serializer, lambda _: DataclassSerializer({BasicMessageA, BasicMessageB}))
+
+
+def _transport(network: InMemoryNetwork, address: str):
+    return InMemoryTransportPluginConfig(network, address, use_cool_serializer=False).plugin
+
+
+class TestSendBatching:
+    def _producer(self, network: InMemoryNetwork, count: int, fail: bool = False) -> Mersal:
+        activator = BuiltinHandlerActivator()
+
+        async def handler(message: BasicMessageA) -> None:
+            for index in range(count):
+                await app.send(BasicMessageB(index), addresses={"consumer"})
+            if fail:
+                raise HandlerError("failed")
+
+        activator.register(BasicMessageA, lambda _, __: handler)
+        plugins = [
+            _transport(network, "producer"),
+            _register_serializer,
+            SendBatchingConfig(max_messages=10).plugin,
+        ]
+        app = Mersal("producer", activator, plugins=plugins)
+        return app
+
+    async def test_messages_sent_by_a_handler_are_batched(self):
+        network = InMemoryNetwork()
+        app = self._producer(network, count=25)
+
+        await app.start()
+        await app.send_local(BasicMessageA())
+        await anyio.sleep(0.1)
+        await app.stop()
+
+        assert network.queue_count("consumer") == 3
+        assert network.get_next("consumer").headers[BatchMessage.header_key] == "10"
+
+    async def test_every_message_is_handled_by_the_consumer(self):
+        network = InMemoryNetwork()
+        producer = self._producer(network, count=25)
+        consumer_activator = BuiltinHandlerActivator()
+        received: list[BasicMessageB] = []
+
+        async def handler(message: BasicMessageB) -> None:
+            received.append(message)
+
+        consumer_activator.register(BasicMessageB, lambda _, __: handler)
+        consumer = Mersal(
+            "consumer",
+            consumer_activator,
+            plugins=[_transport(network, "consumer"), _register_serializer],
+        )
+
+        await producer.start()
+        await consumer.start()
+        await producer.send_local(BasicMessageA())
+        await anyio.sleep(0.2)
+        await consumer.stop()
+        await producer.stop()
+
+        assert sorted(message.index for message in received) == list(range(25))
+
+    async def test_nothing_is_sent_when_the_handler_fails(self):
+        network = InMemoryNetwork()
+        app = self._producer(network, count=5, fail=True)
+
+        await app.start()
+        await app.send_local(BasicMessageA())
+        await anyio.sleep(0.1)
+        await app.stop()
+
+        assert network.queue_count("consumer") == 0
+
+    async def test_messages_sent_outside_of_a_handler_are_not_batched(self):
+        network = InMemoryNetwork()
+        app = self._producer(network, count=0)
+
+        for _ in range(3):
+            await app.send(BasicMessageB(), addresses={"consumer"})
+
+        assert network.queue_count("consumer") == 3
@@ -0,0 +1,102 @@
+import logging
+import sys
+import threading
+from queue import Queue
+
+import pytest
+
+from mersal.logging.stdlib.queue import DroppingQueueHandler, LoggingQueueListener
+
+__all__ = (
+    "RecordingHandler",
+    "TestDroppingQueueHandler",
+    "TestLoggingQueueListener",
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[int | None] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.threads.add(threading.get_ident())
+        self.messages.append(self.format(record))
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("mersal", logging.INFO, __file__, 0, message, None, None)
+
+
+class TestDroppingQueueHandler:
+    def test_drops_new_records_when_full(self):
+        queue: Queue[logging.LogRecord] = Queue(2)
+        subject = DroppingQueueHandler(queue)
+
+        for message in ("a", "b", "c"):
+            subject.handle(_record(message))
+
+        assert [queue.get_nowait().msg for _ in range(2)] == ["a", "b"]
+        assert subject.dropped_records == 1
+
+    def test_drops_oldest_records_when_full(self):
+        queue: Queue[logging.LogRecord] = Queue(2)
+        subject = DroppingQueueHandler(queue, drop_policy="drop_oldest")
+
+        for message in ("a", "b", "c"):
+            subject.handle(_record(message))
+
+        assert [queue.get_nowait().msg for _ in range(2)] == ["b", "c"]
+        assert subject.dropped_records == 1
+
+    def test_queues_records_with_merged_message_and_rendered_traceback(self):
+        queue: Queue[logging.LogRecord] = Queue(10)
+        subject = DroppingQueueHandler(queue)
+        args = ["a"]
+        record = _record("items %s")
+        record.args = (args,)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record.exc_info = sys.exc_info()
+
+        subject.handle(record)
+        args.append("b")
+
+        queued = queue.get_nowait()
+        assert queued.getMessage() == "items ['a']"
+        assert queued.exc_info is None
+        assert "ValueError: boom" in (queued.exc_text or "")
+        assert record.exc_info is not None
+
+    def test_rejects_unknown_drop_policy(self):
+        with pytest.raises(ValueError):
+            DroppingQueueHandler(Queue(), drop_policy="block")  # type: ignore[arg-type]
+
+    def test_formats_records_on_the_listener_thread(self):
+        queue: Queue[logging.LogRecord] = Queue(10)
+        handler = RecordingHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        listener = LoggingQueueListener(queue, handler)
+        subject = DroppingQueueHandler(queue)
+
+        record = _record("hello %s")
+        record.args = ("world",)
+        subject.handle(record)
+        listener.stop()
+
+        assert handler.messages == ["INFO hello world"]
+        assert handler.threads != {threading.get_ident()}
+
+
+class TestLoggingQueueListener:
+    def test_stopping_a_stopped_listener_does_nothing(self):
+        queue: Queue[logging.LogRecord] = Queue(1)
+        listener = LoggingQueueListener(queue, RecordingHandler())
+        listener.stop()
+        queue.put_nowait(_record("left behind"))
+
+        listener.stop()
+
+        assert queue.full()
@@ -0,0 +1,120 @@
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.core.app import Mersal
+from mersal.logging import Logger, LoggingConfig
+from mersal.logging.config import GetLogger
+from mersal.logging.standard_plugin import StandardLoggingPlugin
+from mersal.logging.stdlib.logger import StdlibLogger
+from mersal.plugins import Plugin
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+
+__all__ = (
+    "DummyMessage",
+    "StdlibTestLoggingConfig",
+    "TestStandardLoggingPlugin",
+    "TestStdlibLogger",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+_LOGGER_NAME = "mersal.tests.logging"
+
+
+class DummyMessage:
+    pass
+
+
+@dataclass(kw_only=True)
+class StdlibTestLoggingConfig(LoggingConfig):
+    logger_name: str = _LOGGER_NAME
+
+    @property
+    def plugin(self) -> Plugin:
+        return StandardLoggingPlugin(config=self)
+
+    def configure(self) -> GetLogger:
+        return lambda: StdlibLogger(self.logger_name)
+
+    @staticmethod
+    def set_level(logger: Logger, level: int) -> None:
+        logger.set_level(level)
+
+
+class TestStandardLoggingPlugin:
+    async def test_logs_steps_only_in_debug_mode(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+
+        async def handler(_):
+            pass
+
+        activator.register(DummyMessage, lambda m, b: handler)
+        plugins = [InMemoryTransportPluginConfig(network, "test-queue").plugin]
+        app = Mersal("m1", activator, plugins=plugins, logging_config=StdlibTestLoggingConfig())
+
+        def step_records() -> list[str]:
+            messages = [r.getMessage() for r in caplog.records if r.name == _LOGGER_NAME]
+            return [m for m in messages if m.startswith("step.")]
+
+        async with app:
+            await app.send_local(DummyMessage())
+            await anyio.sleep(0.1)
+            assert not step_records()
+
+            app.debug = True
+            await app.send_local(DummyMessage())
+            await anyio.sleep(0.1)
+            assert step_records()
+
+            caplog.clear()
+            app.debug = False
+            await app.send_local(DummyMessage())
+            await anyio.sleep(0.1)
+            assert not step_records()
+
+        assert any(r.getMessage().startswith("pipeline.invoke.complete") for r in caplog.records)
+
+
+class TestStdlibLogger:
+    def test_formats_only_enabled_levels(self, caplog):
+        caplog.set_level(logging.INFO, logger=_LOGGER_NAME)
+        formatted = []
+
+        class Value:
+            def __str__(self) -> str:
+                formatted.append(self)
+                return "value"
+
+        subject = StdlibLogger(_LOGGER_NAME).bind(bound=Value())
+
+        subject.debug("event", key=Value())
+        assert not formatted
+
+        subject.info("event", key=Value())
+        assert len(formatted) == 2
+        assert caplog.records[-1].getMessage() == "event: bound=value, key=value"
+
+    def test_exception_logs_exc_info(self, caplog):
+        caplog.set_level(logging.INFO, logger=_LOGGER_NAME)
+        subject = StdlibLogger(_LOGGER_NAME)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            subject.exception("event", key=1)
+
+        record: Any = caplog.records[-1]
+        assert record.levelno == logging.ERROR
+        assert record.exc_info[0] is ValueError
@@ -0,0 +1,26 @@
+import pytest
+
+from mersal.metrics import Histogram
+
+__all__ = ("TestHistogram",)
+
+
+class TestHistogram:
+    def test_counts_observations_in_their_buckets(self):
+        subject = Histogram(buckets=(0.1, 1.0))
+
+        subject.observe(0.05)
+        subject.observe(0.1)
+        subject.observe(0.5)
+        subject.observe(5)
+
+        snapshot = subject.snapshot()
+        assert snapshot.buckets == (0.1, 1.0)
+        assert snapshot.counts == (2, 1, 1)
+        assert snapshot.count == 4
+        assert snapshot.sum == pytest.approx(5.65)
+
+    @pytest.mark.parametrize("buckets", [(1.0, 0.1), (0.1, 0.1)])
+    def test_rejects_unordered_buckets(self, buckets):
+        with pytest.raises(ValueError):
+            Histogram(buckets)
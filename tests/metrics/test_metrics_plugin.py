@@ -0,0 +1,179 @@
+from typing import Self
+
+import anyio
+import pytest
+
+from mersal.activation import BuiltinHandlerActivator
+from mersal.configuration import StandardConfigurator
+from mersal.core.app import Mersal
+from mersal.metrics import MetricsConfig, PrometheusMetricsServer, StepLatencyKey
+from mersal.pipeline.receive.activate_handlers_step import ActivateHandlersStep
+from mersal.transport.in_memory import InMemoryNetwork
+from mersal.transport.in_memory.in_memory_transport_plugin import (
+    InMemoryTransportPluginConfig,
+)
+from mersal.workers import WorkerFactory
+
+__all__ = (
+    "DummyMessage",
+    "FailingMessage",
+    "FixedWorker",
+    "FixedWorkerFactory",
+    "HandlerError",
+    "TestMetricsPlugin",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class DummyMessage:
+    pass
+
+
+class FailingMessage:
+    pass
+
+
+class HandlerError(Exception):
+    pass
+
+
+class FixedWorker:
+    """A worker without a concurrency limit."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.running = False
+        self.heartbeat_age = None
+
+    async def __call__(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        pass
+
+
+class FixedWorkerFactory:
+    def create_worker(self, name: str) -> FixedWorker:
+        return FixedWorker(name)
+
+
+def _message_type(message_type: type) -> str:
+    return f"{message_type.__module__}:{message_type.__qualname__}"
+
+
+class TestMetricsPlugin:
+    def _app(self, metrics: MetricsConfig | None) -> Mersal:
+        network = InMemoryNetwork()
+        activator = BuiltinHandlerActivator()
+
+        async def handler(_):
+            pass
+
+        async def failing_handler(_):
+            raise HandlerError
+
+        activator.register(DummyMessage, lambda m, b: handler)
+        activator.register(FailingMessage, lambda m, b: failing_handler)
+        plugins = [InMemoryTransportPluginConfig(network, "test-queue").plugin]
+        return Mersal("m1", activator, plugins=plugins, metrics=metrics)
+
+    async def test_no_metrics_by_default(self):
+        app = self._app(None)
+
+        assert app.metrics is None
+
+    async def test_records_pipelines_and_steps(self):
+        app = self._app(MetricsConfig())
+        assert app.metrics
+
+        async with app:
+            await app.send_local(DummyMessage())
+            await anyio.sleep(0.1)
+
+        snapshot = app.metrics.snapshot()
+        message_type = _message_type(DummyMessage)
+        incoming = StepLatencyKey("incoming", "pipeline", message_type, "success")
+        outgoing = StepLatencyKey("outgoing", "pipeline", message_type, "success")
+        handlers = StepLatencyKey("incoming", ActivateHandlersStep.__name__, message_type, "success")
+        assert snapshot.latencies[incoming].count == 1
+        assert snapshot.latencies[outgoing].count == 1
+        assert snapshot.latencies[handlers].count == 1
+        assert snapshot.latencies[handlers].sum <= snapshot.latencies[incoming].sum
+        assert snapshot.in_flight == {"incoming": 0, "outgoing": 0}
+        assert snapshot.concurrency_limits == {app.name: 1}
+
+    async def test_labels_unregistered_message_types_as_unknown(self):
+        app = self._app(MetricsConfig())
+        assert app.metrics
+
+        async with app:
+            for index in range(3):
+                await app.send_local(DummyMessage(), headers={"message_type": f"spam:Message{index}"})
+            await anyio.sleep(0.1)
+
+        message_types = {key.message_type for key in app.metrics.snapshot().latencies}
+        assert message_types == {"unknown"}
+
+    async def test_workers_without_a_concurrency_limit_are_not_tracked(self):
+        def register_worker_factory(configurator: StandardConfigurator) -> None:
+            configurator.register(WorkerFactory, lambda _: FixedWorkerFactory())
+
+        plugins = [InMemoryTransportPluginConfig(InMemoryNetwork(), "test-queue").plugin, register_worker_factory]
+        app = Mersal("m1", BuiltinHandlerActivator(), plugins=plugins, metrics=MetricsConfig())
+        assert app.metrics
+
+        assert app.metrics.snapshot().concurrency_limits == {}
+
+    async def test_records_failing_steps(self):
+        app = self._app(MetricsConfig())
+        assert app.metrics
+
+        async with app:
+            await app.send_local(FailingMessage())
+            await anyio.sleep(0.1)
+
+        snapshot = app.metrics.snapshot()
+        key = StepLatencyKey("incoming", ActivateHandlersStep.__name__, _message_type(FailingMessage), "error")
+        assert snapshot.latencies[key].count >= 1
+
+    async def test_serves_prometheus_text(self):
+        app = self._app(MetricsConfig(prometheus_port=0))
+        server = app.configurator.get(PrometheusMetricsServer)
+
+        async with app:
+            await app.send_local(DummyMessage())
+            await anyio.sleep(0.1)
+
+            metrics_response = await self._get(server.port, "/metrics")
+            missing_response = await self._get(server.port, "/")
+
+        assert metrics_response.startswith(b"HTTP/1.1 200 OK\r\n")
+        assert b"Content-Type: text/plain; version=0.0.4" in metrics_response
+        message_type = _message_type(DummyMessage).encode()
+        assert (
+            b'mersal_pipeline_duration_seconds_count{pipeline="incoming",message_type="'
+            + message_type
+            + b'",outcome="success"} 1'
+        ) in metrics_response
+        assert b'mersal_pipeline_in_flight{pipeline="outgoing"} 0' in metrics_response
+        assert f'mersal_worker_concurrency_limit{{worker="{app.name}"}} 1'.encode() in metrics_response
+        assert missing_response.startswith(b"HTTP/1.1 404 Not Found\r\n")
+
+    async def _get(self, port: int, path: str) -> bytes:
+        async with await anyio.connect_tcp("127.0.0.1", port) as stream:
+            await stream.send(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            response = b""
+            try:
+                while True:
+                    response += await stream.receive()
+            except anyio.EndOfStream:
+                pass
+        return response
@@ -0,0 +1,106 @@
+import anyio
+import pytest
+
+from mersal.exceptions import MersalExceptionError
+from mersal.persistence.file_system import FileSystemBlobStore
+
+__all__ = ("TestFileSystemBlobStore",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestFileSystemBlobStore:
+    @pytest.fixture
+    async def subject(self, tmp_path) -> FileSystemBlobStore:
+        store = FileSystemBlobStore(tmp_path)
+        await store()
+        return store
+
+    async def test_put_and_get(self, subject: FileSystemBlobStore):
+        key = await subject.put(b"data")
+
+        assert await subject.get(key) == b"data"
+
+    async def test_identical_payloads_are_stored_once(self, subject: FileSystemBlobStore, tmp_path):
+        key1 = await subject.put(b"data")
+        key2 = await subject.put(b"data")
+
+        assert key1 != key2
+        assert len(list((tmp_path / "blobs" / "data").iterdir())) == 1
+
+        await subject.release(key1)
+        assert await subject.get(key2) == b"data"
+
+        await subject.release(key2)
+        with pytest.raises(MersalExceptionError):
+            await subject.get(key2)
+
+    async def test_payload_is_kept_until_all_claims_are_released(self, subject: FileSystemBlobStore):
+        key = await subject.put(b"data", claims=2)
+
+        await subject.release(key)
+        assert await subject.get(key) == b"data"
+
+        await subject.release(key)
+        with pytest.raises(MersalExceptionError):
+            await subject.get(key)
+
+    async def test_releasing_unknown_key_is_a_noop(self, subject: FileSystemBlobStore):
+        await subject.release("unknown.key")
+
+    async def test_data_persists_across_instances(self, subject: FileSystemBlobStore, tmp_path):
+        key = await subject.put(b"data")
+
+        other = FileSystemBlobStore(tmp_path)
+        await other()
+
+        assert await other.get(key) == b"data"
+
+    async def test_stale_lock_is_broken(self, tmp_path):
+        subject = FileSystemBlobStore(tmp_path, stale_lock_timeout=0)
+        await subject()
+        key = await subject.put(b"data")
+        (tmp_path / "blobs" / "locks" / f"{key.partition('.')[0]}.lock").touch()
+
+        await subject.release(key)
+
+        with pytest.raises(MersalExceptionError):
+            await subject.get(key)
+
+    async def test_concurrent_puts_and_releases_keep_claimed_payloads(self, subject: FileSystemBlobStore):
+        key = await subject.put(b"data")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(subject.release, key)
+            for _ in range(5):
+                tg.start_soon(subject.put, b"data")
+
+        other = await subject.put(b"data")
+        assert await subject.get(other) == b"data"
+
+    async def test_lock_held_by_another_owner_is_waited_for(self, subject: FileSystemBlobStore, tmp_path):
+        key = await subject.put(b"data")
+        lock = tmp_path / "blobs" / "locks" / f"{key.partition('.')[0]}.lock"
+        lock.touch()
+
+        with anyio.move_on_after(0.1):
+            await subject.release(key)
+
+        assert await subject.get(key) == b"data"
+        assert lock.exists()
+
+        lock.unlink()
+        await subject.release(key)
+
+        with pytest.raises(MersalExceptionError):
+            await subject.get(key)
+
+    async def test_get_requires_an_outstanding_claim(self, subject: FileSystemBlobStore):
+        key = await subject.put(b"data")
+        await subject.put(b"data")
+
+        await subject.release(key)
+
+        with pytest.raises(MersalExceptionError):
+            await subject.get(key)
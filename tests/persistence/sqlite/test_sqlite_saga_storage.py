@@ -0,0 +1,265 @@
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from mersal.exceptions import MersalExceptionError
+from mersal.exceptions.base_exceptions import ConcurrencyExceptionError
+from mersal.persistence.sqlite import SqliteSagaStorage
+from mersal.sagas import CorrelationProperty
+from mersal.sagas.saga_data import SagaData
+from mersal.transport import DefaultTransactionContext
+
+__all__ = ("TestSqliteSagaStorage",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class OrderSagaData:
+    order_id: str
+    status: str = "pending"
+
+
+@dataclass
+class OrderPlaced:
+    order_id: str
+
+
+@dataclass
+class ShipmentSagaData:
+    order_id: str
+    tracking_number: str | None = None
+
+
+@dataclass
+class ShipmentDispatched:
+    tracking_number: str
+
+
+order_id_property = CorrelationProperty(
+    message_type=OrderPlaced,
+    saga_data_type=OrderSagaData,
+    property_name="order_id",
+    value_extractor=lambda context: context.message.body.order_id,
+)
+
+tracking_number_property = CorrelationProperty(
+    message_type=ShipmentDispatched,
+    saga_data_type=ShipmentSagaData,
+    property_name="tracking_number",
+    value_extractor=lambda context: context.message.body.tracking_number,
+)
+missing_property = CorrelationProperty(
+    message_type=ShipmentDispatched,
+    saga_data_type=ShipmentSagaData,
+    property_name="carrier",
+    value_extractor=lambda context: context.message.body.carrier,
+)
+
+
+async def _commit(action):
+    async with DefaultTransactionContext() as ctx:
+        await action(ctx)
+        ctx.set_result(commit=True, ack=True)
+        await ctx.complete()
+
+
+class TestSqliteSagaStorage:
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        storage = SqliteSagaStorage(tmp_path / "sagas.db")
+        await storage()
+        yield storage
+        storage.close()
+
+    async def test_insert_and_find_by_id(self, storage):
+        saga_id = uuid.uuid4()
+        saga = SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga, [order_id_property], ctx))
+
+        result = await storage.find_using_id(OrderSagaData, saga_id)
+        assert result is not None
+        assert result.id == saga_id
+        assert result.revision == 0
+        assert result.data == OrderSagaData(order_id="123")
+
+    async def test_find_by_indexed_property(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="456"))
+
+        await _commit(lambda ctx: storage.insert(saga, [order_id_property], ctx))
+
+        result = await storage.find(OrderSagaData, "order_id", "456")
+        assert result is not None
+        assert result.id == saga.id
+        assert await storage.find(OrderSagaData, "order_id", "nonexistent") is None
+
+    async def test_find_by_property_that_is_not_indexed(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="456"))
+
+        await _commit(lambda ctx: storage.insert(saga, [], ctx))
+
+        result = await storage.find(OrderSagaData, "status", "pending")
+        assert result is not None
+        assert result.id == saga.id
+        assert await storage.find(OrderSagaData, "status", "completed") is None
+
+    async def test_find_returns_none_for_missing(self, storage):
+        assert await storage.find_using_id(OrderSagaData, uuid.uuid4()) is None
+        assert await storage.find(OrderSagaData, "order_id", "nonexistent") is None
+
+    async def test_writes_are_applied_on_commit(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="123"))
+
+        async with DefaultTransactionContext() as ctx:
+            await storage.insert(saga, [order_id_property], ctx)
+            assert await storage.find_using_id(OrderSagaData, saga.id) is None
+            ctx.set_result(commit=True, ack=True)
+            await ctx.complete()
+
+        assert await storage.find_using_id(OrderSagaData, saga.id) is not None
+
+    async def test_writes_are_discarded_on_rollback(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="123"))
+
+        async with DefaultTransactionContext() as ctx:
+            await storage.insert(saga, [order_id_property], ctx)
+            ctx.set_result(commit=False, ack=False)
+            await ctx.complete()
+
+        assert await storage.find_using_id(OrderSagaData, saga.id) is None
+        assert await storage.find(OrderSagaData, "order_id", "123") is None
+
+    async def test_insert_duplicate_raises(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga, [], ctx))
+
+        with pytest.raises(MersalExceptionError, match="already exist"):
+            async with DefaultTransactionContext() as ctx:
+                await storage.insert(saga, [], ctx)
+
+    async def test_insert_with_nonzero_revision_raises(self, storage):
+        saga = SagaData(id=uuid.uuid4(), revision=1, data=OrderSagaData(order_id="123"))
+
+        with pytest.raises(MersalExceptionError, match="revision=0"):
+            async with DefaultTransactionContext() as ctx:
+                await storage.insert(saga, [], ctx)
+
+    async def test_insert_with_duplicate_correlation_value_raises(self, storage):
+        saga1 = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="123"))
+        saga2 = SagaData(id=uuid.uuid4(), revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga1, [order_id_property], ctx))
+
+        with pytest.raises(MersalExceptionError, match="not unique"):
+            async with DefaultTransactionContext() as ctx:
+                await storage.insert(saga2, [order_id_property], ctx)
+
+    async def test_unset_correlation_values_are_not_indexed(self, storage):
+        saga1 = SagaData(id=uuid.uuid4(), revision=0, data=ShipmentSagaData(order_id="1"))
+        saga2 = SagaData(id=uuid.uuid4(), revision=0, data=ShipmentSagaData(order_id="2"))
+        properties = [tracking_number_property, missing_property]
+
+        await _commit(lambda ctx: storage.insert(saga1, properties, ctx))
+        await _commit(lambda ctx: storage.insert(saga2, properties, ctx))
+
+        found = await storage.find_using_id(ShipmentSagaData, saga2.id)
+        assert found is not None
+        found.data.tracking_number = "T-2"
+        await _commit(lambda ctx: storage.update(found, properties, ctx))
+
+        result = await storage.find(ShipmentSagaData, "tracking_number", "T-2")
+        assert result is not None
+        assert result.id == saga2.id
+        result = await storage.find(ShipmentSagaData, "tracking_number", None)
+        assert result is not None
+        assert result.id == saga1.id
+
+    async def test_update_increments_revision_and_reindexes(self, storage):
+        saga_id = uuid.uuid4()
+        saga = SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga, [order_id_property], ctx))
+
+        found = await storage.find_using_id(OrderSagaData, saga_id)
+        assert found is not None
+        found.data.order_id = "124"
+        found.data.status = "completed"
+
+        await _commit(lambda ctx: storage.update(found, [order_id_property], ctx))
+
+        assert found.revision == 1
+        assert await storage.find(OrderSagaData, "order_id", "123") is None
+        updated = await storage.find(OrderSagaData, "order_id", "124")
+        assert updated is not None
+        assert updated.revision == 1
+        assert updated.data.status == "completed"
+
+    async def test_update_with_wrong_revision_raises(self, storage):
+        saga_id = uuid.uuid4()
+        saga = SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga, [], ctx))
+
+        stale = SagaData(id=saga_id, revision=5, data=OrderSagaData(order_id="123"))
+
+        with pytest.raises(ConcurrencyExceptionError):
+            async with DefaultTransactionContext() as ctx:
+                await storage.update(stale, [], ctx)
+
+    async def test_concurrent_update_fails_on_commit(self, storage):
+        saga_id = uuid.uuid4()
+        await _commit(
+            lambda ctx: storage.insert(
+                SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="123")), [order_id_property], ctx
+            )
+        )
+        first = await storage.find_using_id(OrderSagaData, saga_id)
+        second = await storage.find_using_id(OrderSagaData, saga_id)
+        assert first is not None
+        assert second is not None
+
+        async with DefaultTransactionContext() as ctx1:
+            await storage.update(first, [order_id_property], ctx1)
+            async with DefaultTransactionContext() as ctx2:
+                await storage.update(second, [order_id_property], ctx2)
+                ctx2.set_result(commit=True, ack=True)
+                await ctx2.complete()
+
+            ctx1.set_result(commit=True, ack=True)
+            with pytest.raises(ConcurrencyExceptionError):
+                await ctx1.complete()
+
+        stored = await storage.find_using_id(OrderSagaData, saga_id)
+        assert stored is not None
+        assert stored.revision == 1
+
+    async def test_delete(self, storage):
+        saga_id = uuid.uuid4()
+        saga = SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="123"))
+
+        await _commit(lambda ctx: storage.insert(saga, [order_id_property], ctx))
+        await _commit(lambda ctx: storage.delete(saga, ctx))
+
+        assert await storage.find_using_id(OrderSagaData, saga_id) is None
+        assert await storage.find(OrderSagaData, "order_id", "123") is None
+
+    async def test_data_persists_across_instances(self, tmp_path):
+        storage1 = SqliteSagaStorage(tmp_path / "sagas.db")
+        await storage1()
+
+        saga_id = uuid.uuid4()
+        saga = SagaData(id=saga_id, revision=0, data=OrderSagaData(order_id="789"))
+
+        await _commit(lambda ctx: storage1.insert(saga, [order_id_property], ctx))
+        storage1.close()
+
+        storage2 = SqliteSagaStorage(tmp_path / "sagas.db")
+        await storage2()
+        result = await storage2.find(OrderSagaData, "order_id", "789")
+        storage2.close()
+        assert result is not None
+        assert result.id == saga_id
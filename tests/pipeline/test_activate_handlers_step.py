@@ -1,11 +1,16 @@
-from typing import Any
+from typing import Any, ClassVar
 
 import pytest
 
 from mersal.activation import BuiltinHandlerActivator
-from mersal.messages import LogicalMessage
+from mersal.messages import LogicalMessage, MessageHeaders, MessageTypeRegistry
+from mersal.persistence.in_memory import InMemorySubscriptionStorage
 from mersal.pipeline import ActivateHandlersStep, IncomingStepContext
+from mersal.pipeline.receive.handler_invoker import HandlerInvoker
 from mersal.pipeline.receive.handler_invokers import HandlerInvokers
+from mersal.pipeline.receive.saga_handler_invoker import SagaHandlerInvoker
+from mersal.sagas import SagaBase
+from mersal.subscription import InternalHandlersActivator
 from mersal.testing.core.counter import Counter
 from mersal.testing.core.test_doubles import (
     AnotherDummyMessage,
@@ -21,7 +26,9 @@ pytestmark = pytest.mark.anyio
 
 
 __all__ = (
+    "DummySaga",
     "HandlerFactoryTestHelper",
+    "MessageOnlyHandlerActivator",
     "TestActivateHandlersStep",
 )
 
@@ -42,6 +49,45 @@ class HandlerFactoryTestHelper:
         return _factory
 
 
+class DummySaga(SagaBase[dict]):
+    initiating_message_types: ClassVar = {DummyMessage}
+
+    def correlate_messages(self, correlator):
+        pass
+
+    def generate_new_data(self):
+        raise NotImplementedError
+
+    async def __call__(self, message):
+        pass
+
+
+class MessageOnlyHandlerActivator:
+    """An activator that only resolves handlers from messages."""
+
+    def __init__(self) -> None:
+        self._inner = BuiltinHandlerActivator()
+
+    async def get_handlers(self, message, transaction_context):
+        return await self._inner.get_handlers(message, transaction_context)
+
+    def register(self, message_type, factory):
+        self._inner.register(message_type, factory)
+        return self
+
+    @property
+    def registered_message_types(self):
+        return self._inner.registered_message_types
+
+    @property
+    def app(self):
+        return self._inner.app
+
+    @app.setter
+    def app(self, value):
+        self._inner.app = value
+
+
 class TestActivateHandlersStep:
     async def test_creates_invokers_based_on_defined_handlers(self):
         async with TransactionScope() as scope:
@@ -118,3 +164,82 @@ class TestActivateHandlersStep:
             assert isinstance(testing_handler_factory2.message, AnotherDummyMessage)
             assert testing_handler_factory2.count == 1
             assert counter.total == 1
+
+    async def test_wraps_saga_handlers_in_saga_invokers(self):
+        async with TransactionScope() as scope:
+            transaction_context = scope.transaction_context
+            activator = BuiltinHandlerActivator()
+            activator.register(DummyMessage, lambda _, __: DummySaga())
+            activator.register(DummyMessage, HandlerFactoryTestHelper().make_factory())
+
+            subject = ActivateHandlersStep(activator)
+            for _ in range(2):
+                context = IncomingStepContext(
+                    message=TransportMessageBuilder.build(),
+                    transaction_context=transaction_context,
+                )
+                context.save(LogicalMessageBuilder.build(use_dummy_message=True), LogicalMessage)
+                await subject(context, Counter().task)
+
+                saga_invoker, handler_invoker = context.load(HandlerInvokers)
+                assert isinstance(saga_invoker, SagaHandlerInvoker)
+                assert isinstance(saga_invoker.saga, DummySaga)
+                assert type(handler_invoker) is HandlerInvoker
+
+    async def test_resolves_handlers_from_message_type_header_without_loading_body(self):
+        async with TransactionScope() as scope:
+            activator = BuiltinHandlerActivator()
+            handler_factory = HandlerFactoryTestHelper()
+            activator.register(DummyMessage, handler_factory.make_factory())
+            loads: list[DummyMessage] = []
+
+            def load_body():
+                loads.append(DummyMessage())
+                return loads[-1]
+
+            message = LogicalMessage.deferred(
+                load_body, MessageHeaders({"message_type": MessageTypeRegistry.register(DummyMessage)})
+            )
+            context = IncomingStepContext(
+                message=TransportMessageBuilder.build(),
+                transaction_context=scope.transaction_context,
+            )
+            context.save(message, LogicalMessage)
+
+            await ActivateHandlersStep(activator)(context, Counter().task)
+
+            invokers: HandlerInvokers = context.load(HandlerInvokers)
+            assert len(invokers) == 1
+            assert not loads
+
+            for i in invokers:
+                await i()
+
+            assert len(loads) == 1
+            assert handler_factory.message is loads[0]
+
+    @pytest.mark.parametrize("decorated", [False, True], ids=["plain", "with_internal_handlers"])
+    async def test_falls_back_to_get_handlers(self, decorated: bool):
+        async with TransactionScope() as scope:
+            transaction_context = scope.transaction_context
+            activator = MessageOnlyHandlerActivator()
+            helper = HandlerFactoryTestHelper()
+            activator.register(DummyMessage, helper.make_factory())
+
+            subject = ActivateHandlersStep(
+                InternalHandlersActivator.decorate(activator, InMemorySubscriptionStorage.decentralized())
+                if decorated
+                else activator
+            )
+            context = IncomingStepContext(
+                message=TransportMessageBuilder.build(),
+                transaction_context=transaction_context,
+            )
+            context.save(LogicalMessageBuilder.build(use_dummy_message=True), LogicalMessage)
+            await subject(context, Counter().task)
+
+            for invoker in context.load(HandlerInvokers):
+                await invoker()
+
+            assert helper.count == 1
+            assert isinstance(helper.message, DummyMessage)
@@ -0,0 +1,65 @@
+from mersal.pipeline.conditional_step import ConditionalStepsFilter
+
+__all__ = (
+    "Step",
+    "TestConditionalStepsFilter",
+    "UndecidedStep",
+)
+
+
+class Message:
+    pass
+
+
+class Step:
+    def __init__(self, applies: bool) -> None:
+        self.applies = applies
+        self.calls = 0
+
+    def applies_to(self, message_type: type) -> bool | None:
+        self.calls += 1
+        return self.applies
+
+
+class UndecidedStep:
+    def __init__(self) -> None:
+        self.answer: bool | None = None
+
+    def applies_to(self, message_type: type) -> bool | None:
+        return self.answer
+
+
+class TestConditionalStepsFilter:
+    def test_selects_applying_steps_once_per_message_type(self):
+        plain = object()
+        applying = Step(applies=True)
+        not_applying = Step(applies=False)
+        subject = ConditionalStepsFilter([plain, applying, not_applying])
+
+        assert subject(Message) == [plain, applying]
+        assert subject(Message) == [plain, applying]
+        assert not_applying.calls == 1
+
+    def test_returns_all_steps_for_unknown_message_types(self):
+        steps = [object(), Step(applies=False)]
+        subject = ConditionalStepsFilter(steps)
+
+        assert subject(None) is steps
+
+    def test_undecided_steps_run_until_decided(self):
+        plain = object()
+        undecided = UndecidedStep()
+        subject = ConditionalStepsFilter([plain, undecided])
+
+        assert subject(Message) == [plain, undecided]
+        undecided.answer = False
+        assert subject(Message) == [plain]
+
+    def test_selection_follows_replaced_steps(self):
+        steps: list[object] = [object(), Step(applies=False), object()]
+        subject = ConditionalStepsFilter(steps)
+        assert subject(Message) == [steps[0], steps[2]]
+
+        replacement = object()
+        steps[2] = replacement
+        assert subject(Message) == [steps[0], replacement]
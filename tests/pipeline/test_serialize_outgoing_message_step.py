@@ -39,3 +39,21 @@ class TestSerializeOutgoingMessageStep:
 
         assert transport_message is context.load(TransportMessage)
         assert counter.total == 1
+
+    async def test_already_serialized_message_is_passed_through(self):
+        serializer = SerializerTestDouble()
+        serializer.serialize_stub = TransportMessageBuilder.build()
+        subject = SerializeOutgoingMessageStep(serializer)
+
+        context = OutgoingStepContext(
+            message=LogicalMessageBuilder.build(),
+            transaction_context=DefaultTransactionContext(),
+            destination_addresses=DestinationAddresses({"moon"}),
+        )
+        transport_message = TransportMessageBuilder.build()
+        context.save(transport_message)
+        counter = Counter()
+        await subject(context, counter.task)
+
+        assert transport_message is context.load(TransportMessage)
+        assert counter.total == 1
@@ -1,18 +1,23 @@
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 import time_machine
 
-from mersal.messages import LogicalMessage
+from mersal.messages import LogicalMessage, MessageTypeRegistry
 from mersal.messages.message_headers import MessageHeaders
-from mersal.pipeline import SetDefaultHeadersStep
+from mersal.pipeline import IsoTimestampClock, SetDefaultHeadersStep, TimeOrderedMessageIdGenerator
 from mersal.pipeline.outgoing_step_context import OutgoingStepContext
 from mersal.pipeline.send.destination_addresses import DestinationAddresses
 from mersal.testing.core.counter import Counter
+from mersal.testing.core.test_doubles import DummyMessage
 from mersal.transport import DefaultTransactionContext
 
-__all__ = ("TestSetDefaultHeadersStep",)
+__all__ = (
+    "TestIsoTimestampClock",
+    "TestSetDefaultHeadersStep",
+    "TestTimeOrderedMessageIdGenerator",
+)
 
 
 pytestmark = pytest.mark.anyio
@@ -109,3 +114,67 @@ class TestSetDefaultHeadersStep:
 
         assert message.headers.get("sent_time") == existing_time
         assert counter.total == 1
+
+    async def test_setting_message_type_header(self):
+        subject = SetDefaultHeadersStep()
+        message = LogicalMessage(body=DummyMessage(), headers=MessageHeaders())
+        context = OutgoingStepContext(
+            message=message,
+            transaction_context=DefaultTransactionContext(),
+            destination_addresses=DestinationAddresses({"moon"}),
+        )
+
+        await subject(context, Counter().task)
+
+        assert message.headers.message_type == MessageTypeRegistry.register(DummyMessage)
+        assert MessageTypeRegistry.resolve(message.headers.message_type) is DummyMessage
+
+
+class TestTimeOrderedMessageIdGenerator:
+    @time_machine.travel(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC), tick=False)
+    def test_generates_uuid7_ids_with_the_current_time(self):
+        subject = TimeOrderedMessageIdGenerator()
+
+        message_id = uuid.UUID(subject(LogicalMessage(body={}, headers=MessageHeaders())))
+
+        assert message_id.version == 7
+        assert message_id.variant == uuid.RFC_4122
+        assert message_id.int >> 80 == int(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC).timestamp() * 1000)
+
+    @time_machine.travel(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC), tick=False)
+    def test_ids_are_strictly_increasing_within_a_millisecond(self):
+        subject = TimeOrderedMessageIdGenerator()
+        message = LogicalMessage(body={}, headers=MessageHeaders())
+
+        ids = [subject(message) for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(i).version == 7 for i in ids)
+
+
+class TestIsoTimestampClock:
+    @pytest.mark.parametrize(
+        "now",
+        [
+            datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC),
+            datetime(2026, 2, 26, 12, 0, 0, 1, tzinfo=UTC),
+            datetime(2026, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+        ],
+    )
+    def test_matches_datetime_isoformat(self, now: datetime):
+        subject = IsoTimestampClock()
+
+        with time_machine.travel(now, tick=False):
+            assert subject() == datetime.now(UTC).isoformat()
+            assert subject() == now.isoformat()
+
+    def test_formats_the_next_second(self):
+        subject = IsoTimestampClock()
+        now = datetime(2026, 2, 26, 12, 0, 0, 5, tzinfo=UTC)
+
+        with time_machine.travel(now, tick=False):
+            subject()
+        later = now + timedelta(seconds=1)
+        with time_machine.travel(later, tick=False):
+            assert subject() == later.isoformat()
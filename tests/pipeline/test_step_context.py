@@ -0,0 +1,47 @@
+from mersal.messages import LogicalMessage, MessageHeaders, TransportMessage
+from mersal.pipeline import IncomingStepContext, OutgoingStepContext
+from mersal.pipeline.send.destination_addresses import DestinationAddresses
+from mersal.transport import DefaultTransactionContext, TransactionContext
+
+__all__ = ("TestStepContext",)
+
+
+class Item:
+    pass
+
+
+class TestStepContext:
+    def test_well_known_items_are_attributes(self):
+        transport_message = TransportMessage(b"", MessageHeaders())
+        transaction_context = DefaultTransactionContext()
+        subject = IncomingStepContext(transport_message, transaction_context)
+
+        assert subject.transport_message is transport_message
+        assert subject.load(TransportMessage) is transport_message
+        assert subject.load(TransactionContext) is transaction_context  # type: ignore[type-abstract]
+        assert subject.logical_message is None
+        assert subject.load(LogicalMessage) is None
+        assert transaction_context.items[IncomingStepContext.step_context_key] is subject
+        assert not hasattr(subject, "__dict__")
+
+    def test_save_and_attributes_stay_in_sync(self):
+        logical_message = LogicalMessage(body={}, headers=MessageHeaders())
+        destination_addresses = DestinationAddresses({"q"})
+        subject = OutgoingStepContext(logical_message, DefaultTransactionContext(), destination_addresses)
+
+        transport_message = TransportMessage(b"", MessageHeaders())
+        subject.save(transport_message)
+        assert subject.transport_message is transport_message
+
+        replacement = TransportMessage(b"1", MessageHeaders())
+        subject.transport_message = replacement
+        assert subject.load(TransportMessage) is replacement
+        assert subject.load(DestinationAddresses) is destination_addresses
+
+    def test_other_items_are_saved_by_type(self):
+        subject = IncomingStepContext(TransportMessage(b"", MessageHeaders()), DefaultTransactionContext())
+        item = Item()
+
+        assert subject.load(Item) is None
+        subject.save(item)
+        assert subject.load(Item) is item
@@ -0,0 +1,81 @@
+import os
+
+import anyio
+import anyio.lowlevel
+import pytest
+
+from mersal.exceptions import MersalExceptionError
+from mersal.process_pool import ProcessPoolHandlerExecutor
+
+__all__ = ("TestProcessPoolHandlerExecutor",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class HandlerError(Exception):
+    pass
+
+
+def get_pid(_: object) -> int:
+    return os.getpid()
+
+
+async def async_double(value: int) -> int:
+    await anyio.lowlevel.checkpoint()
+    return value * 2
+
+
+def fail(_: object) -> None:
+    raise HandlerError("failed")
+
+
+def sleep_and_return(value: float) -> float:
+    import time
+
+    time.sleep(value)
+    return value
+
+
+class TestProcessPoolHandlerExecutor:
+    @pytest.fixture
+    async def subject(self):
+        executor = ProcessPoolHandlerExecutor(max_workers=2, max_pending=2)
+        await executor.start()
+        yield executor
+        await executor.stop()
+
+    async def test_runs_in_another_process(self, subject: ProcessPoolHandlerExecutor):
+        assert await subject.run(get_pid, None) != os.getpid()
+
+    async def test_runs_async_callables(self, subject: ProcessPoolHandlerExecutor):
+        assert await subject.run(async_double, 2) == 4
+
+    async def test_propagates_exceptions(self, subject: ProcessPoolHandlerExecutor):
+        with pytest.raises(HandlerError):
+            await subject.run(fail, None)
+
+    async def test_limits_pending_invocations(self, subject: ProcessPoolHandlerExecutor):
+        max_pending = 0
+
+        async def run() -> None:
+            await subject.run(sleep_and_return, 0.2)
+
+        async def watch() -> None:
+            nonlocal max_pending
+            while True:
+                max_pending = max(max_pending, subject.pending)
+                await anyio.sleep(0.01)
+
+        async with anyio.create_task_group() as tg:
+            _ = tg.start_soon(watch)
+            async with anyio.create_task_group() as runners:
+                for _ in range(4):
+                    _ = runners.start_soon(run)
+            tg.cancel_scope.cancel()
+
+        assert max_pending == 2
+
+    async def test_raises_when_not_started(self):
+        with pytest.raises(MersalExceptionError):
+            await ProcessPoolHandlerExecutor().run(get_pid, None)
@@ -4,6 +4,7 @@ from typing import Any, Literal
 
 import pytest
 
+from mersal.exceptions import MessageDeferredError
 from mersal.logging.null_logger import NullLogger
 from mersal.messages import TransportMessage
 from mersal.pipeline.incoming_step_context import IncomingStepContext
@@ -199,6 +200,24 @@ class TestDefaultRetryStrategy:
         assertion_helper.assert_committed(True)
         assertion_helper.assert_ack(True)
 
+    async def test_deferred_message_is_nacked_without_registering_an_error(
+        self,
+        run_subject_process,
+        assert_message_in_error_queue,
+        message_id: uuid.UUID,
+        assertion_helper: TransactionContextAssertionHelper,
+        error_tracker: ErrorTrackerTestDouble,
+    ):
+        async def next_step():
+            raise MessageDeferredError()
+
+        await run_subject_process(next_step)
+
+        assert not await error_tracker.get_exceptions(message_id)
+        assert_message_in_error_queue(False)
+        assertion_helper.assert_committed(False)
+        assertion_helper.assert_ack(False)
+
     async def test_fail_fast_exceptions(
         self,
         run_subject_process,
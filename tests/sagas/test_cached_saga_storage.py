@@ -0,0 +1,148 @@
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from mersal.exceptions.base_exceptions import ConcurrencyExceptionError
+from mersal.persistence.in_memory import InMemorySagaStorage
+from mersal.sagas import CachedSagaStorage, CorrelationProperty, SagaData
+from mersal.transport import DefaultTransactionContext
+
+pytestmark = pytest.mark.anyio
+
+
+__all__ = (
+    "SagaDataForTest",
+    "SagaStorageSpy",
+    "TestCachedSagaStorage",
+)
+
+
+@dataclass
+class SagaDataForTest:
+    user_id: int
+
+
+class SagaStorageSpy(InMemorySagaStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    async def find_using_id(self, saga_data_type, message_id):
+        self.reads += 1
+        return await super().find_using_id(saga_data_type, message_id)
+
+    async def find(self, saga_data_type, property_name, property_value):
+        self.reads += 1
+        return await super().find(saga_data_type, property_name, property_value)
+
+
+CORRELATION_PROPERTIES = [
+    CorrelationProperty(
+        message_type=object,
+        saga_data_type=SagaDataForTest,
+        property_name="user_id",
+        value_extractor=lambda _: None,
+    )
+]
+
+
+async def _commit(transaction_context: DefaultTransactionContext) -> None:
+    transaction_context.set_result(commit=True, ack=True)
+    await transaction_context.complete()
+
+
+async def _insert(subject: CachedSagaStorage, user_id: int = 1) -> SagaData:
+    saga_data = SagaData(uuid.uuid4(), revision=0, data=SagaDataForTest(user_id))
+    transaction_context = DefaultTransactionContext()
+    await subject.insert(saga_data, CORRELATION_PROPERTIES, transaction_context)
+    await _commit(transaction_context)
+    return saga_data
+
+
+class TestCachedSagaStorage:
+    async def test_committed_writes_are_served_from_the_cache(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=10)
+        saga_data = await _insert(subject)
+
+        found = await subject.find(SagaDataForTest, "user_id", 1)
+        assert found == saga_data
+        assert found is not saga_data
+
+        found.data.user_id = 2
+        transaction_context = DefaultTransactionContext()
+        await subject.update(found, CORRELATION_PROPERTIES, transaction_context)
+        await _commit(transaction_context)
+
+        assert await subject.find(SagaDataForTest, "user_id", 2) == found
+        assert await subject.find_using_id(SagaDataForTest, saga_data.id) == found
+        assert storage.reads == 0
+
+    async def test_changed_correlation_value_is_not_served_from_the_cache(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=10)
+        saga_data = await _insert(subject)
+
+        saga_data.data.user_id = 2
+        transaction_context = DefaultTransactionContext()
+        await subject.update(saga_data, CORRELATION_PROPERTIES, transaction_context)
+        await _commit(transaction_context)
+
+        assert await subject.find(SagaDataForTest, "user_id", 1) is None
+        assert storage.reads == 1
+
+    async def test_rolled_back_writes_are_not_cached(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=10)
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=SagaDataForTest(1))
+        transaction_context = DefaultTransactionContext()
+        await subject.insert(saga_data, CORRELATION_PROPERTIES, transaction_context)
+        transaction_context.set_result(commit=False, ack=False)
+        await transaction_context.complete()
+
+        await subject.find(SagaDataForTest, "user_id", 1)
+        assert storage.reads == 1
+
+    async def test_concurrency_error_evicts_the_entry(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=10)
+        saga_data = await _insert(subject)
+        # changed behind the cache's back, e.g. by another process
+        await storage.update(
+            await storage.find_using_id(SagaDataForTest, saga_data.id), [], DefaultTransactionContext()
+        )
+        storage.reads = 0
+
+        stale = await subject.find(SagaDataForTest, "user_id", 1)
+        assert stale.revision == 0
+        with pytest.raises(ConcurrencyExceptionError):
+            await subject.update(stale, CORRELATION_PROPERTIES, DefaultTransactionContext())
+
+        fresh = await subject.find(SagaDataForTest, "user_id", 1)
+        assert fresh.revision == 1
+        assert storage.reads == 1
+
+    async def test_delete_evicts_the_entry(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=10)
+        saga_data = await _insert(subject)
+
+        await subject.delete(saga_data, DefaultTransactionContext())
+
+        assert await subject.find(SagaDataForTest, "user_id", 1) is None
+        assert storage.reads == 1
+
+    async def test_least_recently_used_entries_are_evicted(self):
+        storage = SagaStorageSpy()
+        subject = CachedSagaStorage(storage, max_size=2)
+        await _insert(subject, user_id=1)
+        await _insert(subject, user_id=2)
+        await subject.find(SagaDataForTest, "user_id", 1)
+        await _insert(subject, user_id=3)
+
+        await subject.find(SagaDataForTest, "user_id", 1)
+        await subject.find(SagaDataForTest, "user_id", 3)
+        assert storage.reads == 0
+        await subject.find(SagaDataForTest, "user_id", 2)
+        assert storage.reads == 1
@@ -5,10 +5,11 @@ from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Self
 
+import anyio
 import pytest
 from typing_extensions import override
 
-from mersal.messages import LogicalMessage
+from mersal.messages import BatchMessage, LogicalMessage
 from mersal.persistence.in_memory import (
     InMemorySagaStorage,
 )
@@ -27,6 +28,7 @@ from mersal.testing.core.test_doubles import (
     TransportMessageBuilder,
 )
 from mersal.transport import DefaultTransactionContext
+from mersal.utils import KeyedLock
 
 pytestmark = pytest.mark.anyio
 
@@ -163,6 +165,20 @@ class TestLoadSagaDataStep:
 
         assert counter.total == 1
 
+    async def test_is_never_skipped_for_message_types_handled_without_sagas(self, subject: LoadSagaDataStep):
+        message = LogicalMessageBuilder.build()
+        context = IncomingStepContext(
+            message=TransportMessageBuilder.build(),
+            transaction_context=DefaultTransactionContext(),
+        )
+        context.save(message)
+        context.save(HandlerInvokers(message=message, handler_invokers=[]))
+
+        assert subject.applies_to(message.body_type) is None
+        await subject(context, Counter().task)
+        assert subject.applies_to(message.body_type) is None
+        assert subject.applies_to(BatchMessage) is True
+
     async def test_sets_saga_data_on_new_saga_and_initiating_message(
         self, subject: LoadSagaDataStep, storage: InMemorySagaStorage
     ):
@@ -465,3 +481,151 @@ class TestLoadSagaDataStep:
         stored_data = storage._store.get(saga.data.id)
         assert stored_data
         assert stored_data.data.age != 100
+
+    @pytest.mark.parametrize("saga_lock", [None, KeyedLock()], ids=["unlocked", "locked"])
+    async def test_concurrent_messages_for_the_same_saga(
+        self,
+        correlation_error_handler: CorrelationTestHandlerTestDouble,
+        storage: InMemorySagaStorage,
+        saga_lock: KeyedLock | None,
+    ):
+        subject = LoadSagaDataStep(storage, correlation_error_handler, saga_lock=saga_lock)
+        existing_saga_data = SagaData(uuid.uuid4(), revision=0, data=MySagaData(user_id=10))
+        await storage.insert(
+            existing_saga_data,
+            correlation_properties=[],
+            transaction_context=DefaultTransactionContext(),
+        )
+        sagas: list[MySaga] = []
+
+        async def handle() -> None:
+            transaction_context = DefaultTransactionContext()
+            message = LogicalMessageBuilder.build(_bytes=Message1(user_id=10))
+            saga = MySaga()
+            sagas.append(saga)
+            invokers = HandlerInvokers(
+                message=message,
+                handler_invokers=[
+                    SagaHandlerInvoker(
+                        saga=saga,
+                        invoker=HandlerInvoker(action=saga, handler=saga, transaction_context=transaction_context),
+                    )
+                ],
+            )
+            context = IncomingStepContext(
+                message=TransportMessageBuilder.build(),
+                transaction_context=transaction_context,
+            )
+            context.save(message)
+            context.save(invokers)
+
+            async def action():
+                await anyio.sleep(0.01)
+
+            async with transaction_context:
+                await subject(context, CounterWithAction(action).task)
+                # Saves are only guaranteed to be written once the transaction commits.
+                await anyio.sleep(0.01)
+                transaction_context.set_result(commit=True, ack=True)
+                await transaction_context.complete()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(handle)
+            tg.start_soon(handle)
+
+        conflicts = sum(saga.resolved_conflict_call_count for saga in sagas)
+        assert conflicts == (0 if saga_lock else 1)
+        assert storage._store[existing_saga_data.id].revision == 2
+        if saga_lock:
+            assert saga_lock.locks_count == 0
+
+    async def test_saga_lock_is_held_until_the_transaction_closes(
+        self,
+        correlation_error_handler: CorrelationTestHandlerTestDouble,
+        storage: InMemorySagaStorage,
+    ):
+        saga_lock = KeyedLock()
+        subject = LoadSagaDataStep(storage, correlation_error_handler, saga_lock=saga_lock)
+        transaction_context = DefaultTransactionContext()
+        message = LogicalMessageBuilder.build(_bytes=Message1(user_id=10))
+        saga = MySaga()
+        invokers = HandlerInvokers(
+            message=message,
+            handler_invokers=[
+                SagaHandlerInvoker(
+                    saga=saga,
+                    invoker=HandlerInvoker(action=saga, handler=saga, transaction_context=transaction_context),
+                )
+            ],
+        )
+        context = IncomingStepContext(message=TransportMessageBuilder.build(), transaction_context=transaction_context)
+        context.save(message)
+        context.save(invokers)
+
+        async with transaction_context:
+            await subject(context, Counter().task)
+            assert saga_lock.locks_count == 1
+
+        assert saga_lock.locks_count == 0
+
+    @pytest.mark.parametrize(("change", "expected_revision"), [(False, 0), (True, 1)])
+    async def test_detects_unchanged_saga_data(
+        self,
+        correlation_error_handler: CorrelationTestHandlerTestDouble,
+        storage: InMemorySagaStorage,
+        change: bool,
+        expected_revision: int,
+    ):
+        subject = LoadSagaDataStep(storage, correlation_error_handler, detect_changes=True)
+        message = LogicalMessageBuilder.build(_bytes=Message1(user_id=10))
+        transaction_context = DefaultTransactionContext()
+        existing_saga_data = SagaData(uuid.uuid4(), revision=0, data=MySagaData(user_id=10, age=20))
+        await storage.insert(existing_saga_data, correlation_properties=[], transaction_context=transaction_context)
+        saga = MySaga()
+        invokers = HandlerInvokers(
+            message=message,
+            handler_invokers=[
+                SagaHandlerInvoker(
+                    saga=saga,
+                    invoker=HandlerInvoker(action=saga, handler=saga, transaction_context=transaction_context),
+                )
+            ],
+        )
+        context = IncomingStepContext(message=TransportMessageBuilder.build(), transaction_context=transaction_context)
+        context.save(message)
+        context.save(invokers)
+
+        def action():
+            saga.data.data.age = 21 if change else 20
+
+        await subject(context, CounterWithAction(action).task)
+
+        assert storage._store[existing_saga_data.id].revision == expected_revision
+
+    async def test_unpicklable_saga_data_is_always_updated(
+        self,
+        correlation_error_handler: CorrelationTestHandlerTestDouble,
+        storage: InMemorySagaStorage,
+    ):
+        subject = LoadSagaDataStep(storage, correlation_error_handler, detect_changes=True)
+        message = LogicalMessageBuilder.build(_bytes=Message1(user_id=10))
+        transaction_context = DefaultTransactionContext()
+        existing_saga_data = SagaData(uuid.uuid4(), revision=0, data=MySagaData(user_id=10, age=lambda: 20))
+        await storage.insert(existing_saga_data, correlation_properties=[], transaction_context=transaction_context)
+        saga = MySaga()
+        invokers = HandlerInvokers(
+            message=message,
+            handler_invokers=[
+                SagaHandlerInvoker(
+                    saga=saga,
+                    invoker=HandlerInvoker(action=saga, handler=saga, transaction_context=transaction_context),
+                )
+            ],
+        )
+        context = IncomingStepContext(message=TransportMessageBuilder.build(), transaction_context=transaction_context)
+        context.save(message)
+        context.save(invokers)
+
+        await subject(context, Counter().task)
+
+        assert storage._store[existing_saga_data.id].revision == 1
@@ -0,0 +1,78 @@
+import typing
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from mersal.sagas import SagaBase, SagaData, SagaMetadata
+from mersal.sagas.correlator import Correlator
+
+__all__ = (
+    "CountingSaga",
+    "Message1",
+    "Message2",
+    "SagaDataForTest",
+    "TestSagaMetadata",
+)
+
+
+@dataclass
+class Message1:
+    user_id: int = 100
+
+
+@dataclass
+class Message2:
+    age: int = 20
+
+
+@dataclass
+class SagaDataForTest:
+    user_id: int | None = None
+    age: int | None = None
+
+
+class CountingSaga(SagaBase[SagaDataForTest]):
+    initiating_message_types: typing.ClassVar = {Message1}
+    correlate_calls: typing.ClassVar[int] = 0
+
+    def correlate_messages(self, correlator: Correlator) -> None:
+        type(self).correlate_calls += 1
+        correlator.correlate(Message1, lambda mc: mc.message.body.user_id, "user_id")
+        correlator.correlate(Message2, lambda mc: mc.message.body.age, "age")
+        correlator.correlate(Message2, lambda mc: mc.message.body.age, "user_id")
+
+    def generate_new_data(self) -> SagaData[SagaDataForTest]:
+        return SagaData(uuid.uuid4(), revision=0, data=SagaDataForTest())
+
+
+class TestSagaMetadata:
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        SagaMetadata._cache.pop(CountingSaga, None)
+        CountingSaga.correlate_calls = 0
+
+    def test_is_computed_once_per_saga_class(self):
+        metadata = SagaMetadata.of(CountingSaga())
+
+        assert SagaMetadata.of(CountingSaga()) is metadata
+        assert CountingSaga.correlate_calls == 1
+
+    def test_correlation_properties_do_not_grow(self):
+        saga = CountingSaga()
+
+        for _ in range(3):
+            assert len(saga.correlation_properties) == 3
+        assert CountingSaga.correlate_calls == 1
+
+    def test_indexes_correlation_properties_by_message_type(self):
+        metadata = SagaMetadata.of(CountingSaga())
+
+        assert [p.property_name for p in metadata.correlation_properties_for(Message1)] == ["user_id"]
+        assert [p.property_name for p in metadata.correlation_properties_for(Message2)] == ["age", "user_id"]
+        assert metadata.correlation_properties_for(str) == ()
+
+    def test_freezes_initiating_message_types(self):
+        metadata = SagaMetadata.of(CountingSaga())
+
+        assert metadata.initiating_message_types == frozenset({Message1})
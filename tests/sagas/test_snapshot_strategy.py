@@ -0,0 +1,98 @@
+import uuid
+from dataclasses import dataclass, field
+
+import pytest
+
+from mersal.persistence.in_memory import InMemorySagaStorage
+from mersal.sagas import (
+    DataclassReplaceSnapshotStrategy,
+    DeepCopySnapshotStrategy,
+    PickleSnapshotStrategy,
+    SagaData,
+    SnapshotStrategy,
+)
+from mersal.transport import DefaultTransactionContext
+
+pytestmark = pytest.mark.anyio
+
+
+__all__ = (
+    "FlatSagaData",
+    "FrozenSagaData",
+    "NestedSagaData",
+    "TestSnapshotStrategies",
+)
+
+
+@dataclass
+class FlatSagaData:
+    user_id: int = 1
+    name: str = "a"
+
+
+@dataclass(frozen=True)
+class FrozenSagaData:
+    user_id: int = 1
+
+
+@dataclass
+class NestedSagaData:
+    items: list[int] = field(default_factory=lambda: [1, 2])
+
+
+STRATEGIES = [DeepCopySnapshotStrategy(), PickleSnapshotStrategy(), DataclassReplaceSnapshotStrategy()]
+
+
+class TestSnapshotStrategies:
+    @pytest.mark.parametrize("subject", STRATEGIES)
+    def test_snapshot_is_independent_of_the_original(self, subject: SnapshotStrategy):
+        saga_data = SagaData(uuid.uuid4(), revision=3, data=FlatSagaData())
+
+        snapshot = subject(saga_data)
+        snapshot.data.user_id = 2
+        snapshot.revision = 4
+
+        assert snapshot.id == saga_data.id
+        assert saga_data.revision == 3
+        assert saga_data.data == FlatSagaData()
+
+    @pytest.mark.parametrize("subject", [DeepCopySnapshotStrategy(), PickleSnapshotStrategy()])
+    def test_nested_data_is_copied(self, subject: SnapshotStrategy):
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=NestedSagaData())
+
+        subject(saga_data).data.items.append(3)
+
+        assert saga_data.data.items == [1, 2]
+
+    def test_dataclass_replace_shares_field_values(self):
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=NestedSagaData())
+
+        snapshot = DataclassReplaceSnapshotStrategy()(saga_data)
+
+        assert snapshot.data is not saga_data.data
+        assert snapshot.data.items is saga_data.data.items
+
+    def test_dataclass_replace_shares_frozen_data(self):
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=FrozenSagaData())
+
+        assert DataclassReplaceSnapshotStrategy()(saga_data).data is saga_data.data
+
+    def test_dataclass_replace_deep_copies_other_data(self):
+        saga_data = SagaData(uuid.uuid4(), revision=0, data={"items": [1]})
+
+        DataclassReplaceSnapshotStrategy()(saga_data).data["items"].append(2)
+
+        assert saga_data.data == {"items": [1]}
+
+    @pytest.mark.parametrize("subject", STRATEGIES)
+    async def test_in_memory_storage_uses_the_strategy(self, subject: SnapshotStrategy):
+        storage = InMemorySagaStorage(snapshot_strategy=subject)
+        saga_data = SagaData(uuid.uuid4(), revision=0, data=FlatSagaData())
+        await storage.insert(saga_data, [], DefaultTransactionContext())
+
+        saga_data.data.user_id = 2
+        found = await storage.find(FlatSagaData, "user_id", 1)
+        assert found is not None
+        found.data.user_id = 3
+
+        assert await storage.find(FlatSagaData, "user_id", 1) is not None
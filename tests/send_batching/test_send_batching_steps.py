@@ -0,0 +1,194 @@
+import pytest
+
+from mersal.messages import BatchMessage, LogicalMessage, MessageHeaders, MessageTypeRegistry, TransportMessage
+from mersal.pipeline import DestinationAddresses, IncomingStepContext, OutgoingStepContext
+from mersal.send_batching import (
+    SendBatchingIncomingStep,
+    SendBatchingOutgoingStep,
+)
+from mersal.testing.core.counter import Counter
+from mersal.testing.core.test_doubles import TransportMessageBuilder
+from mersal.transport import DefaultTransactionContext, decode_batch
+
+pytestmark = pytest.mark.anyio
+
+
+__all__ = (
+    "HandlerError",
+    "PipelineInvokerSpy",
+    "TestSendBatching",
+)
+
+
+class HandlerError(Exception):
+    pass
+
+
+class PipelineInvokerSpy:
+    def __init__(self) -> None:
+        self.contexts: list[OutgoingStepContext] = []
+
+    async def __call__(self, context: OutgoingStepContext) -> None:
+        self.contexts.append(context)
+        await SendBatchingOutgoingStep()(context, Counter().task)
+
+    @property
+    def sent(self) -> list[tuple[set[str], TransportMessage]]:
+        return [(c.load(DestinationAddresses).address, c.load(TransportMessage)) for c in self.contexts]
+
+
+def _bodies(transport_message: TransportMessage) -> object:
+    if transport_message.headers.get(BatchMessage.header_key) is None:
+        return transport_message.body
+    return [message.body for message in decode_batch(transport_message.body)]
+
+
+def _outgoing_context(
+    body: object,
+    transaction_context: DefaultTransactionContext,
+    addresses: set[str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> OutgoingStepContext:
+    message_headers = MessageHeaders(headers or {})
+    context = OutgoingStepContext(
+        message=LogicalMessage(body, message_headers),
+        transaction_context=transaction_context,
+        destination_addresses=DestinationAddresses(addresses if addresses is not None else {"queue"}),
+    )
+    context.save(TransportMessage(body=body, headers=message_headers))
+    return context
+
+
+class TestSendBatching:
+    async def _handle(
+        self,
+        sends: list[OutgoingStepContext],
+        invoker: PipelineInvokerSpy,
+        transaction_context: DefaultTransactionContext,
+        max_messages: int = 100,
+        max_bytes: int | None = None,
+        fail: bool = False,
+    ) -> Counter:
+        incoming_step = SendBatchingIncomingStep(lambda: invoker, max_messages=max_messages, max_bytes=max_bytes)
+        outgoing_step = SendBatchingOutgoingStep()
+        counter = Counter()
+
+        async def handlers() -> None:
+            for context in sends:
+                await outgoing_step(context, counter.task)
+            if fail:
+                raise HandlerError("failed")
+
+        context = IncomingStepContext(TransportMessageBuilder.build(), transaction_context)
+        await incoming_step(context, handlers)
+        return counter
+
+    async def test_messages_for_the_same_destination_are_sent_as_one_batch(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [
+            _outgoing_context(b"1", transaction_context, headers={"message_id": "1", "correlation_id": "c"}),
+            _outgoing_context(b"2", transaction_context, headers={"message_id": "2", "correlation_id": "c"}),
+        ]
+
+        counter = await self._handle(sends, invoker, transaction_context)
+
+        assert counter.total == 0
+        assert len(invoker.sent) == 1
+        addresses, transport_message = invoker.sent[0]
+        assert addresses == {"queue"}
+        assert isinstance(transport_message.body, bytes)
+        messages = decode_batch(transport_message.body)
+        assert [m.body for m in messages] == [b"1", b"2"]
+        assert [m.headers["message_id"] for m in messages] == ["1", "2"]
+        assert transport_message.headers[BatchMessage.header_key] == "2"
+        assert transport_message.headers["message_type"] == MessageTypeRegistry.register(BatchMessage)
+        assert transport_message.headers["correlation_id"] == "c"
+        assert "message_id" not in transport_message.headers
+        logical_message = invoker.contexts[0].load(LogicalMessage)
+        assert isinstance(logical_message.body, BatchMessage)
+        assert logical_message.headers is transport_message.headers
+
+    async def test_single_message_is_sent_as_is(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        context = _outgoing_context(b"1", transaction_context, headers={"message_id": "1"})
+
+        await self._handle([context], invoker, transaction_context)
+
+        assert len(invoker.sent) == 1
+        assert invoker.sent[0][1] is context.load(TransportMessage)
+
+    async def test_messages_are_batched_per_destination(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [
+            _outgoing_context(b"1", transaction_context, addresses={"a", "b"}),
+            _outgoing_context(b"2", transaction_context, addresses={"a"}),
+        ]
+
+        await self._handle(sends, invoker, transaction_context)
+
+        sent = {next(iter(addresses)): _bodies(message) for addresses, message in invoker.sent}
+        assert sent == {"a": [b"1", b"2"], "b": b"1"}
+
+    async def test_count_cap(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [_outgoing_context(str(i).encode(), transaction_context) for i in range(5)]
+
+        await self._handle(sends, invoker, transaction_context, max_messages=2)
+
+        assert [_bodies(message) for _, message in invoker.sent] == [[b"0", b"1"], [b"2", b"3"], b"4"]
+
+    async def test_byte_cap(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [_outgoing_context(b"a" * 4, transaction_context) for _ in range(5)]
+
+        await self._handle(sends, invoker, transaction_context, max_bytes=10)
+
+        assert [_bodies(message) for _, message in invoker.sent] == [[b"aaaa"] * 2, [b"aaaa"] * 2, b"aaaa"]
+
+    async def test_nothing_is_sent_when_handling_fails(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [_outgoing_context(b"1", transaction_context)]
+
+        with pytest.raises(HandlerError):
+            await self._handle(sends, invoker, transaction_context, fail=True)
+
+        assert invoker.sent == []
+
+    async def test_messages_that_can_not_be_framed_are_sent_one_by_one(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        sends = [_outgoing_context(object(), transaction_context) for _ in range(2)]
+
+        await self._handle(sends, invoker, transaction_context)
+
+        assert [message for _, message in invoker.sent] == [context.load(TransportMessage) for context in sends]
+
+    async def test_messages_outside_of_a_batching_transaction_continue(self):
+        subject = SendBatchingOutgoingStep()
+        counter = Counter()
+
+        await subject(_outgoing_context(b"1", DefaultTransactionContext()), counter.task)
+
+        assert counter.total == 1
+
+    async def test_batch_messages_continue(self):
+        invoker = PipelineInvokerSpy()
+        transaction_context = DefaultTransactionContext()
+        context = _outgoing_context(BatchMessage([1, 2]), transaction_context)
+        outgoing_step = SendBatchingOutgoingStep()
+        counter = Counter()
+
+        async def handlers() -> None:
+            await outgoing_step(context, counter.task)
+
+        incoming_step = SendBatchingIncomingStep(lambda: invoker, max_messages=100, max_bytes=None)
+        await incoming_step(IncomingStepContext(TransportMessageBuilder.build(), transaction_context), handlers)
+
+        assert counter.total == 1
+        assert invoker.sent == []
@@ -0,0 +1,122 @@
+import datetime
+import enum
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+
+import pytest
+
+from mersal.serialization.dataclass_serializer import DataclassSerializer
+
+__all__ = (
+    "Address",
+    "Customer",
+    "FlatMessage",
+    "Node",
+    "OrderPlaced",
+    "Status",
+    "TestDataclassSerializer",
+)
+
+
+class Status(enum.Enum):
+    PENDING = "pending"
+    SHIPPED = "shipped"
+
+
+@dataclass
+class FlatMessage:
+    name: str
+    count: int
+    ratio: float = 0.5
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+
+
+@dataclass
+class Customer:
+    id: uuid.UUID
+    addresses: list[Address]
+    primary_address: Address | None = None
+
+
+@dataclass
+class OrderPlaced:
+    order_id: uuid.UUID
+    placed_at: datetime.datetime
+    status: Status
+    customer: Customer
+    lines: dict[str, int]
+    delivery_dates: list[datetime.date]
+
+
+@dataclass
+class Node:
+    value: int
+    children: list["Node"] = field(default_factory=list)
+
+
+class TestDataclassSerializer:
+    def test_flat_output_matches_asdict(self):
+        message = FlatMessage("a", 1, tags=["x", "y"])
+        subject = DataclassSerializer({FlatMessage})
+
+        assert subject.serialize(message) == {"type": "FlatMessage", "data": asdict(message)}
+
+    def test_nested_output_matches_asdict(self):
+        message = Customer(uuid.uuid4(), [Address("1 Main St", "Springfield")])
+        subject = DataclassSerializer({Customer})
+
+        data = subject.serialize(message)
+
+        expected = asdict(message)
+        expected["id"] = str(message.id)
+        assert data == {"type": "Customer", "data": expected}
+
+    def test_round_trips_nested_dataclasses_enums_uuids_and_dates(self):
+        address = Address("1 Main St", "Springfield")
+        message = OrderPlaced(
+            order_id=uuid.uuid4(),
+            placed_at=datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC),
+            status=Status.SHIPPED,
+            customer=Customer(uuid.uuid4(), [address], primary_address=address),
+            lines={"sku-1": 2},
+            delivery_dates=[datetime.date(2024, 5, 3)],
+        )
+        subject = DataclassSerializer({OrderPlaced})
+
+        data = json.loads(json.dumps(subject.serialize(message)))
+
+        assert data["data"]["status"] == "shipped"
+        assert data["data"]["placed_at"] == "2024-05-01T12:30:00+00:00"
+        assert subject.deserialize(data) == message
+
+    def test_round_trips_self_referencing_dataclasses(self):
+        message = Node(1, [Node(2, [Node(3)]), Node(4)])
+        subject = DataclassSerializer({Node})
+
+        assert subject.deserialize(json.loads(json.dumps(subject.serialize(message)))) == message
+
+    def test_missing_fields_use_defaults(self):
+        subject = DataclassSerializer({FlatMessage})
+
+        message = subject.deserialize({"type": "FlatMessage", "data": {"name": "a", "count": 1}})
+
+        assert message == FlatMessage("a", 1)
+
+    def test_does_not_copy_primitive_fields(self):
+        message = FlatMessage("a", 1, tags=["x"])
+        subject = DataclassSerializer({FlatMessage})
+
+        assert subject.serialize(message)["data"]["tags"] is message.tags
+
+    def test_deserializing_unknown_type_raises(self):
+        subject = DataclassSerializer({FlatMessage})
+
+        with pytest.raises(KeyError):
+            subject.deserialize({"type": "Unknown", "data": {}})
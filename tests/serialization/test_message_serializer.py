@@ -0,0 +1,86 @@
+from typing import Any
+
+import pytest
+
+from mersal.messages import BatchMessage, LogicalMessage, MessageHeaders, TransportMessage
+from mersal.serialization import MessageSerializer
+from mersal.transport import encode_batch
+
+__all__ = (
+    "CountingSerializer",
+    "TestMessageSerializer",
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingSerializer:
+    def __init__(self) -> None:
+        self.deserialize_calls = 0
+
+    def serialize(self, obj: Any) -> Any:
+        return obj
+
+    def deserialize(self, data: Any) -> Any:
+        self.deserialize_calls += 1
+        return data
+
+
+class TestMessageSerializer:
+    async def test_defers_body_deserialization_until_accessed(self):
+        body_serializer = CountingSerializer()
+        subject = MessageSerializer(body_serializer)
+
+        message = await subject.deserialize(TransportMessage({"a": 1}, MessageHeaders()))
+
+        assert isinstance(message, LogicalMessage)
+        assert not message.is_body_loaded
+        assert body_serializer.deserialize_calls == 0
+
+        assert message.body == {"a": 1}
+        assert message.body == {"a": 1}
+        assert body_serializer.deserialize_calls == 1
+
+    async def test_body_type_comes_from_message_type_header(self):
+        body_serializer = CountingSerializer()
+        subject = MessageSerializer(body_serializer)
+
+        message = await subject.deserialize(TransportMessage({}, MessageHeaders({"message_type": "builtins:dict"})))
+
+        assert message.body_type is dict
+        assert body_serializer.deserialize_calls == 0
+
+    async def test_body_type_of_unknown_message_type_loads_body(self):
+        body_serializer = CountingSerializer()
+        subject = MessageSerializer(body_serializer)
+
+        message = await subject.deserialize(
+            TransportMessage([], MessageHeaders({"message_type": "not.imported.module:Message"}))
+        )
+
+        assert message.body_type is list
+        assert body_serializer.deserialize_calls == 1
+
+    async def test_batch_messages_are_deserialized_eagerly(self):
+        body_serializer = CountingSerializer()
+        subject = MessageSerializer(body_serializer)
+
+        body = encode_batch([TransportMessage(1, MessageHeaders()), TransportMessage(2, MessageHeaders())])
+        message = await subject.deserialize(TransportMessage(body, MessageHeaders({BatchMessage.header_key: "2"})))
+
+        assert message.is_body_loaded
+        assert message.body.messages == [1, 2]
+
+    async def test_batch_messages_round_trip_with_their_headers(self):
+        subject = MessageSerializer(CountingSerializer())
+        headers = MessageHeaders({"message_type": "envelope"})
+        batch = BatchMessage(["a", {"b": 1}], [MessageHeaders(message_id="1"), MessageHeaders(message_id="2")])
+
+        transport_message = await subject.serialize(LogicalMessage(batch, headers))
+        message = await subject.deserialize(transport_message)
+
+        assert isinstance(transport_message.body, bytes)
+        assert BatchMessage.header_key not in headers
+        assert message.body.messages == ["a", {"b": 1}]
+        assert [h.message_id for h in message.body.headers] == ["1", "2"]
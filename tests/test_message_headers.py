@@ -0,0 +1,67 @@
+import pickle
+import uuid
+
+from mersal.messages import LogicalMessage, MessageHeaders, TransportMessage
+
+__all__ = (
+    "TestMessageHeaders",
+    "TestMessageLabel",
+)
+
+
+class TestMessageHeaders:
+    def test_coerces_keys_and_values_to_strings(self):
+        message_id = uuid.uuid4()
+        headers = MessageHeaders({"message_id": message_id}, count=2)
+        headers[1] = 3.5
+        headers.update({"flag": True})
+        headers.setdefault("missing", 0)
+        headers |= {2: False}
+
+        assert headers == {
+            "message_id": str(message_id),
+            "count": "2",
+            "1": "3.5",
+            "flag": "True",
+            "missing": "0",
+            "2": "False",
+        }
+
+    def test_merged_headers_are_coerced(self):
+        merged = MessageHeaders({"a": "1"}) | {"b": 2}
+
+        assert type(merged) is MessageHeaders
+        assert merged == {"a": "1", "b": "2"}
+
+    def test_stores_well_known_keys_as_shared_strings(self):
+        key = b"message_id".decode()  # an equal string that is not the same object
+        headers = MessageHeaders({key: "1"})
+
+        (stored_key,) = headers
+        assert stored_key is MessageHeaders.message_id_key
+
+    def test_copies_are_message_headers(self):
+        headers = MessageHeaders({"a": 1})
+
+        for copy in (headers.copy(), MessageHeaders(headers), pickle.loads(pickle.dumps(headers))):
+            assert type(copy) is MessageHeaders
+            assert copy == headers
+            copy["b"] = 2
+            assert "b" not in headers
+
+
+class TestMessageLabel:
+    def test_label_is_cached_until_headers_change(self):
+        message = TransportMessage(b"", MessageHeaders({"message_type": "a:Message", "message_id": "1"}))
+
+        label = message.message_label
+        assert label == "a:Message/1"
+        assert message.message_label is label
+
+        message.headers["message_id"] = "2"
+        assert message.message_label == "a:Message/2"
+
+    def test_label_falls_back_to_body_type(self):
+        message = LogicalMessage(1, MessageHeaders({"message_id": "1"}))
+
+        assert message.message_label == "<class 'int'>/1"
@@ -7,7 +7,7 @@ from mersal.testing.core.transport.basic_transport_tests import (
     BasicTransportTest,
     TransportMaker,
 )
-from mersal.transport import DefaultTransactionContext
+from mersal.transport import BinaryWireFormat, DefaultTransactionContext
 from mersal.transport.file_system import FileSystemTransport, FileSystemTransportConfig
 
 __all__ = ("TestBasicTransportFunctionalityForFileSystemTransport",)
@@ -68,3 +68,30 @@ class TestBasicTransportFunctionalityForFileSystemTransport(BasicTransportTest):
         queue_dir = transport._base_directory / "remove-test"
         files = list(queue_dir.glob("*.json"))
         assert len(files) == 0
+
+    async def test_binary_wire_format_is_received_by_json_endpoint(self, tmp_path):
+        sender = FileSystemTransport(
+            FileSystemTransportConfig(
+                base_directory=tmp_path, input_queue_address="sender", wire_format=BinaryWireFormat()
+            )
+        )
+        receiver = FileSystemTransport(
+            FileSystemTransportConfig(base_directory=tmp_path, input_queue_address="receiver")
+        )
+        message = TransportMessageBuilder.build()
+
+        async with DefaultTransactionContext() as context:
+            await sender.send("receiver", message, context)
+            context.set_result(commit=True, ack=True)
+            await context.complete()
+
+        assert len(list((tmp_path / "receiver").glob("*.bin"))) == 1
+
+        async with DefaultTransactionContext() as context:
+            received = await receiver.receive(context)
+            context.set_result(commit=True, ack=True)
+            await context.complete()
+
+        assert received
+        assert received.body == message.body
+        assert dict(received.headers) == dict(message.headers)
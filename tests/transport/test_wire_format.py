@@ -0,0 +1,60 @@
+import uuid
+
+import pytest
+
+from mersal.exceptions import MersalExceptionError
+from mersal.messages import TransportMessage
+from mersal.messages.message_headers import MessageHeaders
+from mersal.transport import BinaryWireFormat, JsonWireFormat, WireFormat
+
+__all__ = ("TestWireFormats",)
+
+
+def _message(body: object) -> TransportMessage:
+    return TransportMessage(
+        body=body,
+        headers=MessageHeaders(
+            {
+                "message_id": str(uuid.uuid4()),
+                "sent_time": "2024-05-01T12:30:00+00:00",
+                "custom-header": "välue",
+            }
+        ),
+    )
+
+
+class TestWireFormats:
+    @pytest.mark.parametrize("wire_format", [JsonWireFormat(), BinaryWireFormat()], ids=lambda f: type(f).__name__)
+    @pytest.mark.parametrize(
+        "body",
+        [b"\x00\x01binary\xff", "text body ✓", {"a": [1, 2.5, None, "x"]}, [], ""],
+        ids=["bytes", "str", "json", "empty-list", "empty-str"],
+    )
+    def test_round_trip(self, wire_format: WireFormat, body: object):
+        message = _message(body)
+
+        decoded = wire_format.decode(wire_format.encode(message))
+
+        assert decoded.body == body
+        assert type(decoded.body) is type(body)
+        assert dict(decoded.headers) == dict(message.headers)
+
+    def test_binary_format_interns_common_header_keys(self):
+        message = _message(b"")
+
+        encoded = BinaryWireFormat().encode(message)
+
+        assert b"message_id" not in encoded
+        assert b"custom-header" in encoded
+
+    def test_binary_format_stores_bytes_body_raw(self):
+        body = bytes(range(256)) * 4
+
+        encoded = BinaryWireFormat().encode(TransportMessage(body=body, headers=MessageHeaders()))
+
+        assert encoded.endswith(body)
+        assert len(encoded) < len(JsonWireFormat().encode(TransportMessage(body=body, headers=MessageHeaders())))
+
+    def test_binary_format_rejects_other_data(self):
+        with pytest.raises(MersalExceptionError):
+            BinaryWireFormat().decode(JsonWireFormat().encode(_message("x")))
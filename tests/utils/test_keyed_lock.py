@@ -0,0 +1,85 @@
+import anyio
+import anyio.lowlevel
+import pytest
+
+from mersal.utils import KeyedLock
+
+__all__ = ("TestKeyedLock",)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class TestKeyedLock:
+    async def test_same_key_is_held_by_one_task_at_a_time(self):
+        subject = KeyedLock()
+        events: list[str] = []
+
+        async def work(name: str) -> None:
+            async with subject.lock("a"):
+                events.append(f"{name}-start")
+                await anyio.sleep(0.01)
+                events.append(f"{name}-end")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(work, "1")
+            tg.start_soon(work, "2")
+
+        assert events in (["1-start", "1-end", "2-start", "2-end"], ["2-start", "2-end", "1-start", "1-end"])
+
+    async def test_different_keys_do_not_block_each_other(self):
+        subject = KeyedLock()
+
+        async with subject.lock("a"):
+            with anyio.fail_after(1):
+                async with subject.lock("b"):
+                    pass
+
+    async def test_overlapping_keys_do_not_deadlock(self):
+        subject = KeyedLock()
+
+        async def work(*keys: str) -> None:
+            for _ in range(10):
+                async with subject.lock(*keys):
+                    await anyio.lowlevel.checkpoint()
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(work, "a", "b")
+                tg.start_soon(work, "b", "a")
+
+    async def test_locks_are_removed_once_released(self):
+        subject = KeyedLock()
+
+        async with subject.lock("a", "b", "a"):
+            assert subject.locks_count == 2
+
+        assert subject.locks_count == 0
+
+    async def test_locks_are_removed_when_cancelled_while_waiting(self):
+        subject = KeyedLock()
+
+        async def wait() -> None:
+            with anyio.move_on_after(0.01):
+                async with subject.lock("a"):
+                    pass
+
+        async with subject.lock("a"):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(wait)
+            assert subject.locks_count == 1
+
+        assert subject.locks_count == 0
+
+    async def test_lock_can_be_released_by_another_task(self):
+        subject = KeyedLock()
+        lock = subject.lock("a")
+        await lock.__aenter__()
+
+        async def release() -> None:
+            await lock.__aexit__(None, None, None)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(release)
+
+        assert subject.locks_count == 0
@@ -7,7 +7,7 @@ from anyio import sleep
 
 from mersal.activation import BuiltinHandlerActivator
 from mersal.core.app import Mersal
-from mersal.exceptions import MersalExceptionError
+from mersal.exceptions import MersalExceptionError, MessageDeferredError
 from mersal.logging.stdlib.logger import StdlibLogger
 from mersal.messages.message_headers import MessageHeaders
 from mersal.messages.transport_message import TransportMessage
@@ -43,6 +43,8 @@ from mersal.workers.anyio import AnyioWorker, AnyioWorkerFactory
 
 __all__ = (
     "BackoffStrategySpy",
+    "ConcurrencyLimitSpy",
+    "DeferringStep",
     "HappyStep",
     "TestAnyioWorker",
     "ThrowingStep",
@@ -59,6 +61,22 @@ class ThrowingStep(IncomingStep):
         raise MersalExceptionError()
 
 
+class DeferringStep(IncomingStep):
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.deferred: list[str] = []
+
+    async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable):
+        transaction_context: TransactionContext = context.load(TransactionContext)
+        message = context.load(TransportMessage)
+        if message.headers.get("defer") and str(message.headers.message_id) not in self.deferred:
+            self.deferred.append(str(message.headers.message_id))
+            transaction_context.items[MessageDeferredError.transaction_context_key] = self.delay
+            transaction_context.set_result(False, False)
+            return
+        transaction_context.set_result(True, True)
+
+
 class HappyStep(IncomingStep):
     async def __call__(self, context: IncomingStepContext, next_step: AsyncAnyCallable):
         transaction_context: TransactionContext = context.load(TransactionContext)
@@ -85,6 +103,19 @@ class BackoffStrategySpy:
         self.reset_event.set()
 
 
+class ConcurrencyLimitSpy:
+    def __init__(self, limits: list[int]) -> None:
+        self.limits = limits
+        self.samples: list[tuple[float, bool, int]] = []
+
+    @property
+    def limit(self) -> int:
+        return self.limits[min(len(self.samples), len(self.limits) - 1)]
+
+    def on_sample(self, latency: float, dropped: bool, in_flight: int) -> None:
+        self.samples.append((latency, dropped, in_flight))
+
+
 class VariableSpeedStep(IncomingStep):
     def __init__(self, results: list[str]) -> None:
         self.results = results
@@ -517,3 +548,126 @@ class TestAnyioWorker:
 
         assert age is not None
         assert age > 0.2
+
+    async def test_reports_samples_to_concurrency_limit(
+        self,
+        pipeline_invoker: RecursivePipelineInvoker,
+        incoming_pipeline: DefaultIncomingPipeline,
+    ):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        transport = InMemoryTransport(InMemoryTransportConfig(network, queue_address))
+        incoming_pipeline.append(ThrowingStep())
+        spy = ConcurrencyLimitSpy([1])
+        factory = AnyioWorkerFactory(transport, pipeline_invoker, logger=StdlibLogger(), concurrency_limit=spy)
+        subject = factory.create_worker("Worker-1")
+
+        network.deliver(queue_address, TransportMessageBuilder.build())
+        async with subject:
+            await sleep(0.1)
+
+        # The nacked message is redelivered, every attempt is a dropped sample.
+        assert spy.samples
+        for latency, dropped, in_flight in spy.samples:
+            assert latency >= 0
+            assert dropped
+            assert in_flight == 1
+
+    async def test_deferred_messages_are_not_reported_as_dropped(
+        self,
+        pipeline_invoker: RecursivePipelineInvoker,
+        incoming_pipeline: DefaultIncomingPipeline,
+    ):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        transport = InMemoryTransport(InMemoryTransportConfig(network, queue_address))
+        incoming_pipeline.append(DeferringStep())
+        spy = ConcurrencyLimitSpy([1])
+        factory = AnyioWorkerFactory(transport, pipeline_invoker, logger=StdlibLogger(), concurrency_limit=spy)
+        subject = factory.create_worker("Worker-1")
+
+        network.deliver(queue_address, _build_message_with_headers(defer=True))
+        async with subject:
+            await sleep(0.1)
+
+        assert len(spy.samples) == 2
+        assert not any(dropped for _, dropped, _ in spy.samples)
+
+    async def test_deferred_message_frees_its_slot_while_waiting_for_its_delay(
+        self,
+        pipeline_invoker: RecursivePipelineInvoker,
+        incoming_pipeline: DefaultIncomingPipeline,
+    ):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        transport = InMemoryTransport(InMemoryTransportConfig(network, queue_address))
+        step = DeferringStep(delay=0.3)
+        incoming_pipeline.append(step)
+        spy = ConcurrencyLimitSpy([1])
+        factory = AnyioWorkerFactory(transport, pipeline_invoker, logger=StdlibLogger(), concurrency_limit=spy)
+        subject = factory.create_worker("Worker-1")
+
+        network.deliver(queue_address, _build_message_with_headers(defer=True))
+        network.deliver(queue_address, _build_message_with_headers())
+        async with subject:
+            await sleep(0.1)
+            # The second message was handled while the first waits to be nacked.
+            assert len(spy.samples) == 2
+            await sleep(0.4)
+
+        assert len(spy.samples) == 3
+
+    async def test_deferred_messages_keep_their_slot_once_the_deferral_cap_is_reached(
+        self,
+        pipeline_invoker: RecursivePipelineInvoker,
+        incoming_pipeline: DefaultIncomingPipeline,
+    ):
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        transport = InMemoryTransport(InMemoryTransportConfig(network, queue_address))
+        step = DeferringStep(delay=0.3)
+        incoming_pipeline.append(step)
+        spy = ConcurrencyLimitSpy([1])
+        factory = AnyioWorkerFactory(
+            transport, pipeline_invoker, logger=StdlibLogger(), concurrency_limit=spy, max_deferred_messages=1
+        )
+        subject = factory.create_worker("Worker-1")
+
+        network.deliver(queue_address, _build_message_with_headers(defer=True))
+        network.deliver(queue_address, _build_message_with_headers(defer=True))
+        network.deliver(queue_address, _build_message_with_headers())
+        async with subject:
+            await sleep(0.1)
+            # The first message is parked, the second holds the only slot while it waits.
+            assert len(step.deferred) == 2
+            assert len(spy.samples) == 1
+            await sleep(0.6)
+
+        assert len(spy.samples) == 5
+
+    async def test_applies_updated_concurrency_limit(
+        self,
+        pipeline_invoker: RecursivePipelineInvoker,
+        incoming_pipeline: DefaultIncomingPipeline,
+    ):
+        results: list[str] = []
+        network = InMemoryNetwork()
+        queue_address = "test-queue"
+        transport = InMemoryTransport(InMemoryTransportConfig(network, queue_address))
+        incoming_pipeline.append(VariableSpeedStep(results))
+        spy = ConcurrencyLimitSpy([1, 2])
+        factory = AnyioWorkerFactory(transport, pipeline_invoker, logger=StdlibLogger(), concurrency_limit=spy)
+        subject = factory.create_worker("Worker-1")
+
+        network.deliver(queue_address, _build_message_with_headers(delay=0.05, label="first"))
+        network.deliver(queue_address, _build_message_with_headers(delay=0.3, label="slow"))
+        network.deliver(queue_address, _build_message_with_headers(delay=0.05, label="fast"))
+
+        async with subject:
+            assert subject.concurrency_limit == 1
+            await sleep(0.5)
+            assert subject.concurrency_limit == 2
+
+        # The limit was raised to two after the first message, letting the
+        # fast message overtake the slow one.
+        assert results == ["first", "fast", "slow"]
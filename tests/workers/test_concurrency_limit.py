@@ -0,0 +1,69 @@
+import pytest
+
+from mersal.workers import AIMDConcurrencyLimit, FixedConcurrencyLimit
+
+__all__ = (
+    "TestAIMDConcurrencyLimit",
+    "TestFixedConcurrencyLimit",
+)
+
+
+class TestFixedConcurrencyLimit:
+    def test_limit_does_not_change(self):
+        subject = FixedConcurrencyLimit(3)
+
+        subject.on_sample(latency=10, dropped=True, in_flight=3)
+
+        assert subject.limit == 3
+
+    def test_rejects_invalid_limit(self):
+        with pytest.raises(ValueError):
+            FixedConcurrencyLimit(0)
+
+
+class TestAIMDConcurrencyLimit:
+    def test_increases_additively_when_busy(self):
+        subject = AIMDConcurrencyLimit(initial_limit=2, max_limit=4)
+
+        subject.on_sample(latency=0.1, dropped=False, in_flight=2)
+        assert subject.limit == 3
+        subject.on_sample(latency=0.1, dropped=False, in_flight=2)
+        assert subject.limit == 4
+        subject.on_sample(latency=0.1, dropped=False, in_flight=4)
+        assert subject.limit == 4
+
+    def test_does_not_increase_when_mostly_idle(self):
+        subject = AIMDConcurrencyLimit(initial_limit=10)
+
+        subject.on_sample(latency=0.1, dropped=False, in_flight=4)
+
+        assert subject.limit == 10
+
+    def test_decreases_multiplicatively_on_drop(self):
+        subject = AIMDConcurrencyLimit(initial_limit=10, min_limit=4, backoff_ratio=0.5)
+
+        subject.on_sample(latency=0.1, dropped=True, in_flight=10)
+        assert subject.limit == 5
+        subject.on_sample(latency=0.1, dropped=True, in_flight=5)
+        assert subject.limit == 4
+
+    def test_decreases_on_slow_messages(self):
+        subject = AIMDConcurrencyLimit(initial_limit=10, backoff_ratio=0.5, latency_threshold=1)
+
+        subject.on_sample(latency=0.5, dropped=False, in_flight=10)
+        assert subject.limit == 11
+        subject.on_sample(latency=2, dropped=False, in_flight=10)
+        assert subject.limit == 5
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"initial_limit": 0, "min_limit": 0},
+            {"initial_limit": 1, "min_limit": 2},
+            {"initial_limit": 5, "max_limit": 4},
+            {"backoff_ratio": 1},
+        ],
+    )
+    def test_rejects_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            AIMDConcurrencyLimit(**kwargs)